@@ -0,0 +1,64 @@
+"""Compare ArrayDoublyLinkedList with the node based DoublyLinkedList.
+
+Measures memory per element, a steady state append/popleft churn with the number of garbage collections it triggers,
+and iteration over a large list.
+
+Run with:
+    python -m benchmarks.array_list
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+from graph_examples.linked_lists import ArrayDoublyLinkedList, DoublyLinkedList
+from benchmarks.common import best_time, print_table
+
+SIZE = 1_000_000
+CHURN = 1_000_000
+CLASSES = [DoublyLinkedList, ArrayDoublyLinkedList]
+
+
+def bytes_per_element(cls, size: int = SIZE) -> float:
+    values = [None] * size
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        li = cls(values)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del li
+    return (after - before) / size
+
+
+def churn(li, operations: int = CHURN) -> None:
+    append, popleft = li.append, li.popleft
+    for i in range(operations):
+        append(i)
+        popleft()
+
+
+def collections_during(func) -> int:
+    before = sum(generation['collections'] for generation in gc.get_stats())
+    func()
+    return sum(generation['collections'] for generation in gc.get_stats()) - before
+
+
+def main() -> None:
+    rows = []
+    for cls in CLASSES:
+        li = cls(range(SIZE))
+        rows.append([
+            cls.__name__,
+            bytes_per_element(cls),
+            best_time(lambda: churn(li), repeat=3),
+            collections_during(lambda: churn(li)),
+            best_time(lambda: sum(1 for _ in li), repeat=3),
+        ])
+    print_table(['class', 'bytes/element', f'churn {CHURN:,} (s)', 'gc collections', f'iterate {SIZE:,} (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""Time passing values between asyncio tasks, compared to asyncio.Queue, and count the wakeups it takes.
+
+Every case moves VALUES values through a queue bounded to MAXSIZE, with as many producer tasks as consumer tasks. The
+batched cases put BATCH values at a time and drain up to BATCH values per get: put_many and getleft_many for the
+linked queue, and put_nowait and get_nowait loops after one awaited put or get for asyncio.Queue.
+
+In trickle mode, producers yield to the event loop after every value, so consumers mostly wait for values.
+
+Wakeups are the callbacks the event loop schedules with call_soon, which is how a waiting task gets resumed. They are
+reported per value moved.
+
+Run with:
+    python -m benchmarks.async_queue
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from time import perf_counter
+
+from graph_examples.linked_lists import AsyncDoublyLinkedQueue
+from benchmarks.common import print_table
+
+VALUES = 100_000
+BATCH = 100
+MAXSIZE = 1_000
+STOP = -1
+TRICKLE = False
+
+
+class CountingEventLoop(asyncio.SelectorEventLoop):
+    """An event loop that counts the callbacks it schedules."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.callbacks = 0
+
+    def call_soon(self, *args, **kwargs):
+        self.callbacks += 1
+        return super().call_soon(*args, **kwargs)
+
+
+async def arrive() -> None:
+    """In trickle mode, yield to the event loop after producing a value, like values arriving from the network."""
+    if TRICKLE:
+        await asyncio.sleep(0)
+
+
+async def run_tasks(produce: Callable[[range], Awaitable[None]], consume: Callable[[], Awaitable[None]],
+                    stop: Callable[[], Awaitable[None]], tasks: int) -> None:
+    """Start tasks producers and consumers, then call stop once per consumer after the producers are done."""
+    share = VALUES // tasks
+    consumers = [asyncio.ensure_future(consume()) for _ in range(tasks)]
+    await asyncio.gather(*(produce(range(i * share, (i + 1) * share)) for i in range(tasks)))
+    for _ in consumers:
+        await stop()
+    await asyncio.gather(*consumers)
+
+
+async def queue_case(tasks: int) -> None:
+    q = asyncio.Queue(MAXSIZE)
+
+    async def produce(values: range) -> None:
+        for value in values:
+            await q.put(value)
+            await arrive()
+
+    async def consume() -> None:
+        while await q.get() != STOP:
+            pass
+
+    await run_tasks(produce, consume, lambda: q.put(STOP), tasks)
+
+
+async def batched_queue_case(tasks: int) -> None:
+    q = asyncio.Queue(MAXSIZE)
+
+    async def produce(values: range) -> None:
+        for value in values:
+            if q.full():
+                await q.put(value)
+            else:
+                q.put_nowait(value)
+            await arrive()
+
+    async def consume() -> None:
+        while True:
+            values = [await q.get()]
+            while len(values) < BATCH and not q.empty():
+                values.append(q.get_nowait())
+            if STOP in values:
+                for _ in range(values.count(STOP) - 1):  # Leave the other consumers' stop values
+                    q.put_nowait(STOP)
+                return
+
+    await run_tasks(produce, consume, lambda: q.put(STOP), tasks)
+
+
+async def linked_queue_case(tasks: int) -> None:
+    q = AsyncDoublyLinkedQueue(maxsize=MAXSIZE)
+
+    async def produce(values: range) -> None:
+        for value in values:
+            await q.put(value)
+            await arrive()
+
+    async def consume() -> None:
+        while await q.getleft() != STOP:
+            pass
+
+    await run_tasks(produce, consume, lambda: q.put(STOP), tasks)
+
+
+async def batched_linked_queue_case(tasks: int) -> None:
+    q = AsyncDoublyLinkedQueue(maxsize=MAXSIZE)
+
+    async def produce(values: range) -> None:
+        if TRICKLE:  # Values arrive one at a time, so only the consumers can batch
+            for value in values:
+                await q.put(value)
+                await arrive()
+        else:
+            for start in range(values.start, values.stop, BATCH):
+                await q.put_many(range(start, min(start + BATCH, values.stop)))
+
+    async def consume() -> None:
+        while True:
+            values = await q.getleft_many(BATCH)
+            if STOP in values:
+                q.put_many_nowait([STOP] * (values.count(STOP) - 1))  # Leave the other consumers' stop values
+                return
+
+    await run_tasks(produce, consume, lambda: q.put(STOP), tasks)
+
+
+def measure(case: Callable[[int], Awaitable[None]], tasks: int, repeat: int = 3) -> tuple[float, float]:
+    """Run a case repeat times, returning the best time and the wakeups per value of that run."""
+    best = (float('inf'), 0.0)
+    for _ in range(repeat):
+        loop = CountingEventLoop()
+        try:
+            start = perf_counter()
+            loop.run_until_complete(case(tasks))
+            elapsed = perf_counter() - start
+        finally:
+            loop.close()
+        best = min(best, (elapsed, loop.callbacks / VALUES))
+    return best
+
+
+def main() -> None:
+    global TRICKLE
+    cases = {
+        'asyncio.Queue': queue_case,
+        'asyncio.Queue batched': batched_queue_case,
+        'linked': linked_queue_case,
+        'linked batched': batched_linked_queue_case,
+    }
+    rows = []
+    for TRICKLE in [False, True]:
+        for tasks in [1, 4, 16]:
+            for name, case in cases.items():
+                rows.append(['trickle' if TRICKLE else 'burst', tasks, name, *measure(case, tasks)])
+    print_table(['mode', 'producers/consumers', 'queue', 'time (s)', 'wakeups per value'], rows)
+
+
+if __name__ == '__main__':
+    main()
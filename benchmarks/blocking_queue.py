@@ -0,0 +1,95 @@
+"""Time passing values between producer and consumer threads, compared to queue.Queue.
+
+Every case moves VALUES values through a queue bounded to MAXSIZE, with as many producers as consumers. The batched
+case uses append_many and popleft_many, which take the lock once per batch instead of once per value.
+
+Run with:
+    python -m benchmarks.blocking_queue
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from queue import Queue
+from threading import Thread
+
+from graph_examples.linked_lists import BlockingDoublyLinkedList
+from benchmarks.common import best_time, print_table
+
+VALUES = 100_000
+BATCH = 100
+MAXSIZE = 1_000
+STOP = -1
+
+
+def run_threads(produce: Callable[[range], None], consume: Callable[[], None], stop: Callable[[], None],
+                threads: int) -> None:
+    """Start threads producers and consumers, then call stop once per consumer after the producers are done."""
+    share = VALUES // threads
+    producers = [Thread(target=produce, args=(range(i * share, (i + 1) * share),)) for i in range(threads)]
+    consumers = [Thread(target=consume) for _ in range(threads)]
+    for thread in producers + consumers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        stop()
+    for thread in consumers:
+        thread.join()
+
+
+def queue_case(threads: int) -> None:
+    q = Queue(MAXSIZE)
+
+    def produce(values: range) -> None:
+        for value in values:
+            q.put(value)
+
+    def consume() -> None:
+        while q.get() != STOP:
+            pass
+
+    run_threads(produce, consume, lambda: q.put(STOP), threads)
+
+
+def list_case(threads: int) -> None:
+    li = BlockingDoublyLinkedList(maxsize=MAXSIZE)
+
+    def produce(values: range) -> None:
+        for value in values:
+            li.append(value, block=True)
+
+    def consume() -> None:
+        while li.popleft(block=True) != STOP:
+            pass
+
+    run_threads(produce, consume, lambda: li.append(STOP, block=True), threads)
+
+
+def batched_list_case(threads: int) -> None:
+    li = BlockingDoublyLinkedList(maxsize=MAXSIZE)
+
+    def produce(values: range) -> None:
+        for start in range(values.start, values.stop, BATCH):
+            li.append_many(range(start, min(start + BATCH, values.stop)), block=True)
+
+    def consume() -> None:
+        while True:
+            values = li.popleft_many(BATCH, block=True)
+            if STOP in values:
+                li.append_many([STOP] * (values.count(STOP) - 1))  # Leave the other consumers' stop values
+                return
+
+    run_threads(produce, consume, lambda: li.append(STOP, block=True), threads)
+
+
+def main() -> None:
+    rows = []
+    for threads in [1, 2, 4, 8]:
+        times = [best_time(lambda: case(threads), repeat=3) for case in [queue_case, list_case, batched_list_case]]
+        rows.append([threads, *times])
+    print_table(['producers/consumers', 'queue.Queue (s)', 'append/popleft (s)', f'batches of {BATCH} (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Time memoizing a function with LRUCache and LFUCache, compared to functools.lru_cache and an OrderedDict LRU.
+
+The keys follow a Zipf-like distribution, so a few keys are hot and most are rare, like a typical cache workload.
+Each case memoizes the same cheap function, so the times are mostly cache overhead.
+
+Run with:
+    python -m benchmarks.caches
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+from random import Random
+
+from graph_examples.linked_lists import LFUCache, LRUCache, memoize
+from benchmarks.common import best_time, print_table
+
+CALLS = 100_000
+KEYS = 10_000
+
+
+def zipf_keys(count: int, keys: int, seed: int = 0) -> list[int]:
+    random = Random(seed)
+    weights = [1 / (rank + 1) for rank in range(keys)]
+    return random.choices(range(keys), weights, k=count)
+
+
+def work(x: int) -> int:
+    return x * x
+
+
+def ordered_dict_lru(maxsize: int) -> Callable[[Callable[[int], int]], Callable[[int], int]]:
+    """The usual OrderedDict recipe for an LRU cache."""
+
+    def decorator(func: Callable[[int], int]) -> Callable[[int], int]:
+        cache: OrderedDict[int, int] = OrderedDict()
+
+        def wrapper(x: int) -> int:
+            try:
+                cache.move_to_end(x)
+                return cache[x]
+            except KeyError:
+                pass
+            result = cache[x] = func(x)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def main() -> None:
+    keys = zipf_keys(CALLS, KEYS)
+    rows = []
+    for maxsize in [100, 1_000]:
+        decorators = {
+            'functools.lru_cache': lru_cache(maxsize),
+            'OrderedDict': ordered_dict_lru(maxsize),
+            'LRUCache': memoize(LRUCache(maxsize)),
+            'LFUCache': memoize(LFUCache(maxsize)),
+        }
+        for name, decorator in decorators.items():
+            cached = decorator(work)
+            hit_rates = []
+
+            def run() -> None:
+                for key in keys:
+                    cached(key)
+
+            def setup() -> None:
+                if hasattr(cached, 'cache_clear'):
+                    cached.cache_clear()
+
+            seconds = best_time(run, repeat=3, setup=setup)
+            if hasattr(cached, 'cache_info'):
+                info = cached.cache_info()
+                hit_rates.append(info.hits / (info.hits + info.misses))
+            rows.append([maxsize, name, seconds / CALLS * 1e9, f'{hit_rates[0]:.1%}' if hit_rates else ''])
+    print_table(['maxsize', 'cache', 'ns per call', 'hit rate'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""Small helpers shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from timeit import Timer
+
+
+def best_time(func: Callable[[], object], number: int = 1, repeat: int = 5,
+              setup: Callable[[], object] = lambda: None) -> float:
+    """Time a callable.
+
+    Args:
+        func: The callable to time. Its return value is ignored.
+        number: How many times to call func per measurement.
+        repeat: How many measurements to take.
+        setup: Called before every measurement, outside of the timed section.
+
+    Returns:
+        The best time per call, in seconds.
+    """
+    timer = Timer(func)
+    best = float('inf')
+    for _ in range(repeat):
+        setup()
+        best = min(best, timer.timeit(number))
+    return best / number
+
+
+def print_table(headers: Sequence[str], rows: Iterable[Sequence[object]]) -> None:
+    """Print rows as left aligned columns."""
+    rows = [[f'{cell:.3g}' if isinstance(cell, float) else str(cell) for cell in row] for row in rows]
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows)]
+    for row in [list(headers), *rows]:
+        print('  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
@@ -0,0 +1,69 @@
+"""Time building chains of nodes and lists from values, compared to a chain of plain slotted objects.
+
+from_iterable and the list constructors make nodes without calling __init__, which only sets the slots. The rows with
+__init__ are subclasses that override it, so they take the path that calls it for every node, and pay for the extra
+call of the override too. The plain row links objects of a class with no base classes and an __init__ that sets
+three slots, which is about as fast as building a chain gets in Python.
+
+Run with:
+    python -m benchmarks.construction
+"""
+
+from __future__ import annotations
+
+from graph_examples.linked_lists import (
+    CircularDoublyLinkedList,
+    CircularDoublyLinkedNode,
+    CircularLinkedList,
+    CircularLinkedNode,
+    DoublyLinkedList,
+    DoublyLinkedNode,
+    LinkedList,
+    LinkedNode,
+)
+from benchmarks.common import best_time, print_table
+
+SIZE = 1_000_000
+
+
+class PlainNode:
+    __slots__ = ('value', 'next', 'last')
+
+    def __init__(self, value, next_=None, last=None) -> None:
+        self.value = value
+        self.next = next_
+        self.last = last
+
+
+def plain_chain(values: list[int]) -> PlainNode:
+    head = node = PlainNode(values[0])
+    for value in values[1:]:
+        next_node = PlainNode(value, None, node)
+        node.next = next_node
+        node = next_node
+    return head
+
+
+def with_init(cls: type) -> type:
+    """Make a subclass that overrides __init__, so nodes are made by calling it."""
+    def __init__(self, *args) -> None:
+        cls.__init__(self, *args)
+
+    return type(f'{cls.__name__}WithInit', (cls,), {'__slots__': (), '__init__': __init__})
+
+
+def main() -> None:
+    values = list(range(SIZE))
+    rows = [['plain slotted objects', best_time(lambda: plain_chain(values), repeat=3)]]
+    for cls in [LinkedNode, DoublyLinkedNode, CircularLinkedNode, CircularDoublyLinkedNode]:
+        rows.append([f'{cls.__name__}.from_iterable', best_time(lambda: cls.from_iterable(values), repeat=3)])
+        slow_cls = with_init(cls)
+        rows.append([f'{cls.__name__}.from_iterable, with __init__',
+                     best_time(lambda: slow_cls.from_iterable(values), repeat=3)])
+    for cls in [LinkedList, DoublyLinkedList, CircularLinkedList, CircularDoublyLinkedList]:
+        rows.append([f'{cls.__name__}()', best_time(lambda: cls(values), repeat=3)])
+    print_table(['construction', f'time for {SIZE:,} values (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Time removing values from the middle of a list by handle, compared to remove by value.
+
+remove searches from the head, so it's O(n) per value, unless the list is indexed. remove_node takes O(1).
+
+Run with:
+    python -m benchmarks.handles
+"""
+
+from __future__ import annotations
+
+from random import Random
+
+from graph_examples.linked_lists import CircularDoublyLinkedList, DoublyLinkedList
+from benchmarks.common import best_time, print_table
+
+SIZE = 100_000
+REMOVALS = 100
+
+
+def main() -> None:
+    order = list(range(SIZE))
+    Random(0).shuffle(order)
+    to_remove = order[:REMOVALS]
+    rows = []
+    for cls in [DoublyLinkedList, CircularDoublyLinkedList]:
+        state: dict = {}
+
+        def setup() -> None:
+            li = state['list'] = cls()
+            state['handles'] = [li.append_handle(value) for value in range(SIZE)]
+            state['indexed'] = cls(range(SIZE), indexed=True)
+
+        def by_handle() -> None:
+            li, handles = state['list'], state['handles']
+            for value in to_remove:
+                li.remove_node(handles[value])
+
+        def by_value() -> None:
+            li = state['list']
+            for value in to_remove:
+                li.remove(value)
+
+        def by_indexed_value() -> None:
+            li = state['indexed']
+            for value in to_remove:
+                li.remove(value)
+
+        for name, func in [('remove_node', by_handle), ('remove', by_value), ('remove, indexed', by_indexed_value)]:
+            rows.append([cls.__name__, name, best_time(func, setup=setup, repeat=3)])
+    print_table(['list', 'method', f'{REMOVALS:,} removals from {SIZE:,} values (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
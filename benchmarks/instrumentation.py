@@ -0,0 +1,39 @@
+"""Time a mix of list operations with instrumentation off, both before and after enabling it, and with it on.
+
+Off costs nothing because nothing is wrapped, and disabling puts back the original methods and links, so the two off
+rows should match.
+
+Run with:
+    python -m benchmarks.instrumentation
+"""
+
+from __future__ import annotations
+
+from graph_examples.linked_lists import DoublyLinkedList, instrumentation
+from benchmarks.common import best_time, print_table
+
+SIZE = 100_000
+
+
+def workload() -> None:
+    li = DoublyLinkedList(range(SIZE))
+    -1 in li
+    for _ in range(SIZE // 2):
+        li.appendleft(li.pop())
+    li.sort()
+
+
+def main() -> None:
+    rows = [['off', best_time(workload, repeat=3)]]
+    instrumentation.enable()
+    instrumentation.disable()
+    rows.append(['off, after enable() and disable()', best_time(workload, repeat=3)])
+    with instrumentation.instrumented():
+        rows.append(['counting', best_time(workload, repeat=3)])
+    with instrumentation.instrumented(timing=True):
+        rows.append(['counting and timing', best_time(workload, repeat=3)])
+    print_table(['instrumentation', f'workload on {SIZE:,} values (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
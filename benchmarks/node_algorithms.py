@@ -0,0 +1,46 @@
+"""Time the node level algorithms on chains of increasing length.
+
+The node methods used to recurse once per node, so chains over ~1000 nodes raised RecursionError and iteration built a
+nested generator chain that made it O(n^2). Flat ns/node columns across sizes show the iterative versions are O(n).
+
+Run with:
+    python -m benchmarks.node_algorithms
+"""
+
+from __future__ import annotations
+
+from graph_examples.linked_lists import (
+    CircularDoublyLinkedNode,
+    CircularLinkedNode,
+    DoublyLinkedNode,
+    LinkedNode,
+)
+from benchmarks.common import best_time, print_table
+
+SIZES = [10, 1_000, 100_000, 1_000_000]
+CLASSES = [LinkedNode, DoublyLinkedNode, CircularLinkedNode, CircularDoublyLinkedNode]
+
+
+def main() -> None:
+    rows = []
+    for cls in CLASSES:
+        for size in SIZES:
+            values = range(size)
+            repeat = 3 if size >= 100_000 else 5
+            node = cls.from_iterable(values)
+            timings = {
+                'from_iterable': best_time(lambda: cls.from_iterable(values), repeat=repeat),
+                'len': best_time(lambda: len(node), repeat=repeat),
+                'iter': best_time(lambda: sum(1 for _ in node), repeat=repeat),
+                'contains': best_time(lambda: -1 in node, repeat=repeat),
+            }
+            if hasattr(cls, '__reversed__'):
+                tail = node.tail
+                timings['reversed'] = best_time(lambda: sum(1 for _ in reversed(tail)), repeat=repeat)
+            for operation, seconds in timings.items():
+                rows.append([cls.__name__, size, operation, seconds, seconds / size * 1e9])
+    print_table(['class', 'size', 'operation', 'seconds', 'ns/node'], rows)
+
+
+if __name__ == '__main__':
+    main()
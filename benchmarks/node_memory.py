@@ -0,0 +1,43 @@
+"""Measure the memory used per node, excluding the values they hold.
+
+Run with:
+    python -m benchmarks.node_memory
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+
+from graph_examples.linked_lists import (
+    CircularDoublyLinkedNode,
+    CircularLinkedNode,
+    DoublyLinkedNode,
+    LinkedNode,
+)
+from benchmarks.common import print_table
+
+SIZE = 100_000
+CLASSES = [LinkedNode, DoublyLinkedNode, CircularLinkedNode, CircularDoublyLinkedNode]
+
+
+def traced_bytes_per_node(cls, size: int = SIZE) -> float:
+    """Allocate a chain of size nodes that all hold None, and return the bytes allocated per node."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        node = cls.from_iterable(None for _ in range(size))
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del node
+    return (after - before) / size
+
+
+def main() -> None:
+    rows = [[cls.__name__, sys.getsizeof(cls(None)), traced_bytes_per_node(cls)] for cls in CLASSES]
+    print_table(['class', 'getsizeof', 'traced bytes/node'], rows)
+
+
+if __name__ == '__main__':
+    main()
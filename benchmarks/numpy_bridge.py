@@ -0,0 +1,52 @@
+"""Time moving values between lists and NumPy arrays in bulk, compared to doing it a value at a time.
+
+from_numpy converts the array with tolist and builds the list in one pass, instead of appending NumPy scalars one by
+one. to_numpy with a dtype fills a preallocated array, instead of building a Python list first. apply_vectorized runs
+one ufunc over all the values and writes them back into the same nodes, instead of calling a Python function per
+value. Needs NumPy.
+
+Run with:
+    python -m benchmarks.numpy_bridge
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy
+
+from graph_examples.linked_lists import ArrayDoublyLinkedList, DoublyLinkedList, UnrolledLinkedList
+from benchmarks.common import best_time, print_table
+
+SIZE = 1_000_000
+
+
+def main() -> None:
+    array = numpy.arange(SIZE, dtype=numpy.float64)
+    rows = []
+    for cls in [DoublyLinkedList, ArrayDoublyLinkedList, UnrolledLinkedList]:
+        li = cls.from_numpy(array)
+
+        def append_each() -> None:
+            new = cls()
+            for value in array:
+                new.append(value)
+
+        def to_list_first() -> None:
+            numpy.array(list(li))
+
+        def apply_each() -> None:
+            cls(map(math.sqrt, li))
+
+        rows.append([cls.__name__, 'from_numpy', best_time(lambda: cls.from_numpy(array), repeat=3)])
+        rows.append([cls.__name__, 'append each value', best_time(append_each, repeat=3)])
+        rows.append([cls.__name__, "to_numpy('float64')", best_time(lambda: li.to_numpy('float64'), repeat=3)])
+        rows.append([cls.__name__, 'numpy.array(list(li))', best_time(to_list_first, repeat=3)])
+        rows.append([cls.__name__, 'apply_vectorized(numpy.sqrt)',
+                     best_time(lambda: li.apply_vectorized(numpy.sqrt, 'float64'), repeat=3)])
+        rows.append([cls.__name__, 'new list of math.sqrt', best_time(apply_each, repeat=3)])
+    print_table(['list', 'operation', f'time on {SIZE:,} values (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Time PersistentDoublyLinkedList as a queue, with and without sync, compared to DoublyLinkedList in memory.
+
+Run with:
+    python -m benchmarks.persistent
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from tempfile import TemporaryDirectory
+
+from graph_examples.linked_lists import DoublyLinkedList, PersistentDoublyLinkedList
+from benchmarks.common import best_time, print_table
+
+SIZE = 100_000
+VALUE = b'x' * 64
+
+
+def main() -> None:
+    rows = []
+    with TemporaryDirectory() as directory:
+        for name, sync in [('persistent', False), ('persistent, sync', True)]:
+            path = os.path.join(directory, name)
+            li = PersistentDoublyLinkedList(path, [VALUE] * SIZE)
+            li.sync = sync
+            number = 100 if sync else 10_000
+            rows.append([name, 'append+popleft', best_time(lambda: (li.append(VALUE), li.popleft()), number) * 1e6])
+            rows.append([name, 'iterate (bytes)', best_time(lambda: deque(li, 0), repeat=3) / SIZE * 1e6])
+            rows.append([name, 'iterate (views)', best_time(lambda: deque(li.views(), 0), repeat=3) / SIZE * 1e6])
+            li.close()
+    li = DoublyLinkedList([VALUE] * SIZE)
+    append_popleft = best_time(lambda: (li.append(VALUE), li.popleft()), 10_000)
+    rows.append(['DoublyLinkedList', 'append+popleft', append_popleft * 1e6])
+    rows.append(['DoublyLinkedList', 'iterate', best_time(lambda: deque(li, 0), repeat=3) / SIZE * 1e6])
+    print_table(['list', 'operation', 'µs per value'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Time queue churn on doubly linked lists with and without a NodePool, and count the nodes and GC collections.
+
+A producer appends a burst of values to a queue that already holds some, and a consumer pops them all, over and over.
+Without a pool every value gets a new node, and the nodes a burst allocates set off collections of the youngest
+generation of the garbage collector, which has to scan them. With a pool big enough for a burst, the nodes are
+allocated during the first burst and reused after that. A pool smaller than a burst still allocates most nodes, and is
+slower than no pool, as giving back and taking nodes costs more than it saves. timeit turns the garbage collector off,
+so the timed function turns it back on.
+
+Run with:
+    python -m benchmarks.pooling
+"""
+
+from __future__ import annotations
+
+import gc
+
+from graph_examples.linked_lists import (
+    CircularDoublyLinkedList,
+    CircularDoublyLinkedNode,
+    DoublyLinkedList,
+    DoublyLinkedNode,
+    NodePool,
+    instrumentation,
+)
+from benchmarks.common import best_time, print_table
+
+QUEUED = 10_000
+BURST = 1000
+BURSTS = 1000
+
+
+def churn(queue: DoublyLinkedList[int]) -> None:
+    gc.enable()
+    append, popleft = queue.append, queue.popleft
+    for _ in range(BURSTS):
+        for value in range(BURST):
+            append(value)
+        for _ in range(BURST):
+            popleft()
+
+
+def collections() -> int:
+    return sum(generation['collections'] for generation in gc.get_stats())
+
+
+def main() -> None:
+    rows = []
+    for cls, node_class in [(DoublyLinkedList, DoublyLinkedNode), (CircularDoublyLinkedList, CircularDoublyLinkedNode)]:
+        for pool_size in [None, BURST // 10, BURST]:
+            def make_queue() -> DoublyLinkedList[int]:
+                pool = None if pool_size is None else NodePool(node_class, pool_size)
+                return cls(range(QUEUED), pool=pool)
+
+            queue = make_queue()
+            with instrumentation.instrumented():
+                instrumentation.reset()
+                churn(queue)
+                allocations = instrumentation.snapshot().allocations.get(node_class.__name__, 0)
+            queue = make_queue()
+            before = collections()
+            churn(queue)
+            collected = collections() - before
+            seconds = best_time(lambda: churn(queue), repeat=3)
+            rows.append([cls.__name__, 'none' if pool_size is None else f'maxsize={pool_size}', allocations,
+                         collected, seconds])
+    print_table(['list', 'pool', 'nodes allocated', 'GC collections', 'time (s)'], rows)
+    print(f'{BURSTS:,} bursts of {BURST:,} appends and poplefts on a queue of {QUEUED:,} values')
+
+
+if __name__ == '__main__':
+    main()
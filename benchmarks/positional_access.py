@@ -0,0 +1,33 @@
+"""Time random positional reads with and without the skip index.
+
+Run with:
+    python -m benchmarks.positional_access
+"""
+
+from __future__ import annotations
+
+from random import Random
+
+from graph_examples.linked_lists import CircularDoublyLinkedList, DoublyLinkedList, LinkedList
+from benchmarks.common import best_time, print_table
+
+SIZES = [1_000, 10_000, 100_000]
+READS = 200
+
+
+def main() -> None:
+    rows = []
+    for size in SIZES:
+        positions = [Random(size).randrange(size) for _ in range(READS)]
+        values = list(range(size))
+        rows.append(['list', size, '', best_time(lambda: [values[i] for i in positions]) / READS * 1e6])
+        for cls in [LinkedList, DoublyLinkedList, CircularDoublyLinkedList]:
+            for skip_index in [False, True]:
+                li = cls(range(size), skip_index=skip_index)
+                seconds = best_time(lambda: [li[i] for i in positions], repeat=3)
+                rows.append([cls.__name__, size, skip_index, seconds / READS * 1e6])
+    print_table(['list', 'size', 'skip_index', 'us/read'], rows)
+
+
+if __name__ == '__main__':
+    main()
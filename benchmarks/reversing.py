@@ -0,0 +1,50 @@
+"""Time reversing long doubly linked lists, which flips a flag, compared to relinking every node.
+
+Relinking is what reverse did before it became O(1), and what sort, splice or split_at after a reverse still do
+once. The view and append rows show that neither a reversed view nor a reversed list slows down the operations that
+honor the reverse.
+
+Run with:
+    python -m benchmarks.reversing
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+from graph_examples.linked_lists import CircularDoublyLinkedList, DoublyLinkedList
+from benchmarks.common import best_time, print_table
+
+SIZE = 1_000_000
+REVERSES = 1000
+
+
+def main() -> None:
+    rows = []
+    for cls in [DoublyLinkedList, CircularDoublyLinkedList]:
+        li = cls(range(SIZE))
+
+        def reverse() -> None:
+            li.reverse()
+
+        def relink() -> None:
+            li._reverse_links()
+
+        def append_and_pop() -> None:
+            li.append(0)
+            li.pop()
+
+        rows.append([cls.__name__, 'reverse()', best_time(reverse, number=REVERSES)])
+        rows.append([cls.__name__, 'relink every node', best_time(relink, repeat=3)])
+        rows.append([cls.__name__, 'reversed_view()', best_time(li.reversed_view, number=REVERSES)])
+        for reversed_ in [False, True]:
+            if li._reversed != reversed_:
+                li.reverse()
+            state = 'reversed' if reversed_ else 'not reversed'
+            rows.append([cls.__name__, f'append + pop, {state}', best_time(append_and_pop, number=REVERSES)])
+            rows.append([cls.__name__, f'iterate, {state}', best_time(lambda: deque(li, 0), repeat=3)])
+    print_table(['list', 'operation', f'time on {SIZE:,} values (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Time RoundRobinScheduler over many tenants, compared to round robin on a deque.
+
+Each step selects a tenant, and every tenth step removes the selected tenant and adds a new one, like a tenant whose
+queue just emptied and another that just got work. The deque finds the tenant to remove with deque.remove, which is
+O(n).
+
+Run with:
+    python -m benchmarks.scheduler
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import count
+
+from graph_examples.linked_lists import RoundRobinScheduler
+from benchmarks.common import best_time, print_table
+
+TENANTS = 10_000
+STEPS = 100_000
+
+
+def scheduler_steps() -> None:
+    scheduler = RoundRobinScheduler()
+    for tenant in range(TENANTS):
+        scheduler.add(tenant, 1 + tenant % 3)
+    new_tenants = count(TENANTS)
+    for step in range(STEPS):
+        tenant = scheduler.select()
+        if step % 10 == 0:
+            scheduler.remove(tenant)
+            scheduler.add(next(new_tenants))
+
+
+def deque_steps() -> None:
+    tenants = deque(range(TENANTS))
+    new_tenants = count(TENANTS)
+    for step in range(STEPS):
+        tenant = tenants[0]
+        tenants.rotate(-1)
+        if step % 10 == 0:
+            tenants.remove(tenant)
+            tenants.append(next(new_tenants))
+
+
+def main() -> None:
+    rows = [
+        ['RoundRobinScheduler (weighted)', best_time(scheduler_steps, repeat=3)],
+        ['deque (unweighted)', best_time(deque_steps, repeat=3)],
+    ]
+    print_table(['scheduler', f'{STEPS:,} steps over {TENANTS:,} tenants (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
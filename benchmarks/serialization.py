@@ -0,0 +1,83 @@
+"""Compare the size and round trip time of pickling lists and nodes, write_values and pickling a plain list.
+
+The recursive case pickles a chain of nodes with the default reduction for __slots__ classes, which is what nodes did
+before they saved their chain as one flat list. It recurses once per node, so it only runs on a chain short enough to
+stay under the recursion limit.
+
+Run with:
+    python -m benchmarks.serialization
+"""
+
+from __future__ import annotations
+
+import pickle
+from collections.abc import Callable
+from io import BytesIO
+
+from graph_examples.linked_lists import (
+    CircularDoublyLinkedList,
+    DoublyLinkedList,
+    DoublyLinkedNode,
+    LinkedList,
+    LinkedNode,
+    read_values,
+    write_values,
+)
+from benchmarks.common import best_time, print_table
+
+SHORT = 200
+LONG = 1_000_000
+
+
+class RecursiveNode:
+    __slots__ = ('value', 'next')
+
+    def __init__(self, value, next_=None) -> None:
+        self.value = value
+        self.next = next_
+
+
+def recursive_chain(size: int) -> RecursiveNode:
+    head = None
+    for value in reversed(range(size)):
+        head = RecursiveNode(value, head)
+    return head
+
+
+def pickle_case(obj: object) -> tuple[int, Callable[[], object]]:
+    return len(pickle.dumps(obj)), lambda: pickle.loads(pickle.dumps(obj))
+
+
+def stream_case(obj: object) -> tuple[int, Callable[[], object]]:
+    def round_trip() -> LinkedList:
+        file = BytesIO()
+        write_values(obj, file)
+        file.seek(0)
+        return LinkedList(read_values(file))
+
+    file = BytesIO()
+    write_values(obj, file)
+    return len(file.getvalue()), round_trip
+
+
+def main() -> None:
+    rows = []
+    for size in [SHORT, LONG]:
+        cases = {
+            'list': pickle_case(list(range(size))),
+            'LinkedNode': pickle_case(LinkedNode.from_iterable(range(size))),
+            'DoublyLinkedNode': pickle_case(DoublyLinkedNode.from_iterable(range(size))),
+            'LinkedList': pickle_case(LinkedList(range(size))),
+            'DoublyLinkedList': pickle_case(DoublyLinkedList(range(size))),
+            'CircularDoublyLinkedList': pickle_case(CircularDoublyLinkedList(range(size))),
+            'write_values/read_values': stream_case(range(size)),
+        }
+        if size == SHORT:
+            cases['recursive nodes'] = pickle_case(recursive_chain(size))
+        for name, (size_in_bytes, round_trip) in cases.items():
+            rows.append([name, size, size_in_bytes / size, best_time(round_trip, repeat=3)])
+    print_table(['case', 'values', 'bytes per value', 'dump + load (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
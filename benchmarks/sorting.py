@@ -0,0 +1,56 @@
+"""Time sorting node lists in place, compared to sorting a copy of the values and rebuilding the list.
+
+Both are measured on shuffled values, for time and for the peak memory traced while sorting. The rebuild allocates a
+whole new chain of nodes while the old one is still alive, so its peak grows with the list, while sorting in place
+only relinks the nodes it has.
+
+Run with:
+    python -m benchmarks.sorting
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from collections.abc import Callable
+from random import Random
+
+from graph_examples.linked_lists import CircularDoublyLinkedList, CircularLinkedList, DoublyLinkedList, LinkedList
+from benchmarks.common import best_time, print_table
+
+SIZE = 100_000
+
+
+def traced_peak(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    values = list(range(SIZE))
+    Random(0).shuffle(values)
+    rows = []
+    for cls in [LinkedList, DoublyLinkedList, CircularLinkedList, CircularDoublyLinkedList]:
+        lists: list = []
+
+        def setup() -> None:
+            lists[:] = [cls(values)]
+
+        def in_place() -> None:
+            lists[0].sort()
+
+        def rebuild() -> None:
+            lists[0] = cls(sorted(list(lists[0])))
+
+        for name, func in [('sort()', in_place), ('sorted(list(...)) + rebuild', rebuild)]:
+            setup()
+            peak = traced_peak(func)
+            rows.append([cls.__name__, name, best_time(func, setup=setup, repeat=3), peak / SIZE])
+    print_table(['list', 'method', f'time for {SIZE:,} values (s)', 'peak bytes per value'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Time merging per-worker buffers by splicing, compared to copying their values.
+
+Run with:
+    python -m benchmarks.splicing
+"""
+
+from __future__ import annotations
+
+from graph_examples.linked_lists import CircularDoublyLinkedList, CircularLinkedList, DoublyLinkedList, LinkedList
+from benchmarks.common import best_time, print_table
+
+BUFFERS = 100
+BUFFER_SIZE = 10_000
+
+
+def main() -> None:
+    rows = []
+    for cls in [LinkedList, DoublyLinkedList, CircularLinkedList, CircularDoublyLinkedList]:
+        buffers: list = []
+
+        def make_buffers() -> None:
+            buffers[:] = [cls(range(BUFFER_SIZE)) for _ in range(BUFFERS)]
+
+        def splice() -> None:
+            merged = cls()
+            for buffer in buffers:
+                merged.extend(buffer)
+
+        def copy() -> None:
+            merged = cls()
+            for buffer in buffers:
+                merged.extend(iter(buffer))
+
+        rows.append([cls.__name__, best_time(splice, setup=make_buffers), best_time(copy, setup=make_buffers)])
+    print_table(['list', f'splice {BUFFERS} x {BUFFER_SIZE:,} (s)', 'copy values (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
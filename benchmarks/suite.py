@@ -0,0 +1,272 @@
+"""Statistical benchmark suite for the linked_lists package.
+
+Times construction, both ends, iteration, __contains__, reverse and __reversed__ for every concrete node and list
+class, with list and collections.deque as baselines. Each case is sampled repeat times. A sample calls the operation
+enough times to take at least min_time, so the reported numbers are seconds per call. Sizes go from 10 to 10^7, but a
+case is skipped once its extrapolated time per call goes over the budget, which keeps quadratic or huge cases out.
+
+Run the suite and save the results:
+    python -m benchmarks.suite run --output before.json
+
+Compare two runs, exiting with status 1 if anything regressed by more than the threshold:
+    python -m benchmarks.suite compare before.json after.json --threshold 0.1
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import re
+import sys
+from abc import ABC
+from argparse import ArgumentParser
+from collections import deque
+from collections.abc import Callable, Iterator
+from datetime import datetime, timezone
+from statistics import mean, median, stdev
+from time import perf_counter
+from typing import Any, Optional
+
+from graph_examples.linked_lists import (
+    BaseDoublyLinkedList,
+    BaseDoublyLinkedNode,
+    BaseLinearLinkedNode,
+    BaseLinkedList,
+    BaseLinkedNode,
+    PersistentDoublyLinkedList,
+)
+from benchmarks.common import print_table
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+MISSING = object()
+
+
+def concrete_subclasses(cls: type, *except_: type) -> list[type]:
+    seen = {cls, *except_}
+    queue = [cls]
+    concrete = []
+    while queue:
+        for subclass in sorted(set(queue.pop(0).__subclasses__()) - seen, key=lambda x: x.__name__):
+            seen.add(subclass)
+            queue.append(subclass)
+            if ABC not in subclass.__bases__:
+                concrete.append(subclass)
+    return concrete
+
+
+class Target:
+    """Something to benchmark, with a way to build it and a factory for each operation it supports.
+
+    Each operation factory takes a built instance and returns a callable that does one call's worth of work.
+    """
+
+    def __init__(self, name: str, build: Callable[[range], Any]) -> None:
+        self.name = name
+        self.build = build
+        self.operations: dict[str, Callable[[Any], Callable[[], object]]] = {}
+
+    def add(self, name: str, factory: Callable[[Any], Callable[[], object]]) -> None:
+        self.operations[name] = factory
+
+
+def list_target(name: str, cls: type) -> Target:
+    target = Target(name, cls)
+    target.add('construction', lambda li: lambda: cls(range(len(li))))
+    target.add('iteration', lambda li: lambda: deque(li, 0))
+    target.add('contains', lambda li: lambda: MISSING in li)
+    target.add('reverse', lambda li: li.reverse)
+    if cls is list:
+        target.add('append+pop', lambda li: lambda: (li.append(0), li.pop()))
+        target.add('appendleft+popleft', lambda li: lambda: (li.insert(0, 0), li.pop(0)))
+    else:
+        target.add('appendleft+popleft', lambda li: lambda: (li.appendleft(0), li.popleft()))
+    if cls in (list, deque) or issubclass(cls, BaseDoublyLinkedList):
+        target.add('reversed', lambda li: lambda: deque(reversed(li), 0))
+    if cls is deque or issubclass(cls, BaseDoublyLinkedList):
+        target.add('append+pop', lambda li: lambda: (li.append(0), li.pop()))
+    return target
+
+
+class NodeChain:
+    """Holds the current head of a node chain, or the tail for circular and doubly linked nodes, between calls."""
+
+    def __init__(self, cls: type, size: int) -> None:
+        self.cls = cls
+        self.size = size
+        self.node = cls.from_iterable(range(size))
+        self.end = self.node.tail if isinstance(self.node, BaseDoublyLinkedNode) else self.node
+
+    def appendleft_popleft(self) -> None:
+        self.node, _ = self.node.appendleft(0).popleft()
+
+    def append_pop(self) -> None:
+        self.end, _ = self.end.append(0).pop()
+
+    def reverse(self) -> None:
+        old_node = self.node
+        self.node = old_node.reverse()
+        self.end = old_node if isinstance(old_node, BaseLinearLinkedNode) else self.node
+
+
+def node_target(cls: type) -> Target:
+    target = Target(cls.__name__, lambda values: NodeChain(cls, len(values)))
+    target.add('construction', lambda chain: lambda: cls.from_iterable(range(chain.size)))
+    target.add('iteration', lambda chain: lambda: deque(chain.node, 0))
+    target.add('contains', lambda chain: lambda: MISSING in chain.node)
+    target.add('reverse', lambda chain: chain.reverse)
+    target.add('appendleft+popleft', lambda chain: chain.appendleft_popleft)
+    if issubclass(cls, BaseDoublyLinkedNode):
+        target.add('append+pop', lambda chain: chain.append_pop)
+        target.add('reversed', lambda chain: lambda: deque(reversed(chain.end), 0))
+    return target
+
+
+def all_targets() -> list[Target]:
+    targets = [list_target('list', list), list_target('deque', deque)]
+    targets += [node_target(cls) for cls in concrete_subclasses(BaseLinkedNode)]
+    # PersistentDoublyLinkedList needs a path and only holds bytes, so benchmarks.persistent times it instead.
+    lists = concrete_subclasses(BaseLinkedList, PersistentDoublyLinkedList)
+    targets += [list_target(cls.__name__, cls) for cls in lists]
+    return targets
+
+
+def sample(func: Callable[[], object], repeat: int, min_time: float) -> list[float]:
+    """Take repeat samples of the seconds per call, calibrating the calls per sample to take at least min_time."""
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed * 1.2) + 1))
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((perf_counter() - start) / number)
+    return samples
+
+
+def summarize(samples: list[float]) -> dict[str, Any]:
+    return {
+        'samples': samples,
+        'min': min(samples),
+        'median': median(samples),
+        'mean': mean(samples),
+        'stdev': stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def run(targets: list[Target], sizes: list[int], repeat: int, min_time: float, budget: float,
+        log: Callable[[str], None] = lambda message: None) -> Iterator[dict[str, Any]]:
+    """Run every operation of every target at every feasible size.
+
+    A case is skipped when its time per call, extrapolated linearly from the previous size, would exceed budget.
+    """
+    for target in targets:
+        previous: dict[str, tuple[int, float]] = {}
+        skipped: set[str] = set()
+
+        def too_slow(operation: str, size: int) -> bool:
+            if operation not in previous:
+                return False
+            last_size, last_time = previous[operation]
+            return last_time * size / last_size > budget
+
+        for size in sizes:
+            if too_slow('construction', size):
+                log(f'skipping {target.name} from size {size:,} on: too slow to build')
+                break
+            instance = target.build(range(size))
+            for operation, factory in target.operations.items():
+                if operation in skipped or too_slow(operation, size):
+                    skipped.add(operation)
+                    continue
+                result = summarize(sample(factory(instance), repeat, min_time))
+                previous[operation] = (size, result['median'])
+                log(f'{target.name} {operation} {size:,}: {result["median"]:.3g} s')
+                yield {'target': target.name, 'operation': operation, 'size': size, **result}
+            del instance
+
+
+def compare(base: list[dict[str, Any]], new: list[dict[str, Any]], threshold: float) -> list[dict[str, Any]]:
+    """Pair up cases present in both runs.
+
+    A case regressed when both its median and its minimum got slower by more than threshold, which keeps a single
+    noisy sample from flagging it. Improvements are the mirror image.
+    """
+    base_by_key = {(x['target'], x['operation'], x['size']): x for x in base}
+    rows = []
+    for result in new:
+        old = base_by_key.get((result['target'], result['operation'], result['size']))
+        if old is None:
+            continue
+        ratio = result['median'] / old['median']
+        min_ratio = result['min'] / old['min']
+        if ratio > 1 + threshold and min_ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold) and min_ratio < 1 / (1 + threshold):
+            status = 'improvement'
+        else:
+            status = ''
+        rows.append({**{key: result[key] for key in ('target', 'operation', 'size')},
+                     'base': old['median'], 'new': result['median'], 'ratio': ratio, 'status': status})
+    return rows
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = ArgumentParser(description='Benchmark the linked_lists package.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='run the benchmarks and save the results as JSON')
+    run_parser.add_argument('--output', '-o', default='benchmark.json')
+    run_parser.add_argument('--sizes', type=lambda x: [int(float(size)) for size in x.split(',')], default=SIZES,
+                            help='comma separated sizes, like 10,1e3,1e6')
+    run_parser.add_argument('--repeat', type=int, default=7, help='samples per case')
+    run_parser.add_argument('--min-time', type=float, default=0.02, help='minimum seconds per sample')
+    run_parser.add_argument('--budget', type=float, default=1.0, help='maximum estimated seconds per call')
+    run_parser.add_argument('--filter', '-k', default='', help='regex matched against "target operation"')
+    compare_parser = commands.add_parser('compare', help='compare two saved runs')
+    compare_parser.add_argument('base')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='relative slowdown to flag, like 0.1')
+    compare_parser.add_argument('--all', action='store_true', help='show unchanged cases too')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        pattern = re.compile(args.filter)
+        targets = all_targets()
+        for target in targets:
+            target.operations = {name: factory for name, factory in target.operations.items()
+                                 if pattern.search(f'{target.name} {name}')}
+        targets = [target for target in targets if target.operations]
+        results = list(run(targets, sorted(args.sizes), args.repeat, args.min_time, args.budget,
+                           lambda message: print(message, file=sys.stderr)))
+        metadata = {
+            'date': datetime.now(timezone.utc).isoformat(),
+            'python': sys.version,
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'min_time': args.min_time,
+        }
+        with open(args.output, 'w') as f:
+            json.dump({'metadata': metadata, 'results': results}, f, indent=1)
+        print_table(['target', 'operation', 'size', 'median (s)', 'stdev (s)'],
+                    [[x['target'], x['operation'], x['size'], x['median'], x['stdev']] for x in results])
+        return 0
+
+    with open(args.base) as f:
+        base = json.load(f)['results']
+    with open(args.new) as f:
+        new = json.load(f)['results']
+    rows = compare(base, new, args.threshold)
+    print_table(['target', 'operation', 'size', 'base (s)', 'new (s)', 'ratio', 'status'],
+                [list(row.values()) for row in rows if args.all or row['status']])
+    return 1 if any(row['status'] == 'regression' for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
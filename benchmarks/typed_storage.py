@@ -0,0 +1,69 @@
+"""Measure the memory of a million floats in TypedArrayDoublyLinkedList, compared to the lists that box each value.
+
+The timing rows run a queue through append and popleft churn, then compact it and export it. to_numpy copies straight
+from the typed array when the list is compact, and view exports it without copying at all.
+
+Run with:
+    python -m benchmarks.typed_storage
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+
+from graph_examples.linked_lists import (
+    ArrayDoublyLinkedList,
+    DoublyLinkedList,
+    TypedArrayDoublyLinkedList,
+    UnrolledLinkedList,
+)
+from benchmarks.common import best_time, print_table
+
+SIZE = 1_000_000
+CHURN = 100_000
+
+
+def allocated(func) -> int:
+    """Get the bytes allocated by func for what it returns, which is kept alive until they're measured."""
+    tracemalloc.start()
+    try:
+        values = func()
+        size = tracemalloc.get_traced_memory()[0]
+        del values
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    rows = []
+    for name, make in [
+        ('DoublyLinkedList', lambda: DoublyLinkedList(float(i) for i in range(SIZE))),
+        ('UnrolledLinkedList', lambda: UnrolledLinkedList(float(i) for i in range(SIZE))),
+        ('ArrayDoublyLinkedList', lambda: ArrayDoublyLinkedList(float(i) for i in range(SIZE))),
+        ("TypedArrayDoublyLinkedList('d')", lambda: TypedArrayDoublyLinkedList((float(i) for i in range(SIZE)), 'd')),
+    ]:
+        rows.append([name, round(allocated(make) / SIZE, 1)])
+    print_table(['list', f'bytes per value, for {SIZE:,} floats'], rows)
+    print()
+
+    rows = []
+    for cls, kwargs in [(ArrayDoublyLinkedList, {}), (TypedArrayDoublyLinkedList, {'typecode': 'd'})]:
+        li = cls(map(float, range(SIZE)), **kwargs)
+
+        def churn() -> None:
+            for _ in range(CHURN):
+                li.append(li.popleft())
+
+        rows.append([cls.__name__, f'{CHURN:,} x append(popleft())', best_time(churn, repeat=3)])
+        rows.append([cls.__name__, "to_numpy('float64')", best_time(lambda: li.to_numpy('float64'), repeat=3)])
+        if cls is TypedArrayDoublyLinkedList:
+            rows.append([cls.__name__, 'compact()', best_time(li.compact, setup=churn, repeat=3)])
+            rows.append([cls.__name__, "to_numpy('float64'), compact", best_time(lambda: li.to_numpy('float64'),
+                                                                                 repeat=3)])
+            rows.append([cls.__name__, 'view(), compact', best_time(lambda: li.view().release(), number=1000)])
+    print_table(['list', 'operation', f'time on {SIZE:,} values (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Compare UnrolledLinkedList at several block sizes with DoublyLinkedList and collections.deque.
+
+Run with:
+    python -m benchmarks.unrolled_list
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from functools import partial
+
+from graph_examples.linked_lists import DoublyLinkedList, UnrolledLinkedList
+from benchmarks.common import best_time, print_table
+
+SIZE = 1_000_000
+OPERATIONS = 200_000
+BLOCK_SIZES = [8, 32, 128, 512]
+
+
+def end_operations(li, operations: int = OPERATIONS) -> None:
+    append, appendleft, pop, popleft = li.append, li.appendleft, li.pop, li.popleft
+    for i in range(operations):
+        append(i)
+        appendleft(i)
+    for _ in range(operations):
+        pop()
+        popleft()
+
+
+def main() -> None:
+    factories = [('deque', deque), ('DoublyLinkedList', DoublyLinkedList)]
+    factories += [(f'UnrolledLinkedList({k})', partial(UnrolledLinkedList, block_size=k)) for k in BLOCK_SIZES]
+    rows = []
+    for name, factory in factories:
+        values = range(SIZE)
+        li = factory(values)
+        rows.append([
+            name,
+            best_time(lambda: factory(values), repeat=3),
+            best_time(lambda: end_operations(li), repeat=3),
+            best_time(lambda: sum(1 for _ in li), repeat=3),
+            best_time(lambda: -1 in li, repeat=3),
+        ])
+    print_table(['list', f'build {SIZE:,} (s)', f'{OPERATIONS * 4:,} end ops (s)',
+                 f'iterate {SIZE:,} (s)', f'contains miss {SIZE:,} (s)'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Measure what indexed=True costs in memory and saves in lookups.
+
+Run with:
+    python -m benchmarks.value_lookup
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+
+from graph_examples.linked_lists import CircularDoublyLinkedList, DoublyLinkedList, LinkedList
+from benchmarks.common import best_time, print_table
+
+SIZE = 100_000
+LOOKUPS = 100
+
+
+def traced_bytes(factory) -> tuple[object, int]:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = factory()
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def remove_and_restore(li, values) -> None:
+    for value in values:
+        li.remove(value)
+        li.appendleft(value)
+
+
+def main() -> None:
+    values = list(range(SIZE))
+    probes = values[SIZE // 2:SIZE // 2 + LOOKUPS]
+    rows = []
+    for cls in [LinkedList, DoublyLinkedList, CircularDoublyLinkedList]:
+        for indexed in [False, True]:
+            li, size = traced_bytes(lambda: cls(values, indexed=indexed))
+            rows.append([
+                cls.__name__,
+                indexed,
+                size / SIZE,
+                best_time(lambda: [value in li for value in probes], repeat=3) / LOOKUPS * 1e6,
+                best_time(lambda: [li.count(value) for value in probes], repeat=3) / LOOKUPS * 1e6,
+                best_time(lambda: remove_and_restore(li, probes), repeat=3) / LOOKUPS * 1e6,
+            ])
+    print_table(['list', 'indexed', 'bytes/element', 'contains (us)', 'count (us)', 'remove+appendleft (us)'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,14 @@
+from graph_examples.linked_lists.async_queue import AsyncDoublyLinkedQueue
 from graph_examples.linked_lists.base_lists import (
     BaseCircularLinkedList,
     BaseDoublyLinkedList,
+    BaseDoublyNodeLinkedList,
     BaseLinearLinkedList,
     BaseLinkedList,
+    BaseNodeLinkedList,
+    NodeHandle,
+    NodePool,
+    ReversedView,
 )
 from graph_examples.linked_lists.base_nodes import (
     BaseCircularLinkedNode,
@@ -10,15 +16,28 @@ from graph_examples.linked_lists.base_nodes import (
     BaseLinearLinkedNode,
     BaseLinkedNode,
 )
+from graph_examples.linked_lists.blocking import BlockingDoublyLinkedList
+from graph_examples.linked_lists.caches import BaseCache, CacheInfo, LFUCache, LRUCache, TooHeavyError, memoize
 from graph_examples.linked_lists.lists import (
+    ArrayDoublyLinkedList,
     CircularDoublyLinkedList,
     CircularLinkedList,
     DoublyLinkedList,
     LinkedList,
+    TypedArrayDoublyLinkedList,
+    UnrolledLinkedList,
 )
 from graph_examples.linked_lists.nodes import (
     CircularDoublyLinkedNode,
     CircularLinkedNode,
     DoublyLinkedNode,
+    FrozenLinkedNode,
+    LazyLinkedNode,
     LinkedNode,
 )
+from graph_examples.linked_lists.persistent import PersistentDoublyLinkedList
+from graph_examples.linked_lists.scheduler import RoundRobinScheduler
+from graph_examples.linked_lists.serialization import read_values, write_values
+
+# Imported last, so that enabling it from the environment finds every class
+from graph_examples.linked_lists import instrumentation  # noqa: E402
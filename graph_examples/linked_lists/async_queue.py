@@ -0,0 +1,194 @@
+"""An asyncio queue with deque semantics, for passing values between tasks."""
+
+from __future__ import annotations
+
+from asyncio import Future, QueueEmpty, QueueFull, get_running_loop
+from collections.abc import Iterable
+from typing import Generic, Optional
+
+from graph_examples.linked_lists.base_nodes import T
+from graph_examples.linked_lists.lists import DoublyLinkedList
+
+
+class _Waiters:
+    """Tasks waiting for values or for room, in the order they started waiting.
+
+    Each waiter says how much it can use once woken up: one value for get, a whole batch for getleft_many, or None for
+    everything available. promised is the total for waiters that were woken up but haven't run yet, so a wakeup is
+    only scheduled when there is more available than those waiters will take. A woken waiter that takes everything
+    isn't part of that total, and no more waiters are woken up until it has run.
+    """
+
+    def __init__(self) -> None:
+        self._waiting: DoublyLinkedList[tuple[Future[None], Optional[int]]] = DoublyLinkedList()
+        self.promised = 0
+        self._taking_all = 0
+
+    def __len__(self) -> int:
+        return len(self._waiting)
+
+    def wake(self, available: float) -> None:
+        while not self._taking_all and self.promised < available and self._waiting:
+            waiter, capacity = self._waiting.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._promise(capacity, 1)
+
+    def _promise(self, capacity: Optional[int], sign: int) -> None:
+        if capacity is None:
+            self._taking_all += sign
+        else:
+            self.promised += sign * capacity
+
+    async def wait(self, capacity: Optional[int]) -> None:
+        waiter = get_running_loop().create_future()
+        entry = (waiter, capacity)
+        self._waiting.append(entry)
+        try:
+            await waiter
+        except BaseException:
+            self._waiting.discard(entry)
+            raise
+        finally:
+            if waiter.done() and not waiter.cancelled():
+                self._promise(capacity, -1)
+
+
+class AsyncDoublyLinkedQueue(Generic[T]):
+    """A queue for asyncio tasks that can put and get at both ends, stored in a DoublyLinkedList.
+
+    The method names follow deque: put and get work on the right side, putleft and getleft on the left side. So put
+    with getleft is first in, first out, and put with get is last in, first out.
+
+    Tasks waiting to get or to put wait on a plain future, and a put or get only wakes up a waiting task when the tasks
+    it already woke up won't use everything there is. A task waiting in getleft_many counts for its whole batch, so
+    values put while it is waking up don't wake up more tasks.
+
+    Attributes:
+        maxsize: The most values the queue can hold. Zero or less means no limit.
+    """
+
+    def __init__(self, values: Iterable[T] = (), *, maxsize: int = 0) -> None:
+        self._values: DoublyLinkedList[T] = DoublyLinkedList(values)
+        if 0 < maxsize < len(self._values):
+            raise ValueError(f'{len(self._values)} values do not fit in maxsize {maxsize}')
+        self.maxsize = maxsize
+        self._getters = _Waiters()
+        self._putters = _Waiters()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({list(self._values)!r}, maxsize={self.maxsize})'
+
+    def qsize(self) -> int:
+        return len(self._values)
+
+    def empty(self) -> bool:
+        return not self._values
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._values)
+
+    def _added(self) -> None:
+        self._getters.wake(len(self._values))
+
+    def _removed(self) -> None:
+        if self.maxsize > 0:
+            self._putters.wake(self.maxsize - len(self._values))
+
+    async def _wait_for_values(self, capacity: Optional[int]) -> None:
+        try:
+            await self._getters.wait(capacity)
+        except BaseException:
+            self._added()  # If this task was woken up, let another one have what it would have taken
+            raise
+
+    async def _wait_for_room(self, capacity: int) -> None:
+        try:
+            await self._putters.wait(capacity)
+        except BaseException:
+            self._removed()
+            raise
+
+    def put_nowait(self, value: T) -> None:
+        if self.full():
+            raise QueueFull
+        self._values.append(value)
+        self._added()
+
+    def putleft_nowait(self, value: T) -> None:
+        if self.full():
+            raise QueueFull
+        self._values.appendleft(value)
+        self._added()
+
+    def put_many_nowait(self, values: Iterable[T]) -> None:
+        """Put values on the right side, or raise QueueFull before putting any if they don't all fit."""
+        values = DoublyLinkedList(values)
+        if 0 < self.maxsize < len(self._values) + len(values):
+            raise QueueFull
+        self._values.splice(values)
+        self._added()
+
+    def get_nowait(self) -> T:
+        if not self._values:
+            raise QueueEmpty
+        value = self._values.pop()
+        self._removed()
+        return value
+
+    def getleft_nowait(self) -> T:
+        if not self._values:
+            raise QueueEmpty
+        value = self._values.popleft()
+        self._removed()
+        return value
+
+    def getleft_many_nowait(self, max_count: Optional[int] = None) -> list[T]:
+        """Get up to max_count values from the left side, or all of them. Raises QueueEmpty if there are none."""
+        if not self._values:
+            raise QueueEmpty
+        count = len(self._values) if max_count is None else min(max_count, len(self._values))
+        popleft = self._values.popleft
+        values = [popleft() for _ in range(count)]
+        self._removed()
+        return values
+
+    async def put(self, value: T) -> None:
+        while self.full():
+            await self._wait_for_room(1)
+        self.put_nowait(value)
+
+    async def putleft(self, value: T) -> None:
+        while self.full():
+            await self._wait_for_room(1)
+        self.putleft_nowait(value)
+
+    async def put_many(self, values: Iterable[T]) -> None:
+        """Put values on the right side, as many at a time as fit, waiting for room for the rest."""
+        values = list(values)
+        start = 0
+        while start < len(values):
+            while self.full():
+                await self._wait_for_room(len(values) - start)
+            stop = len(values) if self.maxsize <= 0 else min(len(values), start + self.maxsize - len(self._values))
+            self.put_many_nowait(values[start:stop])
+            start = stop
+
+    async def get(self) -> T:
+        while not self._values:
+            await self._wait_for_values(1)
+        return self.get_nowait()
+
+    async def getleft(self) -> T:
+        while not self._values:
+            await self._wait_for_values(1)
+        return self.getleft_nowait()
+
+    async def getleft_many(self, max_count: Optional[int] = None) -> list[T]:
+        """Wait until there is at least one value, then get up to max_count values from the left side."""
+        while not self._values:
+            await self._wait_for_values(max_count)
+        return self.getleft_many_nowait(max_count)
@@ -1,13 +1,48 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Collection, Iterable, Reversible, Iterator
-from typing import Optional
+from collections.abc import Callable, Collection, Iterable, Reversible, Iterator
+from math import isqrt
+from operator import attrgetter, index as to_index
+from typing import TYPE_CHECKING, Any, Generic, Optional, Union
 
-from graph_examples.linked_lists.base_nodes import BaseLinearLinkedNode, BaseCircularLinkedNode, T
+from graph_examples.linked_lists.base_nodes import (
+    BaseCircularLinkedNode,
+    BaseDoublyLinkedNode,
+    BaseLinearLinkedNode,
+    BaseLinkedNode,
+    T,
+)
+
+try:
+    from sys import getrefcount
+except ImportError:  # Only CPython has it, and lists don't recycle nodes without it
+    getrefcount = None
+
+if TYPE_CHECKING:
+    import numpy
+
+
+def _import_numpy():
+    """Import NumPy, which only the NumPy methods of the lists need."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('NumPy is needed for this, and can be installed with pip install numpy') from None
+    return numpy
 
 
 class BaseLinkedList(ABC, Collection[T]):
+    """The Abstract Base Class for all linked lists.
+
+    Pickling or copying a list saves its values as one flat list along with the constructor's keyword arguments from
+    __getstate__, and loading calls __init__ with them, so neither recurses through the nodes. A shallow copy is a new
+    list with the same values.
+
+    from_numpy, to_numpy and apply_vectorized move values between lists and 1-D NumPy arrays in bulk. NumPy is
+    optional, and they raise ImportError without it. Values come out of arrays as Python scalars, like tolist gives.
+    """
+
     # noinspection PyUnusedLocal
     @abstractmethod
     def __init__(self, values: Iterable[T] = ()) -> None:
@@ -16,6 +51,57 @@ class BaseLinkedList(ABC, Collection[T]):
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({repr([x for x in self])})'
 
+    def __reduce__(self) -> tuple:
+        return self.__class__, (), self.__getstate__()
+
+    def __getstate__(self) -> dict[str, object]:
+        """Get the arguments to __init__ that make a list like this one."""
+        return {'values': list(self)}
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__init__(**state)
+
+    @classmethod
+    def from_numpy(cls, array: numpy.ndarray, **kwargs: Any) -> BaseLinkedList:
+        """Make a list of the values of a 1-D array, passing kwargs on to __init__.
+
+        Raises:
+            ValueError: If the array isn't 1-D.
+        """
+        array = _import_numpy().asarray(array)
+        if array.ndim != 1:
+            raise ValueError(f'expected a 1-D array, got {array.ndim}-D')
+        return cls(values=array.tolist(), **kwargs)
+
+    def to_numpy(self, dtype: Any = None) -> numpy.ndarray:
+        """Copy the values into a new 1-D array.
+
+        With a dtype, the array is allocated at the length of the list and filled in a single pass. Without one, NumPy
+        infers the dtype from a list of the values, like numpy.array does.
+        """
+        numpy = _import_numpy()
+        if dtype is None:
+            return numpy.array(list(self))
+        return numpy.fromiter(self, dtype, len(self))
+
+    def apply_vectorized(self, func: Callable[[numpy.ndarray], Any], dtype: Any = None) -> None:
+        """Replace the values with what func returns for an array of them, like a ufunc, in place.
+
+        The values are exported with to_numpy(dtype), and the values of the 1-D array func returns are written back in
+        one pass, in order, so nodes and handles stay valid.
+
+        Raises:
+            ValueError: If func doesn't return a 1-D array of the same length, which leaves the list as it was.
+        """
+        result = _import_numpy().asarray(func(self.to_numpy(dtype)))
+        if result.shape != (len(self),):
+            raise ValueError(f'func returned shape {result.shape} for {len(self)} values')
+        self._assign_values(result.tolist())
+
+    def _assign_values(self, values: list[T]) -> None:
+        """Replace the values in order, with a list of the same length, keeping the nodes."""
+        raise TypeError(f"{self.__class__.__name__} can't replace its values in place")
+
     @abstractmethod
     def appendleft(self, value: T) -> None:
         pass
@@ -42,20 +128,849 @@ class BaseDoublyLinkedList(BaseLinkedList[T], ABC, Reversible):
     def append(self, value: T) -> None:
         pass
 
+    def reversed_view(self) -> ReversedView[T]:
+        """Get a live view of this list in reverse, in O(1) without changing the list."""
+        return ReversedView(self)
 
-class BaseLinearLinkedList(BaseLinkedList, ABC):
-    head: Optional[BaseLinearLinkedNode[T]]
 
-    def __bool__(self) -> bool:
-        return self.head is not None
+class ReversedView(Collection[T], Reversible):
+    """A live view of a doubly linked list in reverse order.
+
+    The view holds no values of its own. Iterating and indexing it go over the list back to front, and the right side
+    of the view is the left side of the list, so append on the view appends to the left of the list, pop pops from the
+    left and so on. Changes through either one show in the other.
+    """
+
+    def __init__(self, values: BaseDoublyLinkedList[T]) -> None:
+        self._list = values
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({repr([x for x in self])})'
 
     def __len__(self) -> int:
-        length = 0
-        node = self.head
+        return len(self._list)
+
+    def __iter__(self) -> Iterator[T]:
+        return reversed(self._list)
+
+    def __reversed__(self) -> Iterator[T]:
+        return iter(self._list)
+
+    def __contains__(self, value: T) -> bool:
+        return value in self._list
+
+    def __getitem__(self, index: int) -> T:
+        return self._list[~to_index(index)]
+
+    def append(self, value: T) -> None:
+        self._list.appendleft(value)
+
+    def appendleft(self, value: T) -> None:
+        self._list.append(value)
+
+    def pop(self) -> T:
+        return self._list.popleft()
+
+    def popleft(self) -> T:
+        return self._list.pop()
+
+
+_SORT_RUN = 32  # The length of the runs that sort sorts with list.sort before merging them
+_node_key = attrgetter('value')
+
+
+def _keyed_node_key(node: BaseLinkedNode[T]) -> Any:
+    return node.value[0]
+
+
+class BaseNodeLinkedList(BaseLinkedList[T], ABC):
+    """The Abstract Base Class for lists made of linked nodes.
+
+    Positional access (indexing, slicing and insert) walks from the head, or from whichever end is nearer on doubly
+    linked lists. With skip_index set, the list also keeps a checkpoint node every √n positions, so random access
+    takes O(√n) steps. Appending and popping at the tail keep the checkpoints, while any change that moves other nodes
+    drops them. They are rebuilt in O(n) by the next positional access, or once the length has changed enough that
+    the spacing is off by more than a factor of 2.
+
+    Lists built with indexed=True keep a dict from each value to its nodes, in list order. That makes __contains__ and
+    count O(1), and remove O(1) on doubly linked lists (singly linked lists still need to find the node before). With
+    duplicates, removing a value costs O(occurrences). Every value must be hashable, and a value that isn't raises
+    TypeError before the list is changed. The index costs one dict entry and one small list per distinct value, which
+    is about 140 bytes per value on 64-bit CPython, on top of the nodes. Setting the value of a node directly
+    bypasses the index.
+
+    Subclasses must keep _size equal to the number of nodes through every mutation, call _tail_added or _tail_removed
+    after appending or popping at the tail, set _checkpoints to None whenever other nodes are added, removed or
+    reordered, and keep _index up to date when it isn't None. Doubly linked subclasses reverse in O(1) by setting
+    _reversed, and the checkpoints and index then follow the links rather than the order of the list.
+
+    Attributes:
+        skip_index: Whether positional access uses checkpoints.
+    """
+    head: Optional[BaseLinkedNode[T]]
+    _size: int
+    skip_index: bool = False
+    _checkpoints: Optional[list[BaseLinkedNode[T]]] = None
+    _checkpoint_step: int = 1
+    _index: Optional[dict[T, list[BaseLinkedNode[T]]]] = None
+    _reversed: bool = False  # Whether the order of the list is the reverse of its links
+    _epoch: int = 0  # Counts the changes that can move nodes out of the list without unlinking them one by one
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, BaseNodeLinkedList[T]]:
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._size))
+            if positions.step > 0:
+                return self._new_like(self._values_at(positions))
+            sliced = self._new_like()
+            for value in self._values_at(positions[::-1]):
+                sliced.appendleft(value)
+            return sliced
+        return self._node_at(self._normalize_index(index)).value
+
+    def __setitem__(self, index: Union[int, slice], value: Union[T, Iterable[T]]) -> None:
+        """Set the value at an index. Assigning to a slice replaces values in place, so it can't change the length."""
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._size))
+            values = list(value)
+            if len(values) != len(positions):
+                raise ValueError(f'attempt to assign sequence of size {len(values)} to slice of size {len(positions)}')
+            if positions.step < 0:
+                positions, values = positions[::-1], values[::-1]
+            for node, value in zip(self._nodes_at(positions), values):
+                self._set_value(node, value)
+        else:
+            self._set_value(self._node_at(self._normalize_index(index)), value)
+
+    def __getstate__(self) -> dict[str, object]:
+        return {**super().__getstate__(), 'skip_index': self.skip_index, 'indexed': self._index is not None}
+
+    def _assign_values(self, values: list[T]) -> None:
+        if not values:
+            return
+        if self._index is not None:
+            for value in values:
+                hash(value)
+        for node, value in zip(self._nodes_at(range(self._size)), values):
+            node.value = value
+        if self._index is not None:
+            self._build_index()
+
+    def _set_value(self, node: BaseLinkedNode[T], value: T) -> None:
+        if self._index is not None:
+            hash(value)
+            self._index_remove(node)
+            node.value = value
+            self._index_insert(node)
+        else:
+            node.value = value
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._size))
+            if positions:
+                self._remove_positions(positions if positions.step > 0 else positions[::-1])
+        else:
+            self._remove_at(self._normalize_index(index))
+
+    def _remove_positions(self, positions: range) -> None:
+        """Remove the nodes at an ascending, non-empty range of normalized positions, with a single walk.
+
+        Singly linked lists override this to walk with the node before, since _unlink has to search for it.
+        """
+        for node in list(self._nodes_at(positions)):
+            self._unlink(node)
+
+    @abstractmethod
+    def insert(self, index: int, value: T) -> None:
+        """Insert a value before index. Like list.insert, out of range indexes go to the nearest end."""
+
+    @abstractmethod
+    def _remove_at(self, index: int) -> T:
+        """Unlink the node at a normalized index and return its value."""
+
+    @abstractmethod
+    def _unlink(self, node: BaseLinkedNode[T]) -> T:
+        """Unlink a node of this list and return its value."""
+
+    def index(self, value: T, start: int = 0, stop: Optional[int] = None) -> int:
+        """Get the position of the first occurrence of value in O(n) time.
+
+        Indexed lists still have to count the position, but raise ValueError in O(1) when value is missing.
+        """
+        if self._index is None or value in self._index:
+            positions = range(*slice(start, stop).indices(self._size))
+            for position, node in zip(positions, self._nodes_at(positions)):
+                if node.value == value:
+                    return position
+        raise ValueError(f'{value!r} is not in list')
+
+    def count(self, value: T) -> int:
+        """Count the occurrences of value, in O(1) time for indexed lists and O(n) otherwise."""
+        if self._index is not None:
+            return len(self._index.get(value, ()))
+        return sum(1 for x in self if x == value)
+
+    def remove(self, value: T) -> None:
+        """Remove the first occurrence of value, or raise ValueError if it's missing."""
+        if self._index is None:
+            self._remove_at(self.index(value))
+            return
+        try:
+            node = self._index[value][-1 if self._reversed else 0]  # The index follows the links
+        except KeyError:
+            raise ValueError(f'{value!r} is not in list') from None
+        self._unlink(node)
+
+    def discard(self, value: T) -> None:
+        """Remove the first occurrence of value, if there is one."""
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+
+    def clear(self) -> None:
+        """Remove every value."""
+        self._size = 0
+        self._checkpoints = None
+        self._reversed = False
+        self._epoch += 1
+        if self._index is not None:
+            self._index = {}
+
+    def extend(self, values: Iterable[T]) -> None:
+        """Append values to the right side.
+
+        A list of the same class is spliced in, which moves its nodes instead of copying them and leaves it empty.
+        """
+        self.splice(values if type(values) is type(self) and values is not self else self.__class__(values))
+
+    def extendleft(self, values: Iterable[T]) -> None:
+        """Prepend values to the left side, keeping their order. Unlike deque.extendleft, they are not reversed.
+
+        A list of the same class is spliced in, which moves its nodes instead of copying them and leaves it empty.
+        """
+        self.splice(values if type(values) is type(self) and values is not self else self.__class__(values), 0)
+
+    def splice(self, other: BaseNodeLinkedList[T], at: Optional[int] = None) -> None:
+        """Move every node of other into this list, before position at, and leave other empty.
+
+        Relinking is O(1) at either end of doubly linked and circular lists, which have a tail pointer. Splicing into
+        the middle also walks to the position. LinkedList has to walk other to find its tail. Indexed lists also
+        index the moved nodes, in O(len(other)) at the end and by rebuilding the index anywhere else.
+
+        Args:
+            other: A list of the same class.
+            at: The position the first moved node ends up at. Defaults to the end, and clamps like insert.
+        """
+        if type(other) is not type(self):
+            raise TypeError(f'can only splice {type(self).__name__}, not {type(other).__name__}')
+        if other is self:
+            raise ValueError('cannot splice a list into itself')
+        at = self._size if at is None else self._clamp_index(at)
+        if not other:
+            return
+        self._orient()
+        other._orient()
+        appending = at == self._size
+        if self._index is not None and appending:
+            for node in other._nodes_at(range(other._size)):
+                self._index_add(node)
+        self._splice(other, at)
+        self._size += other._size
+        self._checkpoints = None
+        if self._index is not None and not appending:
+            self._build_index()
+        other.clear()
+
+    def sort(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        """Sort the values in place and stably, by relinking the nodes with a bottom-up merge sort.
+
+        Sorting takes O(n log n) time and allocates no nodes. With a key, each node's value is swapped for a (key,
+        value) tuple while sorting, which is one tuple per value, like the key array of list.sort. If the key or a
+        comparison raises, the list keeps all of its values, in some order, and the exception is raised.
+        """
+        if self._size < 2:
+            return
+        self._orient()
+        circular = isinstance(self, BaseCircularLinkedList)
+        head = self.head
+        if circular:
+            self.tail.next = None
+        decorated = 0
+        try:
+            if key is not None:
+                node = head
+                while node is not None:
+                    node.value = (key(node.value), node.value)
+                    decorated += 1
+                    node = node.next
+            head, tail, error = self._merge_sort(head, key is not None, reverse)
+        except BaseException:
+            if circular:  # Only the key can raise here, before any node moved
+                self.tail.next = head
+            raise
+        finally:
+            node = head
+            for _ in range(decorated):
+                node.value = node.value[1]
+                node = node.next
+        if isinstance(self, BaseDoublyLinkedList):
+            last_node = tail if circular else None
+            node = head
+            while node is not None:
+                node.last, last_node, node = last_node, node, node.next
+        if circular:
+            tail.next = head
+        else:
+            self.head = head
+        if circular or isinstance(self, BaseDoublyLinkedList):
+            self.tail = tail
+        self._checkpoints = None
+        if self._index is not None:
+            self._build_index()
+        if error is not None:
+            raise error
+
+    @staticmethod
+    def _merge_sort(head: BaseLinkedNode[T], keyed: bool,
+                    reverse: bool) -> tuple[BaseLinkedNode[T], BaseLinkedNode[T], Optional[BaseException]]:
+        """Sort a chain of nodes that ends with None by relinking next.
+
+        Runs of _SORT_RUN nodes are sorted with list.sort, which only needs a list of that many nodes at a time. The
+        sorted runs are merged like a binary counter: bins[i] holds a merge of 2**i runs, and each new run is merged
+        with the full bins below the first empty one. That merges the same runs as a bottom-up merge sort, but walks
+        the chain once instead of once per pass. If a comparison raises, every later run and merge just concatenates,
+        so the chain stays whole, and the exception is returned instead of raised.
+
+        Returns:
+            (head, tail, the exception from a comparison or None).
+        """
+        key = _keyed_node_key if keyed else _node_key
+        sentinel = type(head).__new__(type(head))  # The node before a merge's head, so linking never special cases it
+        error = None
+        bins: list[Optional[tuple[BaseLinkedNode[T], BaseLinkedNode[T]]]] = []
+        run = []
+        node = head
         while node is not None:
+            run.clear()
+            for _ in range(_SORT_RUN):
+                run.append(node)
+                node = node.next
+                if node is None:
+                    break
+            if error is None:
+                try:
+                    run.sort(key=key, reverse=reverse)
+                except BaseException as e:
+                    error = e
+            for run_node, next_node in zip(run, run[1:]):
+                run_node.next = next_node
+            run[-1].next = None
+            carry = run[0], run[-1]
+            for i, earlier in enumerate(bins):
+                if earlier is None:
+                    bins[i] = carry
+                    break
+                carry, error = BaseNodeLinkedList._merge(earlier, carry, sentinel, keyed, reverse, error)
+                bins[i] = None
+            else:
+                bins.append(carry)
+        merged = None
+        for earlier in bins:  # Later bins hold earlier runs
+            if earlier is not None:
+                if merged is None:
+                    merged = earlier
+                else:
+                    merged, error = BaseNodeLinkedList._merge(earlier, merged, sentinel, keyed, reverse, error)
+        return merged[0], merged[1], error
+
+    @staticmethod
+    def _merge(left_run: tuple[BaseLinkedNode[T], BaseLinkedNode[T]],
+               right_run: tuple[BaseLinkedNode[T], BaseLinkedNode[T]], sentinel: BaseLinkedNode[T], keyed: bool,
+               reverse: bool, error: Optional[BaseException]) -> tuple[tuple[BaseLinkedNode[T], BaseLinkedNode[T]],
+                                                                       Optional[BaseException]]:
+        """Merge two sorted runs, given as (head, tail), with the left one coming first in the list."""
+        left, left_end = left_run
+        right, right_end = right_run
+        tail = sentinel
+        left_key = left.value[0] if keyed else left.value
+        right_key = right.value[0] if keyed else right.value
+        while True:
+            try:
+                # Only taking right when it's strictly ahead keeps equal values in order
+                take_right = error is None and (left_key < right_key if reverse else right_key < left_key)
+            except BaseException as e:
+                error, take_right = e, False
+            if take_right:
+                tail.next = tail = right
+                right = right.next
+                if right is None:
+                    tail.next = left
+                    return (sentinel.next, left_end), error
+                right_key = right.value[0] if keyed else right.value
+            else:
+                tail.next = tail = left
+                left = left.next
+                if left is None:
+                    tail.next = right
+                    return (sentinel.next, right_end), error
+                left_key = left.value[0] if keyed else left.value
+
+    def split_at(self, index: int) -> BaseNodeLinkedList[T]:
+        """Split the list in two by relinking, in the time it takes to walk to index.
+
+        Args:
+            index: The position to split at. This list keeps the values before it. Clamps like insert.
+
+        Returns:
+            A new list of the same class with the values from index on.
+        """
+        index = self._clamp_index(index)
+        rest = self._new_like()
+        if index == self._size:
+            return rest
+        self._orient()
+        self._epoch += 1
+        if self._index is not None:
+            for node in reversed(list(self._nodes_at(range(index, self._size)))):
+                self._index_remove(node)
+        self._split(rest, index)
+        rest._size = self._size - index
+        self._size = index
+        self._checkpoints = None
+        if rest._index is not None:
+            rest._build_index()
+        return rest
+
+    def _new_like(self, values: Iterable[T] = ()) -> BaseNodeLinkedList[T]:
+        """Make a list of the same class with the same options."""
+        return self.__class__(values, skip_index=self.skip_index, indexed=self._index is not None)
+
+    @abstractmethod
+    def _splice(self, other: BaseNodeLinkedList[T], at: int) -> None:
+        """Link the nodes of other, which isn't empty, before a position in 0..len(self). Leaves counters alone."""
+
+    @abstractmethod
+    def _split(self, rest: BaseNodeLinkedList[T], index: int) -> None:
+        """Move the nodes from a position in 0..len(self)-1 on into the empty rest. Leaves counters alone."""
+
+    def _orient(self) -> None:
+        """Make the links go in the order of the list, before relinking nodes by position.
+
+        Only doubly linked lists reverse by setting _reversed, so the links of other lists are always in order.
+        """
+
+    def _build_index(self) -> None:
+        """Index the nodes in the order of the links, which is the reverse of the list's order while reversed."""
+        self._index = {}
+        node = self.head if self._size else None
+        for _ in range(self._size):
+            self._index.setdefault(node.value, []).append(node)
             node = node.next
-            length += 1
-        return length
+
+    def _index_add(self, node: BaseLinkedNode[T], left: bool = False) -> None:
+        """Add a node that is about to become the head (left) or the tail."""
+        nodes = self._index.setdefault(node.value, [])
+        if left:
+            nodes.insert(0, node)
+        else:
+            nodes.append(node)
+
+    def _index_insert(self, node: BaseLinkedNode[T]) -> None:
+        """Add a node linked anywhere in the list, keeping occurrences in list order.
+
+        A value without other occurrences is added in O(1). Otherwise, the node's place among them is found by walking
+        forward from the node to the next occurrence or the end, and at the same time backward to the previous
+        occurrence or the start. Singly linked lists walk from the head to the node instead of backward. The walks take
+        turns and stop as soon as either finds the place, so this takes O(occurrences) plus the distance to the nearest
+        of those, which is O(1) next to either end of the list.
+        """
+        nodes = self._index.get(node.value)
+        if nodes is None:
+            self._index[node.value] = [node]
+            return
+        backward = self._index_place_backward if isinstance(self, BaseDoublyLinkedList) else self._index_place_from_head
+        walks = [self._index_place_forward(node, nodes), backward(node, nodes)]
+        while True:
+            for walk in walks:
+                place = next(walk)
+                if place is not None:
+                    nodes.insert(place, node)
+                    return
+
+    def _index_place_forward(self, node: BaseLinkedNode[T], nodes: list[BaseLinkedNode[T]]) -> Iterator[Optional[int]]:
+        following = node.next
+        while following is not None and following is not self.head:
+            if following.value == node.value:
+                yield self._index_position(nodes, following)
+            yield None
+            following = following.next
+        yield len(nodes)
+
+    def _index_place_backward(self, node: BaseLinkedNode[T], nodes: list[BaseLinkedNode[T]]) -> Iterator[Optional[int]]:
+        head = self.head
+        preceding = node
+        while preceding is not head and preceding.last is not None:
+            preceding = preceding.last
+            if preceding.value == node.value:
+                yield self._index_position(nodes, preceding) + 1
+            yield None
+        yield 0
+
+    def _index_place_from_head(self, node: BaseLinkedNode[T],
+                               nodes: list[BaseLinkedNode[T]]) -> Iterator[Optional[int]]:
+        place = 0
+        preceding = self.head
+        while preceding is not node:
+            if preceding.value == node.value:
+                place += 1
+            yield None
+            preceding = preceding.next
+        yield place
+
+    @staticmethod
+    def _index_position(nodes: list[BaseLinkedNode[T]], node: BaseLinkedNode[T]) -> int:
+        for i, other in enumerate(nodes):
+            if other is node:
+                return i
+        raise ValueError('node is not in the index')
+
+    def _index_remove(self, node: BaseLinkedNode[T]) -> None:
+        nodes = self._index[node.value]
+        if nodes[-1] is node:
+            nodes.pop()
+        elif nodes[0] is node:
+            del nodes[0]
+        else:
+            nodes.remove(node)
+        if not nodes:
+            del self._index[node.value]
+
+    def _index_reverse(self) -> None:
+        for nodes in self._index.values():
+            nodes.reverse()
+
+    def _normalize_index(self, index: int) -> int:
+        index = to_index(index)
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('list index out of range')
+        return index
+
+    def _clamp_index(self, index: int) -> int:
+        index = to_index(index)
+        if index < 0:
+            return max(0, index + self._size)
+        return min(index, self._size)
+
+    def _node_at(self, index: int) -> BaseLinkedNode[T]:
+        """Get the node at a normalized index, 0 <= index < len(self)."""
+        if self._reversed:
+            index = self._size - 1 - index  # The position along the links, which the checkpoints follow too
+        if self.skip_index:
+            step = max(1, isqrt(self._size))
+            if self._checkpoints is None or not self._checkpoint_step // 2 <= step <= self._checkpoint_step * 2:
+                self._build_checkpoints(step)
+            checkpoint, steps = divmod(index, self._checkpoint_step)
+            node = self._checkpoints[checkpoint]
+        elif index > self._size // 2 and isinstance(self, BaseDoublyLinkedList):
+            node = self.tail
+            for _ in range(self._size - 1 - index):
+                node = node.last
+            return node
+        else:
+            node, steps = self.head, index
+        for _ in range(steps):
+            node = node.next
+        return node
+
+    def _build_checkpoints(self, step: int) -> None:
+        checkpoints = []
+        node = self.head
+        for i in range(self._size):
+            if i % step == 0:
+                checkpoints.append(node)
+            node = node.next
+        self._checkpoints, self._checkpoint_step = checkpoints, step
+
+    def _tail_added(self, node: BaseLinkedNode[T]) -> None:
+        """Keep the checkpoints after node was appended at the tail and counted in _size, which moved no other node."""
+        if self._checkpoints is not None and (self._size - 1) % self._checkpoint_step == 0:
+            self._checkpoints.append(node)
+
+    def _tail_removed(self) -> None:
+        """Keep the checkpoints after the tail was unlinked and uncounted from _size."""
+        if self._checkpoints is not None and self._size % self._checkpoint_step == 0:
+            self._checkpoints.pop()
+
+    def _nodes_at(self, positions: range) -> Iterator[BaseLinkedNode[T]]:
+        """Yield the nodes at an ascending range of normalized positions with a single walk."""
+        if not positions:
+            return
+        node = self._node_at(positions[0])
+        yield node
+        if self._reversed:
+            for _ in range(len(positions) - 1):
+                for _ in range(positions.step):
+                    node = node.last
+                yield node
+        else:
+            for _ in range(len(positions) - 1):
+                for _ in range(positions.step):
+                    node = node.next
+                yield node
+
+    def _values_at(self, positions: range) -> Iterator[T]:
+        return (node.value for node in self._nodes_at(positions))
+
+
+def _unshared_refcount() -> Optional[int]:
+    """Get what getrefcount returns for an object only a local variable refers to, or None without getrefcount."""
+    if getrefcount is None:
+        return None
+    node = object()
+    return getrefcount(node)
+
+
+# Lists with no live handles recycle a node they unlinked only where it's in a local variable, and nothing else refers
+# to it if getrefcount returns at most this. Not even an iterator, user code or the caller of _unlink.
+_UNSHARED = _unshared_refcount()
+
+
+class NodePool(Generic[T]):
+    """A free list of detached nodes of one class, for lists to reuse instead of allocating new ones.
+
+    A list given a pool takes the nodes for new values from it, and gives back the nodes of the values it pops. It gives
+    back none while any handle to it is alive, and only nodes that nothing else refers to, so a node behind a handle or
+    held by user code is never reused. Lists don't give nodes back at all where sys.getrefcount doesn't exist.
+    The pool clears the value of a node it takes back, so it doesn't keep values alive, and drops nodes beyond maxsize.
+    One pool can be shared by any number of lists of the same node class, like a per-process queue node cache. A pool
+    only pays off when maxsize covers how far the lists shrink and grow back, as a pool that's always empty when values
+    are added is slower than none.
+
+    Attributes:
+        node_class: The class of the nodes in the pool.
+        maxsize: The most free nodes the pool keeps.
+    """
+
+    def __init__(self, node_class: type[BaseDoublyLinkedNode], maxsize: int = 1024) -> None:
+        if maxsize < 0:
+            raise ValueError('maxsize must not be negative')
+        self.node_class = node_class
+        self.maxsize = maxsize
+        self._free: list[BaseDoublyLinkedNode[T]] = []
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.node_class.__name__}, maxsize={self.maxsize}, free={len(self._free)})'
+
+    def __len__(self) -> int:
+        """Get the number of free nodes."""
+        return len(self._free)
+
+    def acquire(self, value: T, next_: Optional[BaseDoublyLinkedNode[T]] = None,
+                last: Optional[BaseDoublyLinkedNode[T]] = None) -> BaseDoublyLinkedNode[T]:
+        """Get a free node, or a new one if there are none, set to value and links."""
+        try:
+            node = self._free.pop()
+        except IndexError:
+            return self.node_class(value, next_, last)
+        node.value, node.next, node.last = value, next_, last
+        return node
+
+    def release(self, node: BaseDoublyLinkedNode[T]) -> None:
+        """Give back a node that's in no list, and that nothing else will use."""
+        if len(self._free) < self.maxsize:
+            node.value = node.next = node.last = None
+            self._free.append(node)
+
+    def clear(self) -> None:
+        """Drop every free node."""
+        self._free.clear()
+
+
+class NodeHandle(Generic[T]):
+    """An opaque reference to the node of a value in a BaseDoublyNodeLinkedList.
+
+    A handle is valid while its node is in the list it came from. Removing the node, clear and split_at invalidate it,
+    and using it after that raises ValueError instead of corrupting the list. Checking takes O(1).
+    """
+    __slots__ = ('_node', '_list', '_epoch')
+
+    def __init__(self, node: BaseLinkedNode[T], values: BaseDoublyNodeLinkedList[T]) -> None:
+        self._node = node
+        self._list = values
+        self._epoch = values._epoch
+        values._live_handles.append(None)
+
+    def __del__(self) -> None:
+        self._list._live_handles.pop()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(value={self._node.value!r})'
+
+    @property
+    def value(self) -> T:
+        return self._node.value
+
+
+class BaseDoublyNodeLinkedList(BaseNodeLinkedList[T], BaseDoublyLinkedList[T], ABC):
+    """The Abstract Base Class for lists of doubly linked nodes, which can insert and remove at a node in O(1).
+
+    append_handle and appendleft_handle return a NodeHandle for the new node, which the other handle methods take to
+    work on it without searching. They honor reverse like the rest of the list, so after and end mean to the right.
+
+    Lists built with a NodePool take their nodes from it and give the nodes they pop back to it, which saves allocating
+    a node per value when values come and go all the time, like in a queue. Slices, split_at and the lists it makes
+    share the pool, while copies and unpickled lists don't have one.
+
+    Subclasses must set the links of a node they unlink to None, and implement _linked to tell a linked node apart in
+    O(1). Changes that move nodes out of the list otherwise must increase _epoch. They reverse by flipping _reversed,
+    and implement _reverse_links for when the links have to match the order again. A subclass that pops a node should
+    release it to the pool only when _recycling is set, _live_handles is empty, and the node is only in a local variable
+    and getrefcount of it is at most _UNSHARED.
+
+    Attributes:
+        pool: The NodePool the list gets its nodes from and gives them back to, or None to allocate every node.
+    """
+    _node_class: type
+    pool: Optional[NodePool[T]] = None
+    _recycling = False  # Whether popped nodes can go back to the pool
+    # One item per live NodeHandle. Handles can be dropped on any thread, so they're counted with atomic list methods
+    _live_handles: list[None]
+
+    def _set_pool(self, pool: Optional[NodePool[T]]) -> None:
+        if pool is not None and pool.node_class is not self._node_class:
+            raise ValueError(f'a {self.__class__.__name__} needs a pool of {self._node_class.__name__}, '
+                             f'not {pool.node_class.__name__}')
+        self.pool = pool
+        self._recycling = pool is not None and _UNSHARED is not None
+        self._live_handles = []
+
+    def _new_node(self, value: T) -> BaseDoublyLinkedNode[T]:
+        return self._node_class(value) if self.pool is None else self.pool.acquire(value)
+
+    def _new_like(self, values: Iterable[T] = ()) -> BaseDoublyNodeLinkedList[T]:
+        return self.__class__(values, skip_index=self.skip_index, indexed=self._index is not None, pool=self.pool)
+
+    def append_handle(self, value: T) -> NodeHandle[T]:
+        """Append a value and get a handle to its node."""
+        node = self._new_node(value)
+        if self._reversed:
+            self._link_head(node)
+        else:
+            self._link_tail(node)
+        return NodeHandle(node, self)
+
+    def appendleft_handle(self, value: T) -> NodeHandle[T]:
+        """Append a value to the left side and get a handle to its node."""
+        node = self._new_node(value)
+        if self._reversed:
+            self._link_tail(node)
+        else:
+            self._link_head(node)
+        return NodeHandle(node, self)
+
+    def insert_after(self, handle: NodeHandle[T], value: T) -> NodeHandle[T]:
+        """Insert a value right after the value of a handle, and get a handle to its node."""
+        node = self._check_handle(handle)
+        new_node = self._new_node(value)
+        if self._reversed:
+            self._link_before(node, new_node)
+        else:
+            self._link_after(node, new_node)
+        return NodeHandle(new_node, self)
+
+    def insert_before(self, handle: NodeHandle[T], value: T) -> NodeHandle[T]:
+        """Insert a value right before the value of a handle, and get a handle to its node."""
+        node = self._check_handle(handle)
+        new_node = self._new_node(value)
+        if self._reversed:
+            self._link_after(node, new_node)
+        else:
+            self._link_before(node, new_node)
+        return NodeHandle(new_node, self)
+
+    def remove_node(self, handle: NodeHandle[T]) -> T:
+        """Remove the value of a handle, which invalidates it, and return the value."""
+        return self._unlink(self._check_handle(handle))
+
+    def move_to_end(self, handle: NodeHandle[T], last: bool = True) -> None:
+        """Move the value of a handle to the right end, or the left one if last is False, like OrderedDict."""
+        node = self._check_handle(handle)
+        if last != self._reversed:
+            if node is not self.tail:
+                self._unlink(node)
+                self._link_tail(node)
+        elif node is not self.head:
+            self._unlink(node)
+            self._link_head(node)
+
+    def _orient(self) -> None:
+        """Relink a list that was reversed by setting _reversed, so its links go in its order again, in O(n).
+
+        Only changes that relink nodes by position call this first, so reading a reversed list never relinks it, and
+        iterators in progress keep working. Positional access maps positions through _reversed instead. Reversing
+        again before this just clears _reversed, so a run of reverses only costs O(1) each.
+        """
+        if self._reversed:
+            self._reversed = False
+            self._reverse_links()
+
+    @abstractmethod
+    def _reverse_links(self) -> None:
+        """Reverse the links of the nodes, the checkpoints and the index."""
+
+    def _check_handle(self, handle: NodeHandle[T]) -> BaseLinkedNode[T]:
+        node = handle._node
+        if handle._list is not self or handle._epoch != self._epoch or not self._linked(node):
+            raise ValueError('handle is not for a value in this list')
+        return node
+
+    def _link_after(self, node: BaseDoublyLinkedNode[T], new_node: BaseDoublyLinkedNode[T]) -> None:
+        """Link a node that isn't in any list right after a node of this list, in the direction of the links."""
+        if node is self.tail:
+            self._link_tail(new_node)
+            return
+        new_node.next, new_node.last = node.next, node
+        if self._index is not None:
+            self._index_insert(new_node)
+        node.next.last = new_node
+        node.next = new_node
+        self._size += 1
+        self._checkpoints = None
+
+    def _link_before(self, node: BaseDoublyLinkedNode[T], new_node: BaseDoublyLinkedNode[T]) -> None:
+        if node is self.head:
+            self._link_head(new_node)
+        else:
+            self._link_after(node.last, new_node)
+
+    @abstractmethod
+    def _link_tail(self, node: BaseDoublyLinkedNode[T]) -> None:
+        """Link a node that isn't in any list as the new tail."""
+
+    @abstractmethod
+    def _link_head(self, node: BaseDoublyLinkedNode[T]) -> None:
+        """Link a node that isn't in any list as the new head."""
+
+    @abstractmethod
+    def _linked(self, node: BaseDoublyLinkedNode[T]) -> bool:
+        """Whether a node that was linked into this list, and hasn't been moved out with its epoch, is still in it."""
+
+
+class BaseLinearLinkedList(BaseNodeLinkedList[T], ABC):
+    head: Optional[BaseLinearLinkedNode[T]]
+
+    def __bool__(self) -> bool:
+        return self.head is not None
+
+    def clear(self) -> None:
+        self.head = None
+        super().clear()
 
     def __iter__(self) -> Iterator[T]:
         node = self.head
@@ -64,6 +979,8 @@ class BaseLinearLinkedList(BaseLinkedList, ABC):
             node = node.next
 
     def __contains__(self, value: T) -> bool:
+        if self._index is not None:
+            return value in self._index
         node = self.head
         while node is not None:
             if node.value == value:
@@ -72,22 +989,16 @@ class BaseLinearLinkedList(BaseLinkedList, ABC):
         return False
 
 
-class BaseCircularLinkedList(BaseLinkedList[T], ABC):
+class BaseCircularLinkedList(BaseNodeLinkedList[T], ABC):
     tail: Optional[BaseCircularLinkedNode[T]]
     head: Optional[BaseCircularLinkedNode[T]]
 
     def __bool__(self) -> bool:
         return self.tail is not None
 
-    def __len__(self) -> int:
-        if not self:
-            return 0
-        length = 1
-        node = self.head
-        while node is not self.tail:
-            length += 1
-            node = node.next
-        return length
+    def clear(self) -> None:
+        self.tail = None
+        super().clear()
 
     def __iter__(self) -> Iterator[T]:
         if not self:
@@ -102,12 +1013,47 @@ class BaseCircularLinkedList(BaseLinkedList[T], ABC):
     def infinite_iterator(self):
         if not self:
             return
+        if self._reversed:
+            node = self.tail
+            while True:
+                yield node.value
+                node = node.last
         node = self.head
         while True:
             yield node.value
             node = node.next
 
+    def rotate(self, k: int = 1) -> None:
+        """Rotate the list k steps to the right, or -k steps to the left, like deque.rotate, by moving the tail.
+
+        Doubly linked lists move the tail whichever way is shorter, in O(min(k, n - k)) steps for 0 <= k < n. Singly
+        linked lists can only move it forward, in O(n - k) steps. Indexed lists also move each passed node's entry
+        from one end of its value's occurrences to the other.
+        """
+        if self._size < 2:
+            return
+        k = to_index(k)
+        forward = (k if self._reversed else -k) % self._size  # While reversed, next goes right to left
+        backward = self._size - forward
+        if not forward:
+            return
+        if isinstance(self, BaseDoublyLinkedList) and backward < forward:
+            for _ in range(backward):
+                if self._index is not None:
+                    nodes = self._index[self.tail.value]
+                    nodes.insert(0, nodes.pop())
+                self.tail = self.tail.last
+        else:
+            for _ in range(forward):
+                self.tail = self.tail.next
+                if self._index is not None:
+                    nodes = self._index[self.tail.value]
+                    nodes.append(nodes.pop(0))
+        self._checkpoints = None
+
     def __contains__(self, value: T) -> bool:
+        if self._index is not None:
+            return value in self._index
         if not self:
             return False
         node = self.head
@@ -120,9 +1066,13 @@ class BaseCircularLinkedList(BaseLinkedList[T], ABC):
     def popleft(self) -> T:
         if not self:
             raise IndexError
-        value = self.head.value
-        if self.tail is self.head:
+        node = self.head
+        if self.tail is node:
             self.tail = None
         else:
-            self.head = self.head.next
-        return value
+            self.head = node.next
+        self._size -= 1
+        self._checkpoints = None
+        if self._index is not None:
+            self._index_remove(node)
+        return node.value
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Collection, Iterable, Iterator, Reversible
+from copyreg import __newobj__
 from typing import Optional, TypeVar, Generic
 
 T = TypeVar('T')
@@ -9,14 +10,26 @@ T = TypeVar('T')
 class BaseLinkedNode(ABC, Collection[T], Generic[T]):
     """The Abstract Base Class for all nodes in linked lists.
 
-    BaseLinkedNodes will favor recursion over iteration in their methods.
-    The default is for operations to be done from the head of the list,
+    BaseLinkedNodes favor iteration over recursion in their methods, so they work on chains of any length without
+    hitting the recursion limit. The default is for operations to be done from the head of the list,
     and for methods that return a node to return the head.
 
+    All nodes use __slots__ instead of a per-instance __dict__ to keep them small. Subclasses should declare __slots__
+    too, or they get a __dict__ back.
+
+    Pickling or copying a node saves the values of the whole chain it is on as one flat list, and loading rebuilds the
+    links, so neither recurses through the nodes. A copy of a node is a node on a copy of its chain. Nodes of the same
+    chain that are pickled or copied separately each get their own copy of it.
+
+    The __init__ methods of the node classes here set the slots directly rather than through super(), and from_iterable
+    and the list constructors skip __init__ altogether while a class keeps one of them, setting the slots of each new
+    node themselves. A subclass that overrides __init__ has it called for every node.
+
     Attributes:
         value: The value that occupies this position in the list.
         next: The next node in the list. None indicates no node.
     """
+    __slots__ = ('value', 'next')
 
     def __init__(self, value: T, next_: Optional[BaseLinkedNode] = None) -> None:
         self.value = value
@@ -26,10 +39,30 @@ class BaseLinkedNode(ABC, Collection[T], Generic[T]):
         return f'{self.__class__.__name__}(value={repr(self.value)}, ' \
                f'next={repr(self.next.value) if self.next is not None else "END"})'
 
+    def __reduce__(self) -> tuple:
+        return __newobj__, (self.__class__,), self._chain_values()
+
+    def __setstate__(self, state: tuple[list[T], int]) -> None:
+        values, position = state
+        cls = self.__class__
+        nodes = [cls.__new__(cls) for _ in range(len(values) - 1)]
+        nodes.insert(position, self)
+        for node, value in zip(nodes, values):
+            node.value = value
+        self._link_nodes(nodes)
+
+    @abstractmethod
+    def _chain_values(self) -> tuple[list[T], int]:
+        """Get the values of the chain this node is on, in order, and the position of this node among them."""
+
+    @abstractmethod
+    def _link_nodes(self, nodes: list[BaseLinkedNode[T]]) -> None:
+        """Link new nodes, which have their values set, into a chain in list order."""
+
     @classmethod
     @abstractmethod
     def from_iterable(cls, values: Iterable[T]) -> Optional[BaseLinkedNode[T]]:
-        """Recursively create a new list of nodes.
+        """Create a new list of nodes.
 
         Args:
             values: Any iterable that will populate the new list, preserving order.
@@ -59,7 +92,7 @@ class BaseLinkedNode(ABC, Collection[T], Generic[T]):
 
     @abstractmethod
     def reverse(self) -> BaseLinkedNode[T]:
-        """Recursively reverse the list.
+        """Reverse the list in place.
 
         Returns:
             The new head.
@@ -70,6 +103,34 @@ class BaseSinglyLinkedNode(BaseLinkedNode[T], ABC):
     """A list with just a next node and no last.
 
     This class has no attributes or methods over the BaseLinkedNode, but exists for inheritance clarity."""
+    __slots__ = ()
+
+    @classmethod
+    def _chain(cls, values: Iterable[T]
+               ) -> tuple[Optional[BaseSinglyLinkedNode[T]], Optional[BaseSinglyLinkedNode[T]], int]:
+        """Link new nodes for values into a chain that ends with None, and get its head, tail and length."""
+        values_iter = iter(values)
+        for value in values_iter:
+            break
+        else:
+            return None, None, 0
+        size = 1
+        if cls.__init__ in _PLAIN_INITS:
+            head = node = _new(cls)
+            head.value = value
+            for size, value in enumerate(values_iter, 2):
+                next_node = _new(cls)
+                next_node.value = value
+                node.next = next_node
+                node = next_node
+        else:
+            head = node = cls(value)
+            for size, value in enumerate(values_iter, 2):
+                next_node = cls(value)
+                node.next = next_node
+                node = next_node
+        node.next = None
+        return head, node, size
 
 
 class BaseDoublyLinkedNode(BaseLinkedNode[T], ABC, Reversible):
@@ -83,19 +144,60 @@ class BaseDoublyLinkedNode(BaseLinkedNode[T], ABC, Reversible):
         next: The next node in the list. None indicates no node.
         last: The last node in the list. None indicates no node.
     """
+    __slots__ = ('last',)
 
     def __init__(self,
                  value: T,
                  next_: Optional[BaseDoublyLinkedNode] = None,
                  last: Optional[BaseDoublyLinkedNode] = None) -> None:
-        super().__init__(value, next_)
+        self.value = value
+        self.next = next_
         self.last = last
 
+    @classmethod
+    def _chain(cls, values: Iterable[T], last: Optional[BaseDoublyLinkedNode[T]] = None
+               ) -> tuple[Optional[BaseDoublyLinkedNode[T]], Optional[BaseDoublyLinkedNode[T]], int]:
+        """Link new nodes for values into a chain that ends with None, and get its head, tail and length.
+
+        The head's last is set to last, but last's next is left alone.
+        """
+        values_iter = iter(values)
+        for value in values_iter:
+            break
+        else:
+            return None, None, 0
+        size = 1
+        if cls.__init__ in _PLAIN_INITS:
+            head = node = _new(cls)
+            head.value, head.last = value, last
+            for size, value in enumerate(values_iter, 2):
+                next_node = _new(cls)
+                next_node.value = value
+                next_node.last = node
+                node.next = next_node
+                node = next_node
+        else:
+            head = node = cls(value, None, last)
+            for size, value in enumerate(values_iter, 2):
+                next_node = cls(value, None, node)
+                node.next = next_node
+                node = next_node
+        node.next = None
+        head.last = last  # Circular nodes link to themselves by default
+        return head, node, size
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}(value={repr(self.value)}, ' \
                f'next={repr(self.next.value) if self.next is not None else "END"}, ' \
                f'last={repr(self.last.value) if self.last is not None else "END"})'
 
+    def _link_nodes(self, nodes: list[BaseDoublyLinkedNode[T]]) -> None:
+        super()._link_nodes(nodes)
+        nodes[0].last = None
+        for node in nodes:
+            if node.next is not None:
+                node.next.last = node
+
     @abstractmethod
     def pop(self) -> tuple[BaseDoublyLinkedNode[T], T]:
         """Pop from the right side of the list, which is also the 0th and head.
@@ -122,28 +224,44 @@ class BaseLinearLinkedNode(BaseLinkedNode[T], ABC):
     Any references to nodes should be optional, with None being considered terminal. Any introduced references to nodes
     should follow this pattern.
     """
+    __slots__ = ()
+
+    def _chain_values(self) -> tuple[list[T], int]:
+        return list(self), 0
+
+    def _link_nodes(self, nodes: list[BaseLinearLinkedNode[T]]) -> None:
+        for node, next_node in zip(nodes, nodes[1:]):
+            node.next = next_node
+        nodes[-1].next = None
 
     def __len__(self) -> int:
-        """Recursively get the count of this node and the nodes that come after it."""
-        if self.next is None:
-            return 1
-        return 1 + len(self.next)
+        """Get the count of this node and the nodes that come after it in O(n) time."""
+        length = 1
+        node = self.next
+        while node is not None:
+            length += 1
+            node = node.next
+        return length
 
     def __iter__(self) -> Iterator[T]:
-        """Recursively iterate through the nodes.
+        """Iterate through the nodes.
 
         Yields:
             The values from this node and the ones after it.
         """
-        yield self.value
-        if self.next is not None:
-            yield from self.next
+        node = self
+        while node is not None:
+            yield node.value
+            node = node.next
 
     def __contains__(self, value: T) -> bool:
-        """Recursively search for the value on this node and the ones after in O(n) time."""
-        if value == self.value:
-            return True
-        return self.next is not None and value in self.next
+        """Search for the value on this node and the ones after in O(n) time."""
+        node = self
+        while node is not None:
+            if value == node.value:
+                return True
+            node = node.next
+        return False
 
 
 class BaseCircularLinkedNode(BaseLinkedNode[T], ABC):
@@ -153,31 +271,71 @@ class BaseCircularLinkedNode(BaseLinkedNode[T], ABC):
         value: The value that occupies this position in the list.
         next: The next node in the list. This is no longer optional. If nothing is provided, defaults to self.
     """
+    __slots__ = ()
     next: BaseCircularLinkedNode[T]
 
     def __init__(self, value: T, next_: Optional[BaseCircularLinkedNode] = None):
-        next_ = next_ if next_ is not None else self
-        super().__init__(value, next_)
+        self.value = value
+        self.next = self if next_ is None else next_
+
+    def _chain_values(self) -> tuple[list[T], int]:
+        values = list(self)  # Starts after this node and ends with it
+        return values, len(values) - 1
+
+    def _link_nodes(self, nodes: list[BaseCircularLinkedNode[T]]) -> None:
+        for node, next_node in zip(nodes, nodes[1:]):
+            node.next = next_node
+        nodes[-1].next = nodes[0]
 
     def __len__(self, tail: Optional[BaseCircularLinkedNode] = None) -> int:
-        """Recursively get the count of this node and the nodes that come after it."""
+        """Get the count of this node and the nodes after it, stopping before the tail, in O(n) time.
+
+        Args:
+            tail: The node to stop before. Defaults to this node, which counts the whole cycle.
+        """
         if self is tail:
             return 0
-        return 1 + self.next.__len__(self if tail is None else tail)
+        tail = self if tail is None else tail
+        length = 1
+        node = self.next
+        while node is not tail:
+            length += 1
+            node = node.next
+        return length
 
     def __iter__(self, tail: Optional[BaseCircularLinkedNode] = None) -> Iterator[T]:
-        """Recursively iterate through the nodes.
+        """Iterate through the nodes, starting with the one after this one.
+
+        Args:
+            tail: The node to stop at. Defaults to this node, which iterates the whole cycle.
 
         Yields:
-            The values from this node and the ones after it.
+            The values from the next node up to and including the tail.
         """
         if self is tail:
             return
-        yield self.next.value
-        yield from self.next.__iter__(self if tail is None else tail)
+        tail = self if tail is None else tail
+        node = self
+        while True:
+            node = node.next
+            yield node.value
+            if node is tail:
+                return
 
     def __contains__(self, value: T, tail: Optional[BaseCircularLinkedNode] = None) -> bool:
-        """Recursively search for the value on this node and the ones after in O(n) time."""
+        """Search for the value on this node and the ones after, stopping before the tail, in O(n) time."""
         if self is tail:
             return False
-        return value == self.value or self.next.__contains__(value, self if tail is None else tail)
+        tail = self if tail is None else tail
+        node = self
+        while True:
+            if value == node.value:
+                return True
+            node = node.next
+            if node is tail:
+                return False
+
+
+_new = object.__new__
+# The __init__ methods that only set the slots, so _chain can set them itself. nodes.py adds its own.
+_PLAIN_INITS = {BaseLinkedNode.__init__, BaseDoublyLinkedNode.__init__, BaseCircularLinkedNode.__init__}
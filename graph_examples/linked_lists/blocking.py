@@ -0,0 +1,226 @@
+"""A thread safe DoublyLinkedList, for use as a work queue between threads."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from functools import wraps
+from queue import Full
+from threading import Condition, RLock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
+
+from graph_examples.linked_lists.base_lists import NodeHandle, NodePool
+from graph_examples.linked_lists.base_nodes import T
+from graph_examples.linked_lists.lists import DoublyLinkedList
+
+if TYPE_CHECKING:
+    import numpy
+
+F = TypeVar('F', bound=Callable)
+
+
+def _synchronized(method: F) -> F:
+    """Run a method under the list's lock, and wake up waiters if it changed the length."""
+
+    @wraps(method)
+    def wrapper(self: BlockingDoublyLinkedList, *args, **kwargs):
+        with self._lock:
+            size = self._size
+            result = method(self, *args, **kwargs)
+            self._notify(self._size - size)
+            return result
+
+    return wrapper
+
+
+class BlockingDoublyLinkedList(DoublyLinkedList[T]):
+    """A DoublyLinkedList that does its own locking and can wait for values or for room.
+
+    Every method holds the list's lock, so the list can be shared between threads without any other locking. Iterating
+    goes over a snapshot taken under the lock, so the list can change during iteration.
+
+    pop, popleft, append, appendleft and the batched popleft_many and append_many take block and timeout arguments.
+    They don't block by default, which keeps the same behavior as DoublyLinkedList: popping an empty list raises
+    IndexError. With block=True, they wait for a value or for room, up to timeout seconds if it isn't None, and then
+    raise IndexError or queue.Full.
+
+    With a maxsize, the list never holds more than maxsize values. Operations that add values and can't block, like
+    insert, extend or splice, raise queue.Full instead of going over.
+
+    Attributes:
+        maxsize: The most values the list can hold. Zero or less means no limit.
+    """
+
+    def __init__(self, values: Iterable[T] = (), *, maxsize: int = 0, skip_index: bool = False,
+                 indexed: bool = False, pool: Optional[NodePool[T]] = None) -> None:
+        self._lock = RLock()
+        self._not_empty = Condition(self._lock)
+        self._not_full = Condition(self._lock)
+        self.maxsize = maxsize
+        super().__init__(values, skip_index=skip_index, indexed=indexed, pool=pool)
+        if 0 < maxsize < self._size:
+            raise ValueError(f'{self._size} values do not fit in maxsize {maxsize}')
+
+    def _notify(self, change: int) -> None:
+        if change > 0:
+            self._not_empty.notify(change)
+        elif change < 0 and self.maxsize > 0:
+            self._not_full.notify(-change)
+
+    def _has_room(self, count: int = 1) -> bool:
+        return self.maxsize <= 0 or self._size + count <= self.maxsize
+
+    def _wait_for_room(self, count: int, block: bool, timeout: Optional[float]) -> None:
+        if self._has_room(count):
+            return
+        if not block or count > self.maxsize or not self._not_full.wait_for(lambda: self._has_room(count), timeout):
+            raise Full
+
+    def _wait_for_values(self, block: bool, timeout: Optional[float]) -> None:
+        if self._size:
+            return
+        if not block or not self._not_empty.wait_for(lambda: self._size, timeout):
+            raise IndexError
+
+    def __getstate__(self) -> dict[str, object]:
+        with self._lock:
+            return {**super().__getstate__(), 'maxsize': self.maxsize}
+
+    @classmethod
+    def from_numpy(cls, array: numpy.ndarray, **kwargs: Any) -> BlockingDoublyLinkedList[T]:
+        """Make a list of the values of a 1-D array, passing kwargs like maxsize on to __init__."""
+        return super().from_numpy(array, **kwargs)
+
+    def __iter__(self) -> Iterator[T]:
+        with self._lock:
+            return iter(list(super().__iter__()))
+
+    def __reversed__(self) -> Iterator[T]:
+        with self._lock:
+            return iter(list(super().__reversed__()))
+
+    def append(self, value: T, block: bool = False, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            self._wait_for_room(1, block, timeout)
+            super().append(value)
+            self._not_empty.notify()
+
+    def appendleft(self, value: T, block: bool = False, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            self._wait_for_room(1, block, timeout)
+            super().appendleft(value)
+            self._not_empty.notify()
+
+    def pop(self, block: bool = False, timeout: Optional[float] = None) -> T:
+        with self._lock:
+            self._wait_for_values(block, timeout)
+            value = super().pop()
+            self._notify(-1)
+            return value
+
+    def popleft(self, block: bool = False, timeout: Optional[float] = None) -> T:
+        with self._lock:
+            self._wait_for_values(block, timeout)
+            value = super().popleft()
+            self._notify(-1)
+            return value
+
+    def append_many(self, values: Iterable[T], block: bool = False, timeout: Optional[float] = None) -> None:
+        """Append values to the right side, taking the lock once per batch that fits.
+
+        Without block, raises queue.Full before appending anything if the values don't all fit. With block, appends
+        as many as fit and waits for room for the rest. If that times out, the values appended so far stay.
+        """
+        values = list(values)
+        deadline = None if timeout is None else monotonic() + timeout
+        append = super().append
+        with self._lock:
+            if not block:
+                self._wait_for_room(len(values), False, None)
+            start = 0
+            while start < len(values):
+                if not self._has_room():
+                    self._wait_for_room(1, True, None if deadline is None else max(0.0, deadline - monotonic()))
+                stop = len(values) if self.maxsize <= 0 else min(len(values), start + self.maxsize - self._size)
+                for value in values[start:stop]:
+                    append(value)
+                self._notify(stop - start)
+                start = stop
+
+    def popleft_many(self, max_count: Optional[int] = None, block: bool = False,
+                     timeout: Optional[float] = None) -> list[T]:
+        """Pop up to max_count values from the left side under a single lock acquisition.
+
+        With block, waits until there is at least one value. Raises IndexError if there isn't.
+        """
+        with self._lock:
+            self._wait_for_values(block, timeout)
+            count = self._size if max_count is None else min(max_count, self._size)
+            popleft = super().popleft
+            values = [popleft() for _ in range(count)]
+            self._notify(-count)
+            return values
+
+    @_synchronized
+    def insert(self, index: int, value: T) -> None:
+        self._wait_for_room(1, False, None)
+        super().insert(index, value)
+
+    @_synchronized
+    def append_handle(self, value: T) -> NodeHandle[T]:
+        self._wait_for_room(1, False, None)
+        return super().append_handle(value)
+
+    @_synchronized
+    def appendleft_handle(self, value: T) -> NodeHandle[T]:
+        self._wait_for_room(1, False, None)
+        return super().appendleft_handle(value)
+
+    @_synchronized
+    def insert_after(self, handle: NodeHandle[T], value: T) -> NodeHandle[T]:
+        self._wait_for_room(1, False, None)
+        return super().insert_after(handle, value)
+
+    @_synchronized
+    def insert_before(self, handle: NodeHandle[T], value: T) -> NodeHandle[T]:
+        self._wait_for_room(1, False, None)
+        return super().insert_before(handle, value)
+
+    def splice(self, other: DoublyLinkedList[T], at: Optional[int] = None) -> None:
+        if type(other) is not type(self) or other is self:
+            super().splice(other, at)  # Raises the right error
+            return
+        first, second = sorted([self, other], key=id)  # Always lock in the same order to avoid deadlocks
+        with first._lock, second._lock:
+            self._wait_for_room(len(other), False, None)
+            size = self._size
+            super().splice(other, at)
+            self._notify(self._size - size)
+
+    def extend(self, values: Iterable[T]) -> None:
+        # Not synchronized: holding this list's lock while splice takes both locks would undo splice's lock order and
+        # can deadlock two lists extending each other. Values that aren't a BlockingDoublyLinkedList are copied into
+        # a new list before any lock is taken, then spliced in.
+        super().extend(values)
+
+    def extendleft(self, values: Iterable[T]) -> None:
+        super().extendleft(values)
+
+    __getitem__ = _synchronized(DoublyLinkedList.__getitem__)
+    __setitem__ = _synchronized(DoublyLinkedList.__setitem__)
+    __delitem__ = _synchronized(DoublyLinkedList.__delitem__)
+    __contains__ = _synchronized(DoublyLinkedList.__contains__)
+    __repr__ = _synchronized(DoublyLinkedList.__repr__)
+    reverse = _synchronized(DoublyLinkedList.reverse)
+    reversed_view = _synchronized(DoublyLinkedList.reversed_view)
+    sort = _synchronized(DoublyLinkedList.sort)
+    index = _synchronized(DoublyLinkedList.index)
+    count = _synchronized(DoublyLinkedList.count)
+    remove = _synchronized(DoublyLinkedList.remove)
+    discard = _synchronized(DoublyLinkedList.discard)
+    clear = _synchronized(DoublyLinkedList.clear)
+    split_at = _synchronized(DoublyLinkedList.split_at)
+    remove_node = _synchronized(DoublyLinkedList.remove_node)
+    move_to_end = _synchronized(DoublyLinkedList.move_to_end)
+    to_numpy = _synchronized(DoublyLinkedList.to_numpy)
+    apply_vectorized = _synchronized(DoublyLinkedList.apply_vectorized)
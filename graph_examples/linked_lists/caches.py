@@ -0,0 +1,350 @@
+"""Bounded caches that pair a dict with doubly linked lists of their entries, so every operation is O(1)."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable, ItemsView, Iterator, MutableMapping, ValuesView
+from functools import wraps
+from typing import Generic, NamedTuple, Optional, TypeVar
+
+from graph_examples.linked_lists.base_lists import NodeHandle
+from graph_examples.linked_lists.lists import DoublyLinkedList
+from graph_examples.linked_lists.nodes import DoublyLinkedNode
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+_MISSING = object()
+
+
+class TooHeavyError(ValueError):
+    """Raised when a value alone weighs more than the maxweight of a cache."""
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+    weight: float
+
+
+class _Entry(Generic[K, V]):
+    __slots__ = ('key', 'value', 'weight', 'bucket')
+
+    def __init__(self, key: K, value: V, weight: float) -> None:
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.bucket: Optional[DoublyLinkedNode[_Bucket]] = None
+
+
+class _Bucket:
+    """The entries of an LFUCache that were used the same number of times, least recently used first."""
+    __slots__ = ('frequency', 'entries')
+
+    def __init__(self, frequency: int) -> None:
+        self.frequency = frequency
+        self.entries: DoublyLinkedList[_Entry] = DoublyLinkedList()
+
+
+class _ItemsView(ItemsView):
+    def __iter__(self) -> Iterator[tuple[K, V]]:
+        return ((entry.key, entry.value) for entry in self._mapping._entries())
+
+
+class _ValuesView(ValuesView):
+    def __iter__(self) -> Iterator[V]:
+        return (entry.value for entry in self._mapping._entries())
+
+
+class BaseCache(ABC, MutableMapping[K, V]):
+    """The Abstract Base Class for bounded caches.
+
+    A cache is a mutable mapping that evicts entries to stay within maxsize entries and maxweight total weight. Each
+    entry lives on a node of a doubly linked list, and the dict maps keys to handles of those nodes, so lookups,
+    updates and evictions are all O(1). Subclasses decide the eviction order by how they link the nodes.
+
+    Getting a value counts a hit or a miss and marks the entry as used. `in` checks and iterating over keys, values or
+    items don't do either. Iteration goes from the next entry to be evicted to the last.
+
+    Attributes:
+        maxsize: The most entries the cache holds. None means no limit, and 0 means nothing is kept.
+        maxweight: The most total weight the cache holds. None means no limit.
+        hits: How many gets found their key.
+        misses: How many gets didn't.
+        evictions: How many entries were evicted to make room.
+        weight: The total weight of the entries.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, *, maxweight: Optional[float] = None,
+                 weigh: Optional[Callable[[V], float]] = None) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize: The most entries the cache holds. None means no limit.
+            maxweight: The most total weight the cache holds. None means no limit.
+            weigh: Gets the weight of a value. Defaults to 1 for every value.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('maxsize must not be negative')
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self._weigh = weigh
+        self._handles: dict[K, NodeHandle[_Entry[K, V]]] = {}
+        self.hits = self.misses = self.evictions = 0
+        self.weight = 0
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self.items())!r}, maxsize={self.maxsize})'
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._handles
+
+    def __iter__(self) -> Iterator[K]:
+        return (entry.key for entry in self._entries())
+
+    def items(self) -> ItemsView[K, V]:
+        return _ItemsView(self)
+
+    def values(self) -> ValuesView[V]:
+        return _ValuesView(self)
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        handle = self._handles.get(key)
+        if handle is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(handle)
+        return handle.value.value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Set a value and mark it as used, evicting other entries if needed.
+
+        Raises:
+            TooHeavyError: If the value alone weighs more than maxweight.
+        """
+        weight = 1 if self._weigh is None else self._weigh(value)
+        if self.maxweight is not None and weight > self.maxweight:
+            raise TooHeavyError(f'value of weight {weight} does not fit in maxweight {self.maxweight}')
+        handle = self._handles.get(key)
+        if handle is not None:
+            entry = handle.value
+            self.weight += weight - entry.weight
+            entry.value, entry.weight = value, weight
+            self._touch(handle)
+            while self._over(0, 0):
+                self._evict(self._victim(entry))
+        elif self.maxsize != 0:
+            while self._over(1, weight):  # Once the cache is empty, the entry always fits
+                self._evict(self._victim())
+            self._handles[key] = self._add(_Entry(key, value, weight))
+            self.weight += weight
+
+    def __delitem__(self, key: K) -> None:
+        handle = self._handles.pop(key)
+        self._remove(handle)
+        self.weight -= handle.value.weight
+
+    def clear(self) -> None:
+        """Remove every entry, keeping the counters."""
+        for handle in list(self._handles.values()):
+            self._remove(handle)
+        self._handles.clear()
+        self.weight = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._handles), self.weight)
+
+    def _over(self, count: int, weight: float) -> bool:
+        """Whether adding count entries of total weight would go over a limit."""
+        return ((self.maxsize is not None and len(self._handles) + count > self.maxsize)
+                or (self.maxweight is not None and self.weight + weight > self.maxweight))
+
+    def _evict(self, entry: _Entry[K, V]) -> None:
+        self._remove(self._handles.pop(entry.key))
+        self.weight -= entry.weight
+        self.evictions += 1
+
+    @abstractmethod
+    def _add(self, entry: _Entry[K, V]) -> NodeHandle[_Entry[K, V]]:
+        """Link a new entry and return a handle to its node."""
+
+    @abstractmethod
+    def _touch(self, handle: NodeHandle[_Entry[K, V]]) -> None:
+        """Mark the entry of a handle as used, replacing the handle in _handles if its node changes."""
+
+    @abstractmethod
+    def _remove(self, handle: NodeHandle[_Entry[K, V]]) -> None:
+        """Unlink the node of an entry."""
+
+    @abstractmethod
+    def _victim(self, keep: Optional[_Entry[K, V]] = None) -> _Entry[K, V]:
+        """Get the entry to evict next, other than keep. There must be one."""
+
+    @abstractmethod
+    def _entries(self) -> Iterator[_Entry[K, V]]:
+        """Iterate through the entries in eviction order."""
+
+
+class LRUCache(BaseCache[K, V]):
+    """A cache that evicts the least recently used entry.
+
+    The entries are kept in a DoublyLinkedList from least to most recently used, and using one moves its node to the
+    end.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, *, maxweight: Optional[float] = None,
+                 weigh: Optional[Callable[[V], float]] = None) -> None:
+        super().__init__(maxsize, maxweight=maxweight, weigh=weigh)
+        self._order: DoublyLinkedList[_Entry[K, V]] = DoublyLinkedList()
+
+    def _add(self, entry: _Entry[K, V]) -> NodeHandle[_Entry[K, V]]:
+        return self._order.append_handle(entry)
+
+    def _touch(self, handle: NodeHandle[_Entry[K, V]]) -> None:
+        self._order.move_to_end(handle)
+
+    def _remove(self, handle: NodeHandle[_Entry[K, V]]) -> None:
+        self._order.remove_node(handle)
+
+    def _victim(self, keep: Optional[_Entry[K, V]] = None) -> _Entry[K, V]:
+        node = self._order.head
+        return node.next.value if node.value is keep else node.value
+
+    def _entries(self) -> Iterator[_Entry[K, V]]:
+        return iter(self._order)
+
+
+class LFUCache(BaseCache[K, V]):
+    """A cache that evicts the least frequently used entry, and the least recently used one among those.
+
+    Entries used the same number of times share a bucket, which is a DoublyLinkedList from least to most recently used.
+    The buckets are linked by DoublyLinkedNodes in increasing order of frequency, and only frequencies in use have one.
+    Using an entry moves its node to the bucket for the next frequency, which is either the next bucket or a new one
+    linked right after, so eviction never has to search for the lowest frequency.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, *, maxweight: Optional[float] = None,
+                 weigh: Optional[Callable[[V], float]] = None) -> None:
+        super().__init__(maxsize, maxweight=maxweight, weigh=weigh)
+        self._lowest: Optional[DoublyLinkedNode[_Bucket]] = None
+
+    def frequency(self, key: K) -> int:
+        """Get how many times the entry for key was set or used, without using it."""
+        return self._handles[key].value.bucket.value.frequency
+
+    def _bucket_after(self, bucket_node: Optional[DoublyLinkedNode[_Bucket]],
+                      frequency: int) -> DoublyLinkedNode[_Bucket]:
+        """Get the bucket for frequency right after bucket_node, or first if it's None, linking a new one if needed."""
+        next_node = self._lowest if bucket_node is None else bucket_node.next
+        if next_node is not None and next_node.value.frequency == frequency:
+            return next_node
+        new_node = DoublyLinkedNode(_Bucket(frequency), next_node, bucket_node)
+        if next_node is not None:
+            next_node.last = new_node
+        if bucket_node is None:
+            self._lowest = new_node
+        else:
+            bucket_node.next = new_node
+        return new_node
+
+    def _unlink_if_empty(self, bucket_node: DoublyLinkedNode[_Bucket]) -> None:
+        if bucket_node.value.entries:
+            return
+        if bucket_node.last is None:
+            self._lowest = bucket_node.next
+        else:
+            bucket_node.last.next = bucket_node.next
+        if bucket_node.next is not None:
+            bucket_node.next.last = bucket_node.last
+
+    def _add(self, entry: _Entry[K, V]) -> NodeHandle[_Entry[K, V]]:
+        entry.bucket = self._bucket_after(None, 1)
+        return entry.bucket.value.entries.append_handle(entry)
+
+    def _touch(self, handle: NodeHandle[_Entry[K, V]]) -> None:
+        entry = handle.value
+        bucket_node = entry.bucket
+        entry.bucket = self._bucket_after(bucket_node, bucket_node.value.frequency + 1)
+        bucket_node.value.entries.remove_node(handle)
+        self._handles[entry.key] = entry.bucket.value.entries.append_handle(entry)
+        self._unlink_if_empty(bucket_node)
+
+    def _remove(self, handle: NodeHandle[_Entry[K, V]]) -> None:
+        bucket_node = handle.value.bucket
+        bucket_node.value.entries.remove_node(handle)
+        self._unlink_if_empty(bucket_node)
+
+    def _victim(self, keep: Optional[_Entry[K, V]] = None) -> _Entry[K, V]:
+        node = self._lowest.value.entries.head
+        if node.value is not keep:
+            return node.value
+        return (node.next if node.next is not None else self._lowest.next.value.entries.head).value
+
+    def _entries(self) -> Iterator[_Entry[K, V]]:
+        bucket_node = self._lowest
+        while bucket_node is not None:
+            yield from bucket_node.value.entries
+            bucket_node = bucket_node.next
+
+
+_KWARGS = object()  # Separates positional from keyword arguments in memoize keys
+
+
+def memoize(cache: Optional[BaseCache] = None, *,
+            typed: bool = False) -> Callable[[Callable[..., V]], Callable[..., V]]:
+    """Decorate a function to cache its results, like functools.lru_cache but with any BaseCache.
+
+    The arguments must be hashable. A result that weighs more than the cache's maxweight is returned without being
+    cached.
+
+    Args:
+        cache: Where to keep the results. Defaults to an LRUCache of 128 entries.
+        typed: Whether arguments of different types are cached separately, like 1 and 1.0.
+
+    Returns:
+        A decorator. The decorated function has cache, cache_info and cache_clear attributes. Like for lru_cache,
+        cache_clear also resets the counters.
+    """
+    cache = LRUCache() if cache is None else cache
+
+    def decorator(func: Callable[..., V]) -> Callable[..., V]:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS, *kwargs.items())
+            if typed:
+                key += tuple(type(x) for x in args) + tuple(type(x) for x in kwargs.values())
+            result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
+            result = func(*args, **kwargs)
+            try:
+                cache[key] = result
+            except TooHeavyError:
+                pass
+            return result
+
+        def cache_clear() -> None:
+            cache.clear()
+            cache.hits = cache.misses = cache.evictions = 0
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
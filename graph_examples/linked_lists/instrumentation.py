@@ -0,0 +1,242 @@
+"""Opt-in counters for the nodes and lists of this package: calls per public method, pointer hops and nodes allocated.
+
+Instrumentation is off by default, and while it's off nothing in the package is changed, so it costs nothing. enable()
+wraps the public methods of every node and list class, replaces the next and last slots of nodes and unrolled blocks
+with counting properties, and counts every node made, and disable() puts the originals back:
+
+    instrumentation.enable(timing=True)
+    li = DoublyLinkedList(range(10))
+    5 in li
+    print(instrumentation.snapshot().metrics())
+    instrumentation.disable()
+
+Setting the LINKED_LISTS_INSTRUMENTATION environment variable to 1 enables it when the package is imported, and setting
+it to timing also times each call. Timings go in histograms of power of two buckets, in nanoseconds. A method that
+returns an iterator is only timed until it returns, and its hops are counted as it's iterated.
+
+Counting is much slower than the uninstrumented code, so it's meant for finding out where the time goes, not for
+always running in production. The counters aren't locked, so increments from several threads at once can be lost.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from threading import local
+from time import perf_counter_ns
+from types import FunctionType
+from typing import Any, NamedTuple
+
+from graph_examples.linked_lists.base_lists import BaseLinkedList
+from graph_examples.linked_lists.base_nodes import BaseDoublyLinkedNode, BaseLinkedNode
+from graph_examples.linked_lists.lists import _Block
+
+ENVIRONMENT_VARIABLE = 'LINKED_LISTS_INSTRUMENTATION'
+
+# The dunder methods that are counted like public ones
+_DUNDERS = frozenset(['__init__', '__len__', '__iter__', '__reversed__', '__contains__', '__getitem__',
+                      '__setitem__', '__delitem__'])
+# Links are counted as hops instead of calls
+_LINKS = [(BaseLinkedNode, 'next'), (BaseDoublyLinkedNode, 'last'), (_Block, 'next'), (_Block, 'last')]
+# The key of a call being counted as an allocation, which can't clash with the name of a method
+_ALLOCATION = ''
+
+_calls: Counter[str] = Counter()
+_hops: Counter[str] = Counter()
+_allocations: Counter[str] = Counter()
+_timings: dict[str, Counter[int]] = {}
+# (owner, name, original) for every attribute replaced by enable, so disable can put them back
+_patched: list[tuple[type, str, Any]] = []
+_timing = False
+# The (id(instance), method name) of the calls in progress in each thread
+_active = local()
+
+
+class Snapshot(NamedTuple):
+    """A copy of the counters.
+
+    Attributes:
+        calls: The number of calls per method, by 'Class.method', where Class is the class of the instance called.
+        hops: The number of reads of a link, by 'Class.next' or 'Class.last'.
+        allocations: The number of nodes made, including copied and unpickled ones, by class name.
+        timings: For each method that was timed, the number of calls per bucket, by the bucket's exclusive upper bound
+            in nanoseconds.
+    """
+    calls: dict[str, int]
+    hops: dict[str, int]
+    allocations: dict[str, int]
+    timings: dict[str, dict[int, int]]
+
+    def metrics(self, prefix: str = 'linked_lists') -> dict[str, int]:
+        """Flatten the counters into one dict of dotted metric names, which most metrics pipelines can take as is.
+
+        The names are like 'linked_lists.calls.DoublyLinkedList.append', 'linked_lists.hops.DoublyLinkedNode.next',
+        'linked_lists.allocations.DoublyLinkedNode' and 'linked_lists.timings.DoublyLinkedList.append.lt_1024'.
+        """
+        metrics = {}
+        for kind in ['calls', 'hops', 'allocations']:
+            for key, count in getattr(self, kind).items():
+                metrics[f'{prefix}.{kind}.{key}'] = count
+        for key, histogram in self.timings.items():
+            for bound, count in sorted(histogram.items()):
+                metrics[f'{prefix}.timings.{key}.lt_{bound}'] = count
+        return metrics
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+def enable(timing: bool = False) -> None:
+    """Start counting, and time each call too if timing is true. Enabling it again just switches timing."""
+    global _timing
+    if _patched:
+        if timing == _timing:
+            return
+        disable()
+    _timing = timing
+    # Nodes are counted when they're initialized, as a type's __new__ can't be put back once it's been replaced
+    for cls in _classes(BaseLinkedNode) + [_Block]:
+        if '__init__' in vars(cls):
+            _patch(cls, '__init__', _counting_allocations(vars(cls)['__init__'], lambda *args, **kwargs: 1))
+    # Copying and unpickling a chain make its nodes with __new__ and set them up in __setstate__ instead
+    setstate = _counting_allocations(BaseLinkedNode.__setstate__, lambda state: len(state[0]))
+    _patch(BaseLinkedNode, '__setstate__', setstate)
+    for cls in _classes(BaseLinkedNode) + _classes(BaseLinkedList):
+        for name, attribute in list(vars(cls).items()):
+            wrapped = _wrap(name, attribute, timing)
+            if wrapped is not None:
+                _patch(cls, name, wrapped)
+    for cls, name in _LINKS:
+        _patch(cls, name, _counting_link(name, vars(cls)[name]))
+
+
+def disable() -> None:
+    """Stop counting and put back every method and link. The counters keep their values until reset."""
+    while _patched:
+        owner, name, original = _patched.pop()
+        if original is None:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+
+
+def reset() -> None:
+    """Set all the counters back to zero."""
+    _calls.clear()
+    _hops.clear()
+    _allocations.clear()
+    _timings.clear()
+
+
+def snapshot() -> Snapshot:
+    return Snapshot(dict(_calls), dict(_hops), dict(_allocations),
+                    {key: dict(histogram) for key, histogram in _timings.items()})
+
+
+@contextmanager
+def instrumented(timing: bool = False) -> Iterator[None]:
+    """Enable instrumentation for the duration of a with block, then put back how it was before."""
+    was_enabled, was_timing = is_enabled(), _timing
+    enable(timing)
+    try:
+        yield
+    finally:
+        if was_enabled:
+            enable(was_timing)
+        else:
+            disable()
+
+
+def _classes(root: type) -> list[type]:
+    """Get root and its subclasses in this package, bases first."""
+    classes, stack = [], [root]
+    while stack:
+        cls = stack.pop()
+        if cls.__module__.startswith(__package__) and cls not in classes:
+            classes.append(cls)
+            stack.extend(reversed(cls.__subclasses__()))
+    return classes
+
+
+def _patch(owner: type, name: str, replacement: Any) -> None:
+    _patched.append((owner, name, vars(owner).get(name)))
+    setattr(owner, name, replacement)
+
+
+def _wrap(name: str, attribute: Any, timing: bool) -> Any:
+    """Get a counting version of a class attribute, or None if it isn't a public method or property."""
+    if name.startswith('_') and name not in _DUNDERS or name in ('next', 'last', 'value'):
+        return None
+    if isinstance(attribute, classmethod):
+        return classmethod(_counting(name, attribute.__func__, timing))
+    if isinstance(attribute, staticmethod):
+        return None  # There's no instance or class to name it by
+    if isinstance(attribute, property):
+        return property(*(None if func is None else _counting(name, func, timing)
+                          for func in (attribute.fget, attribute.fset, attribute.fdel)), attribute.__doc__)
+    if isinstance(attribute, FunctionType):
+        return _counting(name, attribute, timing)
+    return None
+
+
+def _counting(name: str, func: Callable, timing: bool) -> Callable:
+    """Wrap a method to count calls by the class of what it's called on, which for a classmethod is the class.
+
+    A call made by an override through super() is part of the call to the override, so it isn't counted again.
+    """
+    @wraps(func)
+    def counting(self, *args, **kwargs):
+        active = _active.__dict__.setdefault('calls', set())
+        call = (id(self), name)
+        if call in active:
+            return func(self, *args, **kwargs)
+        key = f'{self.__name__ if isinstance(self, type) else type(self).__name__}.{name}'
+        _calls[key] += 1
+        active.add(call)
+        start = perf_counter_ns() if timing else 0
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            active.discard(call)
+            if timing:
+                elapsed = perf_counter_ns() - start
+                histogram = _timings.get(key)
+                if histogram is None:
+                    histogram = _timings[key] = Counter()
+                histogram[1 << elapsed.bit_length()] += 1
+    return counting
+
+
+def _counting_link(name: str, slot: Any) -> property:
+    """Wrap the slot descriptor of a link in a property that counts reads."""
+    def get(node):
+        _hops[f'{type(node).__name__}.{name}'] += 1
+        return slot.__get__(node)
+
+    return property(get, slot.__set__, slot.__delete__, slot.__doc__)
+
+
+def _counting_allocations(func: Callable, count: Callable[..., int]) -> Callable:
+    """Wrap a method that initializes a node to count the nodes it makes, not counting again for super() calls."""
+    @wraps(func)
+    def counting(self, *args, **kwargs):
+        active = _active.__dict__.setdefault('calls', set())
+        call = (id(self), _ALLOCATION)
+        if call in active:
+            return func(self, *args, **kwargs)
+        _allocations[type(self).__name__] += count(*args, **kwargs)
+        active.add(call)
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            active.discard(call)
+    return counting
+
+
+_setting = os.environ.get(ENVIRONMENT_VARIABLE, '').strip().lower()
+if _setting and _setting not in ('0', 'false', 'off'):
+    enable(timing=_setting == 'timing')
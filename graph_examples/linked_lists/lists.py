@@ -1,38 +1,52 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
-from typing import Optional
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Optional
 
 from graph_examples.linked_lists.base_lists import (
     BaseCircularLinkedList,
     BaseLinearLinkedList,
     BaseDoublyLinkedList,
+    BaseDoublyNodeLinkedList,
     BaseSinglyLinkedList,
+    NodePool,
+    _UNSHARED,
+    _import_numpy,
+    getrefcount,
 )
 from graph_examples.linked_lists.nodes import LinkedNode, DoublyLinkedNode, CircularLinkedNode, CircularDoublyLinkedNode
 from graph_examples.linked_lists.base_nodes import T
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class LinkedList(BaseLinearLinkedList[T], BaseSinglyLinkedList[T]):
-    def __init__(self, values: Iterable[T] = ()) -> None:
-        values_iter = iter(values)
-        try:
-            self.head = LinkedNode(next(values_iter))
-        except StopIteration:
-            self.head = None
-        node = self.head
-        for value in values_iter:
-            node.next = LinkedNode(value)
-            node = node.next
+    def __init__(self, values: Iterable[T] = (), *, skip_index: bool = False, indexed: bool = False) -> None:
+        self.skip_index = skip_index
+        self.head, _, self._size = LinkedNode._chain(values)
+        if indexed:
+            self._build_index()
 
     def appendleft(self, value: T) -> None:
-        self.head = LinkedNode(value, self.head)
+        node = LinkedNode(value, self.head)
+        if self._index is not None:
+            self._index_add(node, left=True)
+        self.head = node
+        self._size += 1
+        self._checkpoints = None
 
     def popleft(self) -> T:
         if not self:
             raise IndexError
         node = self.head
         self.head = node.next
+        self._size -= 1
+        self._checkpoints = None
+        if self._index is not None:
+            self._index_remove(node)
         return node.value
 
     def reverse(self) -> None:
@@ -41,84 +55,271 @@ class LinkedList(BaseLinearLinkedList[T], BaseSinglyLinkedList[T]):
         while node is not None:
             node.next, last_node, node = last_node, node, node.next
         self.head = last_node
+        self._checkpoints = None
+        if self._index is not None:
+            self._index_reverse()
 
+    def insert(self, index: int, value: T) -> None:
+        index = self._clamp_index(index)
+        if index == 0:
+            self.appendleft(value)
+            return
+        if self._index is not None:
+            hash(value)
+        last_node = self._node_at(index - 1)
+        node = last_node.next = LinkedNode(value, last_node.next)
+        self._size += 1
+        if node.next is None:
+            self._tail_added(node)
+        else:
+            self._checkpoints = None
+        if self._index is not None:
+            self._index_insert(node)  # After linking, since it walks from the head to the node
 
-class DoublyLinkedList(BaseLinearLinkedList[T], BaseDoublyLinkedList[T]):
-    def __init__(self, values: Iterable = ()) -> None:
-        values_iter = iter(values)
-        try:
-            self.head = DoublyLinkedNode(next(values_iter))
-        except StopIteration:
-            self.head = None
-        node = self.head
-        for value in values_iter:
-            node.next = DoublyLinkedNode(value, None, node)
-            node = node.next
-        self.tail = node
+    def _remove_at(self, index: int) -> T:
+        if index == 0:
+            return self.popleft()
+        return self._unlink_after(self._node_at(index - 1))
+
+    def _remove_positions(self, positions: range) -> None:
+        last_node = self._node_at(positions.start - 1) if positions.start else None
+        for i in range(len(positions)):
+            if i:
+                for _ in range(positions.step - 1):
+                    last_node = self.head if last_node is None else last_node.next
+            if last_node is None:
+                self.popleft()
+            else:
+                self._unlink_after(last_node)
+
+    def _splice(self, other: LinkedList[T], at: int) -> None:
+        other_tail = other.head
+        while other_tail.next is not None:
+            other_tail = other_tail.next
+        if at == 0:
+            other_tail.next, self.head = self.head, other.head
+        else:
+            last_node = self._node_at(at - 1)
+            other_tail.next, last_node.next = last_node.next, other.head
+
+    def _split(self, rest: LinkedList[T], index: int) -> None:
+        if index == 0:
+            rest.head, self.head = self.head, None
+        else:
+            last_node = self._node_at(index - 1)
+            rest.head, last_node.next = last_node.next, None
+
+    def _unlink(self, node: LinkedNode[T]) -> T:
+        if node is self.head:
+            return self.popleft()
+        last_node = self.head
+        while last_node.next is not node:
+            last_node = last_node.next
+        return self._unlink_after(last_node)
+
+    def _unlink_after(self, last_node: LinkedNode[T]) -> T:
+        node = last_node.next
+        last_node.next = node.next
+        self._size -= 1
+        if last_node.next is None:
+            self._tail_removed()
+        else:
+            self._checkpoints = None
+        if self._index is not None:
+            self._index_remove(node)
+        return node.value
+
+
+class DoublyLinkedList(BaseLinearLinkedList[T], BaseDoublyNodeLinkedList[T]):
+    _node_class = DoublyLinkedNode
+
+    def __init__(self, values: Iterable = (), *, skip_index: bool = False, indexed: bool = False,
+                 pool: Optional[NodePool[T]] = None) -> None:
+        self.skip_index = skip_index
+        self._set_pool(pool)
+        self.head, self.tail, self._size = DoublyLinkedNode._chain(values)
+        if indexed:
+            self._build_index()
+
+    def __iter__(self) -> Iterator[T]:
+        return self._backward() if self._reversed else super().__iter__()
 
     def __reversed__(self) -> Iterator[T]:
+        return super().__iter__() if self._reversed else self._backward()
+
+    def _backward(self) -> Iterator[T]:
         node = self.tail
         while node is not None:
             yield node.value
             node = node.last
 
     def append(self, value: T):
+        node = self._new_node(value)
+        if self._reversed:
+            self._link_head(node)
+        else:
+            self._link_tail(node)
+
+    def _link_tail(self, node: DoublyLinkedNode[T]) -> None:
+        """Link a node that isn't in any list as the new tail, which is the left side while reversed."""
+        if self._index is not None:
+            self._index_add(node)
         old_tail = self.tail
-        self.tail = DoublyLinkedNode(value, None, old_tail)
+        node.next, node.last = None, old_tail
+        self.tail = node
         if old_tail is None:
-            self.head = self.tail
+            self.head = node
         else:
-            old_tail.next = self.tail
+            old_tail.next = node
+        self._size += 1
+        self._tail_added(node)
 
     def appendleft(self, value: T):
+        node = self._new_node(value)
+        if self._reversed:
+            self._link_tail(node)
+        else:
+            self._link_head(node)
+
+    def _link_head(self, node: DoublyLinkedNode[T]) -> None:
+        """Link a node that isn't in any list as the new head, which is the right side while reversed."""
+        if self._index is not None:
+            self._index_add(node, left=True)
         old_head = self.head
-        self.head = DoublyLinkedNode(value, old_head)
+        node.next, node.last = old_head, None
+        self.head = node
         if old_head is None:
-            self.tail = self.head
+            self.tail = node
         else:
-            old_head.last = self.head
+            old_head.last = node
+        self._size += 1
+        self._checkpoints = None
 
     def pop(self) -> T:
         if not self:
             raise IndexError
+        return self._unlink_head() if self._reversed else self._unlink_tail()
+
+    def popleft(self) -> T:
+        if not self:
+            raise IndexError
+        return self._unlink_tail() if self._reversed else self._unlink_head()
+
+    def _unlink_tail(self) -> T:
         old_tail = self.tail
         self.tail = old_tail.last
+        old_tail.last = None
         if self.tail is None:
             self.head = None
         else:
             self.tail.next = None
-        return old_tail.value
+        self._size -= 1
+        self._tail_removed()
+        if self._index is not None:
+            self._index_remove(old_tail)
+        value = old_tail.value
+        if self._recycling and not self._live_handles and getrefcount(old_tail) <= _UNSHARED:
+            self.pool.release(old_tail)
+        return value
 
-    def popleft(self) -> T:
-        if not self:
-            raise IndexError
+    def _unlink_head(self) -> T:
         old_head = self.head
         self.head = old_head.next
+        old_head.next = None
         if self.head is None:
             self.tail = None
         else:
             self.head.last = None
-        return old_head.value
+        self._size -= 1
+        self._checkpoints = None
+        if self._index is not None:
+            self._index_remove(old_head)
+        value = old_head.value
+        if self._recycling and not self._live_handles and getrefcount(old_head) <= _UNSHARED:
+            self.pool.release(old_head)
+        return value
 
     def reverse(self) -> None:
+        """Reverse the list in O(1), by swapping which ends and links the other methods treat as left and right.
+
+        sort, split_at and splice relink the nodes to match first, in O(n) once. Reading never relinks.
+        """
+        self._reversed = not self._reversed
+
+    def _reverse_links(self) -> None:
         node = self.head
         self.head, self.tail = self.tail, self.head
         while node is not None:
             node.next, node.last, node = node.last, node.next, node.next
+        self._checkpoints = None
+        if self._index is not None:
+            self._index_reverse()
+
+    def insert(self, index: int, value: T) -> None:
+        index = self._clamp_index(index)
+        if index == 0:
+            self.appendleft(value)
+        elif index == self._size:
+            self.append(value)
+        else:
+            node = self._node_at(index)
+            if self._reversed:
+                self._link_after(node, self._new_node(value))
+            else:
+                self._link_before(node, self._new_node(value))
+
+    def clear(self) -> None:
+        self.tail = None
+        super().clear()
+
+    def _splice(self, other: DoublyLinkedList[T], at: int) -> None:
+        if at == self._size:
+            last_node, next_node, self.tail = self.tail, None, other.tail
+        else:
+            next_node = self._node_at(at)
+            last_node, next_node.last = next_node.last, other.tail
+        if last_node is None:
+            self.head = other.head
+        else:
+            last_node.next = other.head
+        other.head.last, other.tail.next = last_node, next_node
+
+    def _split(self, rest: DoublyLinkedList[T], index: int) -> None:
+        node = self._node_at(index)
+        rest.head, rest.tail, self.tail = node, self.tail, node.last
+        if self.tail is None:
+            self.head = None
+        else:
+            self.tail.next = node.last = None
+
+    def _remove_at(self, index: int) -> T:
+        return self._unlink(self._node_at(index))
+
+    def _unlink(self, node: DoublyLinkedNode[T]) -> T:
+        if node is self.head:
+            return self._unlink_head()
+        if node is self.tail:
+            return self._unlink_tail()
+        node.last.next, node.next.last = node.next, node.last
+        node.next = node.last = None
+        self._size -= 1
+        self._checkpoints = None
+        if self._index is not None:
+            self._index_remove(node)
+        return node.value
+
+    def _linked(self, node: DoublyLinkedNode[T]) -> bool:
+        return node.last is not None or node is self.head
 
 
 class CircularLinkedList(BaseCircularLinkedList[T], BaseSinglyLinkedList[T]):
-    def __init__(self, values: Iterable[T] = ()):
-        values_iter = iter(values)
-        try:
-            head = CircularLinkedNode(next(values_iter))
-        except StopIteration:
-            head = None
-        node = head
-        for value in values_iter:
-            node.next = CircularLinkedNode(value, head)
-            node = node.next
-        self.tail = node
+    def __init__(self, values: Iterable[T] = (), *, skip_index: bool = False, indexed: bool = False) -> None:
+        self.skip_index = skip_index
+        head, self.tail, self._size = CircularLinkedNode._chain(values)
+        if head is not None:
+            self.tail.next = head
+        if indexed:
+            self._build_index()
 
     @property
     def head(self) -> CircularLinkedNode[T]:
@@ -129,10 +330,15 @@ class CircularLinkedList(BaseCircularLinkedList[T], BaseSinglyLinkedList[T]):
         self.tail.next = node
 
     def appendleft(self, value: T) -> None:
+        node = CircularLinkedNode(value, self.head if self else None)
+        if self._index is not None:
+            self._index_add(node, left=True)
         if not self:
-            self.tail = CircularLinkedNode(value)
+            self.tail = node
         else:
-            self.head = CircularLinkedNode(value, self.head)
+            self.head = node
+        self._size += 1
+        self._checkpoints = None
 
     def reverse(self) -> None:
         if not self:
@@ -142,30 +348,108 @@ class CircularLinkedList(BaseCircularLinkedList[T], BaseSinglyLinkedList[T]):
         while node is not self.tail:
             node.next, last_node, node = last_node, node, node.next
         self.tail.next, self.tail = last_node, self.head
+        self._checkpoints = None
+        if self._index is not None:
+            self._index_reverse()
+
+    def insert(self, index: int, value: T) -> None:
+        index = self._clamp_index(index)
+        if index == 0:
+            self.appendleft(value)
+            return
+        if self._index is not None:
+            hash(value)
+        last_node = self._node_at(index - 1)
+        node = last_node.next = CircularLinkedNode(value, last_node.next)
+        self._size += 1
+        if last_node is self.tail:
+            self.tail = node
+            self._tail_added(node)
+        else:
+            self._checkpoints = None
+        if self._index is not None:
+            self._index_insert(node)  # After linking, since it walks from the head to the node
+
+    def _remove_at(self, index: int) -> T:
+        return self._unlink_after(self._node_at(index - 1) if index else self.tail)
 
+    def _remove_positions(self, positions: range) -> None:
+        last_node = self._node_at(positions.start - 1) if positions.start else self.tail
+        for i in range(len(positions)):
+            if i:
+                for _ in range(positions.step - 1):
+                    last_node = last_node.next
+            self._unlink_after(last_node)
 
-class CircularDoublyLinkedList(BaseCircularLinkedList[T], BaseDoublyLinkedList[T]):
+    def _splice(self, other: CircularLinkedList[T], at: int) -> None:
+        if not self:
+            self.tail = other.tail
+            return
+        last_node = self.tail if at in (0, self._size) else self._node_at(at - 1)
+        other.tail.next, last_node.next = last_node.next, other.head
+        if at == self._size:
+            self.tail = other.tail
+
+    def _split(self, rest: CircularLinkedList[T], index: int) -> None:
+        if index == 0:
+            rest.tail, self.tail = self.tail, None
+            return
+        last_node = self._node_at(index - 1)
+        head = self.head
+        rest.tail = self.tail
+        rest.tail.next, last_node.next = last_node.next, head
+        self.tail = last_node
+
+    def _unlink(self, node: CircularLinkedNode[T]) -> T:
+        last_node = self.tail
+        while last_node.next is not node:
+            last_node = last_node.next
+        return self._unlink_after(last_node)
+
+    def _unlink_after(self, last_node: CircularLinkedNode[T]) -> T:
+        node = last_node.next
+        self._size -= 1
+        if node is last_node:
+            self.tail = None
+            self._checkpoints = None
+        else:
+            last_node.next = node.next
+            if node is self.tail:
+                self.tail = last_node
+                self._tail_removed()
+            else:
+                self._checkpoints = None
+        if self._index is not None:
+            self._index_remove(node)
+        return node.value
+
+
+class CircularDoublyLinkedList(BaseCircularLinkedList[T], BaseDoublyNodeLinkedList[T]):
     tail: Optional[CircularDoublyLinkedNode[T]]
     head: Optional[CircularDoublyLinkedNode[T]]
+    _node_class = CircularDoublyLinkedNode
 
-    def __init__(self, values: Iterable[T] = ()) -> None:
-        values_iter = iter(values)
-        try:
-            head = CircularDoublyLinkedNode(next(values_iter))
-        except StopIteration:
-            head = None
-        node = head
-        for value in values_iter:
-            node.next = CircularDoublyLinkedNode(value, head, node)
-            node = node.next
-            head.last = node
-        self.tail = node
+    def __init__(self, values: Iterable[T] = (), *, skip_index: bool = False, indexed: bool = False,
+                 pool: Optional[NodePool[T]] = None) -> None:
+        self.skip_index = skip_index
+        self._set_pool(pool)
+        head, self.tail, self._size = CircularDoublyLinkedNode._chain(values)
+        if head is not None:
+            self.tail.next, head.last = head, self.tail
+        if indexed:
+            self._build_index()
 
     @property
     def head(self) -> CircularDoublyLinkedNode[T]:
         return self.tail.next
 
+    def __iter__(self) -> Iterator[T]:
+        return self._backward() if self._reversed else super().__iter__()
+
     def __reversed__(self) -> Iterator[T]:
+        return super().__iter__() if self._reversed else self._backward()
+
+    def _backward(self) -> Iterator[T]:
         if not self:
             return
         yield self.tail.value
@@ -174,46 +458,559 @@ class CircularDoublyLinkedList(BaseCircularLinkedList[T], BaseDoublyLinkedList[T
             yield node.value
             node = node.last
 
-    def append(self, value: T) -> None:
+    def _link_after_tail(self, node: CircularDoublyLinkedNode[T]) -> None:
         if not self:
-            self.tail = CircularDoublyLinkedNode(value)
+            node.next = node.last = self.tail = node
         else:
-            self.tail = CircularDoublyLinkedNode(value, self.head, self.tail)
-            self.tail.last.next = self.tail
-            self.head.last = self.tail
+            head = self.head
+            node.next, node.last = head, self.tail
+            self.tail.next = head.last = node
+        self._size += 1
+
+    def append(self, value: T) -> None:
+        node = self._new_node(value)
+        if self._reversed:
+            self._link_head(node)
+        else:
+            self._link_tail(node)
+
+    def _link_tail(self, node: CircularDoublyLinkedNode[T]) -> None:
+        if self._index is not None:
+            self._index_add(node)
+        self._link_after_tail(node)
+        self.tail = node
+        self._tail_added(node)
 
     def appendleft(self, value: T) -> None:
-        if not self:
-            self.tail = CircularDoublyLinkedNode(value)
+        node = self._new_node(value)
+        if self._reversed:
+            self._link_tail(node)
         else:
-            self.tail.next = CircularDoublyLinkedNode(value, self.head, self.tail)
-            self.head.next.last = self.tail.next
+            self._link_head(node)
+
+    def _link_head(self, node: CircularDoublyLinkedNode[T]) -> None:
+        if self._index is not None:
+            self._index_add(node, left=True)
+        self._link_after_tail(node)
+        self._checkpoints = None
 
     def pop(self) -> T:
         if not self:
             raise IndexError
-        value = self.tail.value
-        if self.tail is self.head:
-            self.tail = None
-        else:
-            self.tail.last.next, self.head.last, self.tail = self.head, self.tail.last, self.tail.last
+        node = self.head if self._reversed else self.tail
+        value = self._unlink(node)
+        if self._recycling and not self._live_handles and getrefcount(node) <= _UNSHARED:
+            self.pool.release(node)
         return value
 
     def popleft(self) -> T:
         if not self:
             raise IndexError
-        value = self.head.value
-        if self.tail is self.head:
-            self.tail = None
-        else:
-            self.tail.next = self.tail.next.next
-            self.tail.next.last = self.tail
+        node = self.tail if self._reversed else self.head
+        value = self._unlink(node)
+        if self._recycling and not self._live_handles and getrefcount(node) <= _UNSHARED:
+            self.pool.release(node)
         return value
 
     def reverse(self) -> None:
+        """Reverse the list in O(1), by swapping which ends and links the other methods treat as left and right.
+
+        sort, split_at and splice relink the nodes to match first, in O(n) once. Reading never relinks.
+        """
+        self._reversed = not self._reversed
+
+    def _reverse_links(self) -> None:
         if not self:
             return
         node = self.head
         while node is not self.tail:
             node.next, node.last, node = node.last, node.next, node.next
         self.tail.next, self.tail.last, self.tail = self.tail.last, self.tail.next, self.tail.next
+        self._checkpoints = None
+        if self._index is not None:
+            self._index_reverse()
+
+    def insert(self, index: int, value: T) -> None:
+        index = self._clamp_index(index)
+        if index == 0:
+            self.appendleft(value)
+        elif index == self._size:
+            self.append(value)
+        else:
+            node = self._node_at(index)
+            if self._reversed:
+                self._link_after(node, self._new_node(value))
+            else:
+                self._link_before(node, self._new_node(value))
+
+    def _splice(self, other: CircularDoublyLinkedList[T], at: int) -> None:
+        if not self:
+            self.tail = other.tail
+            return
+        next_node = self.head if at in (0, self._size) else self._node_at(at)
+        last_node, other_head = next_node.last, other.head
+        last_node.next, other_head.last = other_head, last_node
+        other.tail.next, next_node.last = next_node, other.tail
+        if at == self._size:
+            self.tail = other.tail
+
+    def _split(self, rest: CircularDoublyLinkedList[T], index: int) -> None:
+        if index == 0:
+            rest.tail, self.tail = self.tail, None
+            return
+        node = self._node_at(index)
+        head, last_node = self.head, node.last
+        rest.tail = self.tail
+        rest.tail.next, node.last = node, rest.tail
+        last_node.next, head.last = head, last_node
+        self.tail = last_node
+
+    def _remove_at(self, index: int) -> T:
+        return self._unlink(self._node_at(index))
+
+    def _unlink(self, node: CircularDoublyLinkedNode[T]) -> T:
+        self._size -= 1
+        if node is node.next:
+            self.tail = None
+            self._checkpoints = None
+        else:
+            node.last.next, node.next.last = node.next, node.last
+            if node is self.tail:
+                self.tail = node.last
+                self._tail_removed()
+            else:
+                self._checkpoints = None
+        if self._index is not None:
+            self._index_remove(node)
+        node.next = node.last = None
+        return node.value
+
+    def _linked(self, node: CircularDoublyLinkedNode[T]) -> bool:
+        return node.next is not None
+
+
+NIL = -1  # The null index for ArrayDoublyLinkedList
+
+
+class ArrayDoublyLinkedList(BaseDoublyLinkedList[T]):
+    """A doubly linked list that links slots in parallel arrays instead of node objects.
+
+    Slot i holds its value at values[i] and the indices of its neighbors at next[i] and last[i], with NIL as the null
+    index. The index arrays are typed arrays, so no Python object is allocated per element and the garbage collector
+    has nothing to traverse besides the values. Popped slots go on a free list and are reused by later appends.
+    """
+
+    def __init__(self, values: Iterable[T] = ()) -> None:
+        self._values = list(values)
+        self._link_in_order()
+
+    def _link_in_order(self) -> None:
+        """Link every slot of the values in order, from the head at slot 0, with none free."""
+        size = len(self._values)
+        self._next = array('q', range(1, size + 1))
+        self._last = array('q', range(-1, size - 1))
+        self._free: list[int] = []
+        self._size = size
+        if size:
+            self._next[-1] = NIL
+            self._head, self._tail = 0, size - 1
+        else:
+            self._head = self._tail = NIL
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        values, next_ = self._values, self._next
+        index = self._head
+        while index != NIL:
+            yield values[index]
+            index = next_[index]
+
+    def __reversed__(self) -> Iterator[T]:
+        values, last = self._values, self._last
+        index = self._tail
+        while index != NIL:
+            yield values[index]
+            index = last[index]
+
+    def __contains__(self, value: T) -> bool:
+        if not self._free:
+            # Every slot is in use, so the order doesn't matter and the scan can be done in C.
+            return value in self._values
+        return any(x == value for x in self)
+
+    def _allocate(self, value: T) -> int:
+        if self._free:
+            index = self._free[-1]
+            self._values[index] = value
+            self._free.pop()  # Only once the value is stored, in case storing it raises
+        else:
+            index = len(self._values)
+            self._values.append(value)
+            self._next.append(NIL)
+            self._last.append(NIL)
+        self._size += 1
+        return index
+
+    def _release(self, index: int) -> T:
+        value = self._values[index]
+        self._values[index] = None  # Don't keep the value alive from a free slot
+        self._free.append(index)
+        self._size -= 1
+        return value
+
+    def append(self, value: T) -> None:
+        index = self._allocate(value)
+        self._next[index] = NIL
+        self._last[index] = self._tail
+        if self._tail == NIL:
+            self._head = index
+        else:
+            self._next[self._tail] = index
+        self._tail = index
+
+    def appendleft(self, value: T) -> None:
+        index = self._allocate(value)
+        self._next[index] = self._head
+        self._last[index] = NIL
+        if self._head == NIL:
+            self._tail = index
+        else:
+            self._last[self._head] = index
+        self._head = index
+
+    def pop(self) -> T:
+        if not self._size:
+            raise IndexError
+        index = self._tail
+        self._tail = self._last[index]
+        if self._tail == NIL:
+            self._head = NIL
+        else:
+            self._next[self._tail] = NIL
+        return self._release(index)
+
+    def popleft(self) -> T:
+        if not self._size:
+            raise IndexError
+        index = self._head
+        self._head = self._next[index]
+        if self._head == NIL:
+            self._tail = NIL
+        else:
+            self._last[self._head] = NIL
+        return self._release(index)
+
+    def reverse(self) -> None:
+        """Reverse the list in O(1) by swapping the roles of the next and last arrays."""
+        self._next, self._last = self._last, self._next
+        self._head, self._tail = self._tail, self._head
+
+    def sort(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        """Sort the values stably in place with list.sort, then relink the slots in order, emptying the free list.
+
+        The values are first moved into slots 0 to n - 1 in order, within the values list itself, so the only other
+        memory the sort takes is what list.sort does.
+        """
+        self._move_into_order()
+        try:
+            self._values.sort(key=key, reverse=reverse)
+        finally:
+            self._next = self._last = None  # Let the old links go before making the new ones
+            self._link_in_order()
+
+    def _move_into_order(self) -> None:
+        """Move the values into slots 0 to n - 1 in the order of the list, in place, and drop the free slots.
+
+        This takes O(n) swaps and overwrites the last array, so the links have to be made again after.
+        """
+        values, next_ = self._values, self._next
+        target = self._last  # Reused for where the value of each slot goes, as neither link survives this
+        slot = self._head
+        for position in range(self._size):
+            target[slot] = position
+            slot = next_[slot]
+        for position, slot in enumerate(self._free, self._size):
+            target[slot] = position
+        for slot in range(len(values)):
+            position = target[slot]
+            while position != slot:  # Follow the cycle of moves through slot, placing one value per swap
+                values[slot], values[position] = values[position], values[slot]
+                target[slot], target[position] = target[position], position
+                position = target[slot]
+        del values[self._size:]
+
+    def _assign_values(self, values: list[T]) -> None:
+        slot_values, next_ = self._values, self._next
+        index = self._head
+        for value in values:
+            slot_values[index] = value
+            index = next_[index]
+
+
+class TypedArrayDoublyLinkedList(ArrayDoublyLinkedList[T]):
+    """An ArrayDoublyLinkedList of numbers, stored unboxed in a typed array instead of a list of objects.
+
+    typecode is an array module typecode, like 'q' for 64-bit ints or 'd' for doubles, and values are converted and
+    checked like an array does, so a value of the wrong type raises TypeError or OverflowError and isn't added. A
+    slot takes the typecode's item size for its value plus 16 bytes for its links, which for doubles is 24 bytes per
+    value instead of about 48 for an ArrayDoublyLinkedList and 80 for a DoublyLinkedList.
+
+    The list is compact when slot i holds the value at position i and there are no free slots, so that the typed
+    array is the values in order and view can export it without copying. Appending, and popping the last slot, keep
+    the list compact. appendleft, popleft and reverse generally don't, and compact() restores the order in O(n).
+    """
+
+    def __init__(self, values: Iterable[T] = (), typecode: str = 'q') -> None:
+        self.typecode = typecode
+        self._values = array(typecode, values)
+        self._link_in_order()
+        self._compact = True
+
+    def __getstate__(self) -> dict[str, object]:
+        return {**super().__getstate__(), 'typecode': self.typecode}
+
+    @property
+    def is_compact(self) -> bool:
+        return self._compact
+
+    def view(self) -> memoryview:
+        """Get a zero-copy memoryview of the values in order, whose format is the typecode.
+
+        Like with an array, the values can't be resized while a view of them is alive, so appending to a list without
+        free slots raises BufferError until the view is released, with view.release() or a with block.
+
+        Raises:
+            ValueError: If the list isn't compact.
+        """
+        if not self._compact:
+            raise ValueError('the list is not compact, call compact() first')
+        return memoryview(self._values)
+
+    def compact(self) -> None:
+        """Move the values into slots 0 to n - 1 in order, dropping the free slots, unless the list is compact."""
+        if not self._compact:
+            self.__init__(self, self.typecode)
+
+    def to_numpy(self, dtype: Any = None) -> numpy.ndarray:
+        """Copy the values into a new 1-D array, straight from the typed array if the list is compact."""
+        if self._compact:
+            return _import_numpy().array(self._values, dtype)
+        return super().to_numpy(dtype)
+
+    def _release(self, index: int) -> T:
+        value = self._values[index]
+        if index == len(self._values) - 1:
+            try:
+                self._values.pop()  # Shrink instead of freeing the last slot, which keeps a compact list compact
+            except BufferError:
+                pass  # A view of the values is alive, so free the slot instead
+            else:
+                self._next.pop()
+                self._last.pop()
+                self._size -= 1
+                return value
+        self._free.append(index)
+        self._size -= 1
+        self._compact = False
+        return value
+
+    def appendleft(self, value: T) -> None:
+        super().appendleft(value)
+        self._compact = self._compact and self._size == 1
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._compact = self._compact and self._size <= 1
+
+    def sort(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        """Sort the values stably with list.sort, then write them into slots 0 to n - 1 in order."""
+        self.__init__(sorted(self, key=key, reverse=reverse), self.typecode)
+
+    def _assign_values(self, values: list[T]) -> None:
+        values = array(self.typecode, values)  # Convert them all first, so a bad value changes nothing
+        if self._compact:
+            self._values[:] = values
+        else:
+            super()._assign_values(values)
+
+
+class _Block:
+    """A fixed capacity block of values for UnrolledLinkedList. The values in use are values[start:stop]."""
+    __slots__ = ('values', 'start', 'stop', 'next', 'last')
+
+    def __init__(self, capacity: int, start: int, next_: Optional[_Block] = None,
+                 last: Optional[_Block] = None) -> None:
+        self.values = [None] * capacity
+        self.start = self.stop = start
+        self.next = next_
+        self.last = last
+
+
+class UnrolledLinkedList(BaseDoublyLinkedList[T]):
+    """A doubly linked list of blocks, each holding up to block_size values.
+
+    Operations at both ends are amortized O(1), while iteration and __contains__ only follow one link per block. Only
+    the head and tail blocks can be partly filled. The list always has at least one block, which is only empty when the
+    list is. One emptied block is kept as a spare, so pushing and popping across a block boundary doesn't allocate.
+    """
+
+    def __init__(self, values: Iterable[T] = (), block_size: int = 64) -> None:
+        if block_size < 1:
+            raise ValueError('block_size must be at least 1')
+        self.block_size = block_size
+        self._head = self._tail = _Block(block_size, 0)
+        self._spare: Optional[_Block] = None
+        self._size = 0
+        values_iter = iter(values)
+        block = self._tail
+        while True:
+            chunk = list(islice(values_iter, block_size))
+            block.values[:len(chunk)] = chunk
+            block.stop = len(chunk)
+            self._size += len(chunk)
+            if len(chunk) < block_size:
+                break
+            block.next = _Block(block_size, 0, None, block)
+            block = block.next
+        if block.stop == 0 and block.last is not None:  # The input ended exactly on a block boundary
+            block = block.last
+            block.next = None
+        self._tail = block
+
+    def __getstate__(self) -> dict[str, object]:
+        return {**super().__getstate__(), 'block_size': self.block_size}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        block = self._head
+        while block is not None:
+            yield from block.values[block.start:block.stop]
+            block = block.next
+
+    def __reversed__(self) -> Iterator[T]:
+        block = self._tail
+        while block is not None:
+            yield from reversed(block.values[block.start:block.stop])
+            block = block.last
+
+    def __contains__(self, value: T) -> bool:
+        block = self._head
+        while block is not None:
+            if value in block.values[block.start:block.stop]:
+                return True
+            block = block.next
+        return False
+
+    def _new_block(self, start: int, next_: Optional[_Block], last: Optional[_Block]) -> _Block:
+        block = self._spare
+        if block is None:
+            return _Block(self.block_size, start, next_, last)
+        self._spare = None
+        block.start = block.stop = start
+        block.next, block.last = next_, last
+        return block
+
+    def append(self, value: T) -> None:
+        block = self._tail
+        if block.stop == self.block_size:
+            if self._size:
+                block.next = block = self._tail = self._new_block(0, None, block)
+            else:
+                block.start = block.stop = 0
+        block.values[block.stop] = value
+        block.stop += 1
+        self._size += 1
+
+    def appendleft(self, value: T) -> None:
+        block = self._head
+        if block.start == 0:
+            if self._size:
+                block.last = block = self._head = self._new_block(self.block_size, block, None)
+            else:
+                block.start = block.stop = self.block_size
+        block.start -= 1
+        block.values[block.start] = value
+        self._size += 1
+
+    def pop(self) -> T:
+        if not self._size:
+            raise IndexError
+        block = self._tail
+        block.stop -= 1
+        value = block.values[block.stop]
+        block.values[block.stop] = None
+        self._size -= 1
+        if block.start == block.stop and block.last is not None:
+            self._tail = block.last
+            self._tail.next = block.last = None
+            self._spare = block
+        return value
+
+    def popleft(self) -> T:
+        if not self._size:
+            raise IndexError
+        block = self._head
+        value = block.values[block.start]
+        block.values[block.start] = None
+        block.start += 1
+        self._size -= 1
+        if block.start == block.stop and block.next is not None:
+            self._head = block.next
+            self._head.last = block.next = None
+            self._spare = block
+        return value
+
+    def reverse(self) -> None:
+        block = self._head
+        while block is not None:
+            block.values.reverse()
+            block.start, block.stop = self.block_size - block.stop, self.block_size - block.start
+            block.next, block.last = block.last, block.next
+            block = block.last
+        self._head, self._tail = self._tail, self._head
+
+    def sort(self, key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        """Sort the values stably in place with list.sort, moving them out of the blocks and back a block at a time.
+
+        Each block is freed as its values move into one list, and the blocks are made again from the end of the sorted
+        list as it shrinks, so the values are never in both full blocks and a full list. If the key or a comparison
+        raises, the list keeps all of its values, in some order.
+        """
+        values: list[T] = []
+        block = self._head
+        while block is not None:
+            values += block.values[block.start:block.stop]
+            block.values = None
+            block = block.next
+        try:
+            values.sort(key=key, reverse=reverse)
+        finally:
+            self._fill_from_end(values)
+
+    def _fill_from_end(self, values: list[T]) -> None:
+        """Replace the blocks with new ones holding values, which are taken off the end of the list, emptying it."""
+        block_size = self.block_size
+        self._size = len(values)
+        self._spare = None
+        self._tail = block = _Block(block_size, 0)
+        block.stop = len(values) % block_size or min(len(values), block_size)
+        if block.stop:
+            block.values[:block.stop] = values[-block.stop:]
+            del values[-block.stop:]
+        while values:
+            block.last = block = _Block(block_size, 0, block)
+            block.values[:] = values[-block_size:]
+            block.stop = block_size
+            del values[-block_size:]
+        self._head = block
+
+    def _assign_values(self, values: list[T]) -> None:
+        values = iter(values)
+        block = self._head
+        while block is not None:
+            block.values[block.start:block.stop] = islice(values, block.stop - block.start)
+            block = block.next
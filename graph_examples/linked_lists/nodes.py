@@ -8,21 +8,24 @@ from collections.abc import Iterable, Iterator
 from typing import Optional, Type, TypeVar
 
 from graph_examples.linked_lists.base_nodes import (
+    BaseLinkedNode,
     BaseLinearLinkedNode,
     BaseDoublyLinkedNode,
     BaseCircularLinkedNode,
     BaseSinglyLinkedNode,
     T,
+    _PLAIN_INITS,
 )
 
 
 class LinkedNode(BaseSinglyLinkedNode[T], BaseLinearLinkedNode[T]):
     """The most basic node on a linked list."""
+    __slots__ = ()
     next: Optional[LinkedNode[T]]
 
     @classmethod
     def from_iterable(cls: Type[LinkedNode], values: Iterable[T]) -> LinkedNode[T]:
-        """Recursively create a new list of nodes.
+        """Create a new list of nodes.
 
         Args:
             values: Any iterable that will populate the new list, preserving order.
@@ -30,13 +33,7 @@ class LinkedNode(BaseSinglyLinkedNode[T], BaseLinearLinkedNode[T]):
         Returns:
             The head of the new list.
         """
-        values_iter = iter(values)
-        try:
-            node = cls(next(values_iter))
-        except StopIteration:
-            return None  # Ends the recursion and assigns None as next for the last node
-        node.next = cls.from_iterable(values_iter)
-        return node
+        return cls._chain(values)[0]
 
     def appendleft(self, value) -> LinkedNode[T]:
         """Append to the left side of the list, which is also the 0th and head.
@@ -58,16 +55,211 @@ class LinkedNode(BaseSinglyLinkedNode[T], BaseLinearLinkedNode[T]):
         return self.next, self.value
 
     def reverse(self, last_node: Optional[LinkedNode[T]] = None) -> LinkedNode[T]:
-        """Recursively reverse the list.
+        """Reverse the list in place.
+
+        Args:
+            last_node: The node the old head should point to once it becomes the tail.
 
         Returns:
             The new head.
         """
-        next_node = self.next
-        self.next = last_node
-        if next_node is None:
-            return self  # We've hit the old tail, which is now the head.
-        return next_node.reverse(self)
+        node = self
+        while node is not None:
+            node.next, last_node, node = last_node, node, node.next
+        return last_node  # We've hit the old tail, which is now the head.
+
+
+class LazyLinkedNode(LinkedNode[T]):
+    """A LinkedNode whose next node is made from a source iterator the first time it's read.
+
+    from_iterable only takes the first value. Each node after that is made by pulling one value from the source when
+    the next of the node before it is first read, and then kept, so an unbounded stream can be treated as a linked
+    list while only the nodes that were reached and are still referenced are in memory. Iterating doesn't keep the
+    nodes it has passed alive, so iterating a stream from a node that nothing else refers to takes constant memory.
+
+    __contains__ stops pulling at the first match, while len, reverse, pickling and copying pull the whole source, so
+    they never return on an endless one. Setting next drops the rest of the source.
+    """
+    __slots__ = ('_source',)
+    _next = BaseLinkedNode.next  # The slot the next node is kept in, once it's made
+
+    def __init__(self, value: T, next_: Optional[LinkedNode[T]] = None, source: Optional[Iterator[T]] = None) -> None:
+        super().__init__(value, next_)
+        self._source = source
+
+    def __repr__(self) -> str:
+        if self._source is not None:
+            return f'{self.__class__.__name__}(value={repr(self.value)}, next=UNREAD)'
+        return super().__repr__()
+
+    @property
+    def next(self) -> Optional[LinkedNode[T]]:
+        source = self._source
+        if source is not None:
+            try:
+                node = self.__class__(next(source), None, source)
+            except StopIteration:
+                node = None
+            self._source = None
+            self._next = node
+        return self._next
+
+    @next.setter
+    def next(self, node: Optional[LinkedNode[T]]) -> None:
+        self._source = None
+        self._next = node
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T]) -> Optional[LazyLinkedNode[T]]:
+        """Create the head of a lazy list, taking only the first value.
+
+        Args:
+            values: Any iterable, which is consumed as the list is read and shouldn't be used elsewhere after.
+
+        Returns:
+            The head of the new list, or None if values is empty.
+        """
+        values_iter = iter(values)
+        try:
+            return cls(next(values_iter), None, values_iter)
+        except StopIteration:
+            return None
+
+    def __iter__(self) -> Iterator[T]:
+        node = self
+        del self  # Only hold the current node, so the ones already yielded can be freed
+        while node is not None:
+            yield node.value
+            node = node.next
+
+
+class FrozenLinkedNode(BaseSinglyLinkedNode[T], BaseLinearLinkedNode[T]):
+    """An immutable node on a linear singly linked list, so lists can safely share their tails.
+
+    Nothing changes a FrozenLinkedNode after it's made. appendleft makes a new head in front of the existing list
+    instead, which shares every node of it, popleft returns the next node, and reverse returns a reversed copy. Each
+    node keeps the length of the list from it, and its hash once computed, so len is O(1), and equality can say two
+    lists differ by their lengths or hashes in O(1) and stops at the first node they share.
+
+    The values should be hashable for hashing and interning. Passing the same table, any dict, to from_iterable and
+    appendleft interns the nodes: a node equal to one already in the table is taken from it, so lists with an equal
+    suffix share its nodes. The table keeps every node put in it alive.
+
+    Attributes:
+        value: The value that occupies this position in the list.
+        next: The next node in the list. None indicates no node.
+    """
+    __slots__ = ('_length', '_hash')
+    next: Optional[FrozenLinkedNode[T]]
+
+    def __init__(self, value: T, next_: Optional[FrozenLinkedNode[T]] = None) -> None:
+        if next_ is not None and not isinstance(next_, FrozenLinkedNode):
+            raise TypeError(f'next_ must be a FrozenLinkedNode, not {next_.__class__.__name__}')
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, 'next', next_)
+        object.__setattr__(self, '_length', 1 if next_ is None else next_._length + 1)
+        object.__setattr__(self, '_hash', None)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __setstate__(self, state: tuple[list[T], int]) -> None:
+        values, _ = state
+        next_ = None
+        for value in reversed(values[1:]):
+            next_ = self.__class__(value, next_)
+        self.__init__(values[0], next_)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            unhashed = []  # Hash from the first node with a cached hash back, so long lists don't recurse
+            node = self
+            while node is not None and node._hash is None:
+                unhashed.append(node)
+                node = node.next
+            next_hash = None if node is None else node._hash
+            for node in reversed(unhashed):
+                next_hash = hash((node.value, next_hash))
+                object.__setattr__(node, '_hash', next_hash)
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenLinkedNode):
+            return NotImplemented
+        if self._length != other._length:
+            return False
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        node = self
+        while node is not other:  # Equal lengths reach None together, and a shared node means a shared rest
+            if node.value != other.value:
+                return False
+            node, other = node.next, other.next
+        return True
+
+    @classmethod
+    def _cons(cls, value: T, next_: Optional[FrozenLinkedNode[T]],
+              table: Optional[dict[FrozenLinkedNode[T], FrozenLinkedNode[T]]]) -> FrozenLinkedNode[T]:
+        node = cls(value, next_)
+        return node if table is None else table.setdefault(node, node)
+
+    @classmethod
+    def from_iterable(
+            cls,
+            values: Iterable[T],
+            table: Optional[dict[FrozenLinkedNode[T], FrozenLinkedNode[T]]] = None
+    ) -> Optional[FrozenLinkedNode[T]]:
+        """Create a new list of nodes.
+
+        Args:
+            values: Any iterable that will populate the new list, preserving order.
+            table: The table to intern the nodes in, if any.
+
+        Returns:
+            The head of the new list.
+        """
+        head = None
+        for value in reversed(list(values)):
+            head = cls._cons(value, head, table)
+        return head
+
+    def appendleft(self, value: T,
+                   table: Optional[dict[FrozenLinkedNode[T], FrozenLinkedNode[T]]] = None) -> FrozenLinkedNode[T]:
+        """Make a new head in front of this list, which is left as it was.
+
+        Args:
+            value: The value that goes on the new head.
+            table: The table to intern the new head in, if any.
+
+        Returns:
+            The new head, whose next is this node.
+        """
+        return self._cons(value, self, table)
+
+    def popleft(self) -> tuple[Optional[FrozenLinkedNode[T]], T]:
+        """Get the rest of the list, which is left as it was.
+
+        Returns:
+            A tuple of (next node, value of this node).
+        """
+        return self.next, self.value
+
+    def reverse(self) -> FrozenLinkedNode[T]:
+        """Make a reversed copy of the list, since this one can't change.
+
+        Returns:
+            The head of the copy.
+        """
+        head = None
+        for value in self:
+            head = self.__class__(value, head)
+        return head
 
 
 class DoublyLinkedNode(BaseDoublyLinkedNode[T], BaseLinearLinkedNode[T]):
@@ -77,27 +269,28 @@ class DoublyLinkedNode(BaseDoublyLinkedNode[T], BaseLinearLinkedNode[T]):
     Left side operations (appendleft, popleft, __iter__, reverse) are done from the head.
     Right side operations (append, pop, __reversed__) are done from the tail.
     """
+    __slots__ = ()
     next: Optional[DoublyLinkedNode[T]]
     last: Optional[DoublyLinkedNode[T]]
 
     @classmethod
     def from_iterable(cls, values: Iterable[T], last: Optional[DoublyLinkedNode] = None) -> Optional[DoublyLinkedNode[T]]:
-        """Recursively create a new list of nodes.
+        """Create a new list of nodes.
 
         Args:
             values: Any iterable that will populate the new list, preserving order.
-            last: The previous node that was created. This is needed to assign last on the new nodes.
+            last: The node that comes before the new head. Only the new head's last is assigned to it.
 
         Returns:
             The head of the new list.
         """
-        values_iter = iter(values)
-        try:
-            node = cls(next(values_iter), None, last)
-        except StopIteration:
-            return None
-        node.next = cls.from_iterable(values_iter, node)
-        return node
+        return cls._chain(values, last)[0]
+
+    def _chain_values(self) -> tuple[list[T], int]:
+        head, position = self, 0
+        while head.last is not None:
+            head, position = head.last, position + 1
+        return list(head), position
 
     @property
     def tail(self) -> DoublyLinkedNode[T]:
@@ -106,17 +299,19 @@ class DoublyLinkedNode(BaseDoublyLinkedNode[T], BaseLinearLinkedNode[T]):
         Returns:
             The tail of the list of nodes
         """
-        if self.next is None:
-            return self
-        return self.next.tail
+        node = self
+        while node.next is not None:
+            node = node.next
+        return node
 
     def __reversed__(self) -> Iterator[T]:
         """Yields:
             The values from this node to the head, backwards.
         """
-        yield self.value
-        if self.last is not None:
-            yield from reversed(self.last)
+        node = self
+        while node is not None:
+            yield node.value
+            node = node.last
 
     def append(self, value: T) -> DoublyLinkedNode[T]:
         """This should be called from the tail and appends to the ride side of the list.
@@ -163,30 +358,32 @@ class DoublyLinkedNode(BaseDoublyLinkedNode[T], BaseLinearLinkedNode[T]):
         return self.next, self.value
 
     def reverse(self) -> DoublyLinkedNode[T]:
-        """Recursively reverse the list. Call from the head.
+        """Reverse the list in place. Call from the head.
 
         Returns:
             The new head.
         """
-        self.next, self.last = self.last, self.next
-        if self.last is None:
-            return self
-        return self.last.reverse()
+        node = self
+        while True:
+            node.next, node.last = node.last, node.next
+            if node.last is None:
+                return node
+            node = node.last
 
 
 class CircularLinkedNode(BaseSinglyLinkedNode[T], BaseCircularLinkedNode[T]):
+    __slots__ = ()
     next: CircularLinkedNode[T]
 
     @classmethod
     def from_iterable(cls, values: Iterable[T], head=None, last_node=None) -> Optional[CircularLinkedNode[T]]:
-        values_iter = iter(values)
-        try:
-            node = cls(next(values_iter), head)
-            if last_node is not None:
-                last_node.next = node
-            return cls.from_iterable(values_iter, node if head is None else head, node)
-        except StopIteration:
+        first, tail, _ = cls._chain(values)
+        if first is None:
             return last_node
+        if last_node is not None:
+            last_node.next = first
+        tail.next = first if head is None else head
+        return tail
 
     def appendleft(self, value: T) -> CircularLinkedNode[T]:
         self.next = CircularLinkedNode(value, self.next)
@@ -202,14 +399,19 @@ class CircularLinkedNode(BaseSinglyLinkedNode[T], BaseCircularLinkedNode[T]):
 
     def reverse(self, last_node: Optional[CircularLinkedNode] = None,
                 tail: Optional[CircularLinkedNode] = None) -> CircularLinkedNode[T]:
-        next_node = self.next
-        self.next = last_node
-        if next_node is None:
-            return tail
-        return next_node.reverse(self, next_node if tail is None else tail)
+        node = self
+        while True:
+            next_node = node.next
+            node.next = last_node
+            if next_node is None:
+                return tail
+            if tail is None:
+                tail = next_node
+            last_node, node = node, next_node
 
 
 class CircularDoublyLinkedNode(BaseDoublyLinkedNode[T], BaseCircularLinkedNode[T]):
+    __slots__ = ()
     next: CircularDoublyLinkedNode[T]
     last: CircularDoublyLinkedNode[T]
 
@@ -219,21 +421,21 @@ class CircularDoublyLinkedNode(BaseDoublyLinkedNode[T], BaseCircularLinkedNode[T
             next_: Optional[CircularDoublyLinkedNode] = None,
             last: Optional[CircularDoublyLinkedNode] = None
     ) -> None:
-        next_ = next_ if next is not None else self
-        last = last if last is not None else self
-        super().__init__(value, next_, last)
+        self.value = value
+        self.next = self if next_ is None else next_
+        self.last = self if last is None else last
 
     @classmethod
     def from_iterable(cls, values: Iterable[T], head=None, last_node=None) -> Optional[CircularDoublyLinkedNode[T]]:
-        values_iter = iter(values)
-        try:
-            node = cls(next(values_iter), head, last_node)
-            if last_node is not None:
-                last_node.next = node
-                head.last = node
-            return cls.from_iterable(values_iter, node if head is None else head, node)
-        except StopIteration:
+        first, tail, _ = cls._chain(values, last_node)
+        if first is None:
             return last_node
+        if head is None:
+            head = first
+        if last_node is not None:
+            last_node.next = first
+        tail.next, head.last = head, tail
+        return tail
 
     @property
     def tail(self):
@@ -242,8 +444,13 @@ class CircularDoublyLinkedNode(BaseDoublyLinkedNode[T], BaseCircularLinkedNode[T
     def __reversed__(self, tail: Optional[CircularDoublyLinkedNode] = None) -> Iterator:
         if self is tail:
             return
-        yield self.value
-        yield from self.last.__reversed__(self if tail is None else tail)
+        tail = self if tail is None else tail
+        node = self
+        while True:
+            yield node.value
+            node = node.last
+            if node is tail:
+                return
 
     def append(self, value: T) -> CircularDoublyLinkedNode[T]:
         self.next = CircularDoublyLinkedNode(value, self.next, self)
@@ -274,7 +481,13 @@ class CircularDoublyLinkedNode(BaseDoublyLinkedNode[T], BaseCircularLinkedNode[T
             return self, value
 
     def reverse(self, head: Optional[CircularDoublyLinkedNode] = None) -> CircularDoublyLinkedNode:
-        if self is head:
-            return self.last
-        self.next, self.last = self.last, self.next
-        return self.last.reverse(self if head is None else head)
+        node = self
+        while node is not head:
+            node.next, node.last = node.last, node.next
+            if head is None:
+                head = node
+            node = node.last
+        return node.last
+
+
+_PLAIN_INITS.add(CircularDoublyLinkedNode.__init__)
@@ -0,0 +1,284 @@
+"""A doubly linked list of bytes kept in memory-mapped files, so it survives restarts and can be larger than RAM."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator
+from mmap import mmap
+from struct import Struct
+from typing import Union
+from zlib import crc32
+
+from graph_examples.linked_lists.base_lists import BaseDoublyLinkedList
+from graph_examples.linked_lists.lists import NIL
+
+MAGIC = b'LLMAP\x00\x00\x01'
+# sequence, head, tail, size, free_top, free_second, records, heap_end, reversed
+_HEADER = Struct('<Q7q?')
+_CHECKSUM = Struct('<I')
+_SLOT_SIZE = _HEADER.size + _CHECKSUM.size
+_RECORD = Struct('<4q')  # value offset, value length, next, last
+_LINK = Struct('<q')
+_RECORDS_START = 4096  # The magic and both header slots fit in the first page
+_MIN_CAPACITY = 4096
+
+Bytes = Union[bytes, bytearray, memoryview]
+
+
+def _record_start(index: int) -> int:
+    return _RECORDS_START + index * _RECORD.size
+
+
+class PersistentDoublyLinkedList(BaseDoublyLinkedList[bytes]):
+    """A doubly linked list of bytes values, stored in a pair of memory-mapped files.
+
+    The file at path holds a header and an array of fixed size records, each with the offset and length of its value
+    and the record numbers of its neighbors. The values are appended to a heap in a second file, at path + '.heap', and
+    never rewritten. Records of popped values go on a free list and are reused by later appends, but the space of
+    their values is only reclaimed by clear. Both files grow by doubling, so appending and popping at either end take
+    amortized O(1) time without rewriting anything already written, and reverse takes O(1) by flipping which link is
+    next. Opening an existing file picks up the list where it was left.
+
+    Every operation changes only records that the committed list doesn't read, like free records, or the next of the
+    tail, and then commits by writing the header. There are two header slots, used alternately, each with a sequence
+    number and a checksum, so a torn header write falls back to the state before it. A process that crashes midway
+    leaves the list as of its last complete operation. With sync=True, the files are also flushed before and after each
+    header write, so this holds across an operating system crash or power loss too, at the cost of much slower writes.
+
+    Iterating yields copies of the values as bytes. views yields zero-copy memoryviews into the heap instead, which
+    stay valid until clear.
+
+    Attributes:
+        path: The path of the record file.
+        sync: Whether each operation is flushed to disk before returning.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], values: Iterable[Bytes] = (), *, sync: bool = False) -> None:
+        self.path = os.fspath(path)
+        self.sync = sync
+        existing = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        self._file = open(self.path, 'r+b' if existing else 'w+b')
+        self._heap_file = open(self.path + '.heap', 'r+b' if existing else 'w+b')
+        if existing:
+            self._records = mmap(self._file.fileno(), 0)
+            self._heap = mmap(self._heap_file.fileno(), 0)
+            self._load_header()
+        else:
+            self._records = self._map(self._file, _RECORDS_START + _MIN_CAPACITY)
+            self._heap = self._map(self._heap_file, _MIN_CAPACITY)
+            self._records[:len(MAGIC)] = MAGIC
+            self._sequence = 0
+            self._reset()
+            self._commit()
+        for value in values:
+            self.append(value)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.path!r})'
+
+    def __reduce__(self):
+        raise TypeError(f'cannot pickle {self.__class__.__name__}, copy its files instead')
+
+    def __enter__(self) -> PersistentDoublyLinkedList:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Flush and close the files. Memoryviews from views keep their part of the heap mapped until released."""
+        self.flush()
+        for mapping in [self._records, self._heap]:
+            self._unmap(mapping)
+        self._file.close()
+        self._heap_file.close()
+
+    def flush(self) -> None:
+        """Write the list to disk."""
+        self._heap.flush()
+        self._records.flush()
+
+    @staticmethod
+    def _map(file, size: int) -> mmap:
+        file.truncate(size)
+        return mmap(file.fileno(), size)
+
+    @staticmethod
+    def _unmap(mapping: mmap) -> None:
+        try:
+            mapping.close()
+        except BufferError:
+            pass  # A memoryview from views still uses it, so it is unmapped when that is released
+
+    def _reset(self) -> None:
+        self._head = self._tail = self._free_top = self._free_second = NIL
+        self._size = self._record_count = self._heap_end = 0
+        self._reversed = False
+
+    def _load_header(self) -> None:
+        if self._records[:len(MAGIC)] != MAGIC:
+            raise ValueError(f'{self.path} is not a persistent linked list')
+        headers = []
+        for slot in range(2):
+            start = len(MAGIC) + slot * _SLOT_SIZE
+            header = self._records[start:start + _HEADER.size]
+            checksum, = _CHECKSUM.unpack_from(self._records, start + _HEADER.size)
+            if crc32(header) == checksum:
+                headers.append(_HEADER.unpack(header))
+        if not headers:
+            raise ValueError(f'{self.path} has no valid header')
+        (self._sequence, self._head, self._tail, self._size, self._free_top, self._free_second, self._record_count,
+         self._heap_end, self._reversed) = max(headers)
+
+    def _commit(self) -> None:
+        """Make the changes since the last commit part of the list, by writing the header to the older slot."""
+        self._sequence += 1
+        header = _HEADER.pack(self._sequence, self._head, self._tail, self._size, self._free_top, self._free_second,
+                              self._record_count, self._heap_end, self._reversed)
+        start = len(MAGIC) + self._sequence % 2 * _SLOT_SIZE
+        if self.sync:
+            self._heap.flush()
+            self._records.flush()
+        self._records[start:start + _SLOT_SIZE] = header + _CHECKSUM.pack(crc32(header))
+        if self.sync:
+            self._records.flush(0, _RECORDS_START)
+
+    def _record(self, index: int) -> tuple[int, int, int, int]:
+        """Get (value offset, value length, next, last) for a record, with next and last in the current direction."""
+        offset, length, next_, last = _RECORD.unpack_from(self._records, _record_start(index))
+        return (offset, length, last, next_) if self._reversed else (offset, length, next_, last)
+
+    def _set_link(self, index: int, field: int, target: int) -> None:
+        """Set the next (field 2) or last (field 3) of a record, in the current direction."""
+        if self._reversed:
+            field = 5 - field
+        _LINK.pack_into(self._records, _record_start(index) + field * _LINK.size, target)
+
+    def _allocate(self, value: Bytes, next_: int, last: int) -> int:
+        """Write the value to the heap and a new record for it, neither of which the committed list reads yet."""
+        data = memoryview(value).cast('B')
+        if self._heap_end + len(data) > len(self._heap):
+            self._heap = self._grow(self._heap_file, self._heap, self._heap_end + len(data))
+        offset = self._heap_end
+        self._heap[offset:offset + len(data)] = data
+        self._heap_end += len(data)
+        if self._free_top == NIL:
+            index = self._record_count
+            self._record_count += 1
+            if _record_start(self._record_count) > len(self._records):
+                self._records = self._grow(self._file, self._records, _record_start(self._record_count))
+        else:
+            index, self._free_top = self._free_top, self._free_second
+            if self._free_second != NIL:
+                self._free_second = _RECORD.unpack_from(self._records, _record_start(self._free_second))[2]
+        if self._reversed:
+            next_, last = last, next_
+        _RECORD.pack_into(self._records, _record_start(index), offset, len(data), next_, last)
+        return index
+
+    def _release(self, index: int) -> None:
+        """Put a record that the list won't read after the next commit on the free list.
+
+        The link from the top of the free list is kept in the header, so the released record isn't written to until
+        after the commit, while the list before the commit may still read it. Only the old top gets its link written.
+        """
+        if self._free_top != NIL:
+            _LINK.pack_into(self._records, _record_start(self._free_top) + 2 * _LINK.size, self._free_second)
+        self._free_top, self._free_second = index, self._free_top
+
+    def _grow(self, file, mapping: mmap, needed: int) -> mmap:
+        size = len(mapping)
+        while size < needed:
+            size *= 2
+        grown = self._map(file, size)
+        self._unmap(mapping)
+        return grown
+
+    def _value(self, record: tuple[int, int, int, int]) -> bytes:
+        offset, length = record[0], record[1]
+        return self._heap[offset:offset + length]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _walk(self, start: int, field: int) -> Iterator[tuple[int, int, int, int]]:
+        """Yield the records of the list from start, following next (field 2) or last (field 3), size times."""
+        index = start
+        for _ in range(self._size):
+            record = self._record(index)
+            yield record
+            index = record[field]
+
+    def __iter__(self) -> Iterator[bytes]:
+        return (self._value(record) for record in self._walk(self._head, 2))
+
+    def __reversed__(self) -> Iterator[bytes]:
+        return (self._value(record) for record in self._walk(self._tail, 3))
+
+    def views(self) -> Iterator[memoryview]:
+        """Iterate the values as memoryviews into the heap, without copying them."""
+        heap = memoryview(self._heap)
+        for offset, length, _, _ in self._walk(self._head, 2):
+            yield heap[offset:offset + length]
+
+    def __contains__(self, value: object) -> bool:
+        return any(view == value for view in self.views())
+
+    def append(self, value: Bytes) -> None:
+        index = self._allocate(value, NIL, self._tail)
+        if self._tail == NIL:
+            self._head = index
+        else:
+            self._set_link(self._tail, 2, index)  # The tail's next isn't read until the commit makes index the tail
+        self._tail = index
+        self._size += 1
+        self._commit()
+
+    def appendleft(self, value: Bytes) -> None:
+        index = self._allocate(value, self._head, NIL)
+        if self._head == NIL:
+            self._tail = index
+        else:
+            self._set_link(self._head, 3, index)
+        self._head = index
+        self._size += 1
+        self._commit()
+
+    def pop(self) -> bytes:
+        if not self._size:
+            raise IndexError
+        index = self._tail
+        record = self._record(index)
+        self._size -= 1
+        if self._size:
+            self._tail = record[3]
+        else:  # Not from the links, since the head's last and the tail's next are stale
+            self._head = self._tail = NIL
+        self._release(index)
+        self._commit()
+        return self._value(record)
+
+    def popleft(self) -> bytes:
+        if not self._size:
+            raise IndexError
+        index = self._head
+        record = self._record(index)
+        self._size -= 1
+        if self._size:
+            self._head = record[2]
+        else:
+            self._head = self._tail = NIL
+        self._release(index)
+        self._commit()
+        return self._value(record)
+
+    def reverse(self) -> None:
+        """Reverse the list in O(1) by swapping which link of each record is next."""
+        self._head, self._tail = self._tail, self._head
+        self._reversed = not self._reversed
+        self._commit()
+
+    def clear(self) -> None:
+        """Remove every value and reclaim all of the space in both files, without shrinking them."""
+        self._reset()
+        self._commit()
@@ -0,0 +1,134 @@
+"""A weighted, deficit round robin scheduler over a circular list of keys, like tenants sharing a dispatcher."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterator
+from typing import Generic, Optional, TypeVar
+
+from graph_examples.linked_lists.base_lists import NodeHandle
+from graph_examples.linked_lists.lists import CircularDoublyLinkedList
+
+K = TypeVar('K', bound=Hashable)
+
+
+class _Entry(Generic[K]):
+    __slots__ = ('key', 'weight', 'deficit')
+
+    def __init__(self, key: K, weight: float) -> None:
+        self.key = key
+        self.weight = weight
+        self.deficit = 0
+
+
+class RoundRobinScheduler(Generic[K]):
+    """Picks which key to serve next, giving each a share of the service in proportion to its weight.
+
+    The keys take turns in a cycle, which is a CircularDoublyLinkedList with the current key at its head, and a dict
+    maps each key to a handle of its node. A turn starts by adding quantum * weight to the key's deficit. select keeps
+    returning the key while its deficit covers the cost of what it serves, taking that cost off, and then ends the turn
+    by rotating the cycle by one. What is left of a deficit carries over to the key's next turn. This is deficit round
+    robin, which stays fair when the costs vary. With the default cost of 1, it is plain weighted round robin: a key of
+    weight w is selected w times in a row per round.
+
+    Adding a key puts it at the end of the current round, just before the current key, so the cursor doesn't move.
+    Adding, removing, changing weights and ending a turn are all O(1), and so is select when quantum * weight is at
+    least the cost. Removing a key also drops its deficit, which is how deficit round robin treats a key with nothing
+    left to serve.
+
+    Attributes:
+        quantum: The deficit a key of weight 1 gets per turn.
+    """
+
+    def __init__(self, quantum: float = 1) -> None:
+        if quantum <= 0:
+            raise ValueError('quantum must be positive')
+        self.quantum = quantum
+        self._cycle: CircularDoublyLinkedList[_Entry[K]] = CircularDoublyLinkedList()
+        self._handles: dict[K, NodeHandle[_Entry[K]]] = {}
+        self._turn_started = False
+
+    def __repr__(self) -> str:
+        weights = {key: self.weight(key) for key in self}
+        return f'{self.__class__.__name__}({weights!r}, quantum={self.quantum})'
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._handles
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate through the keys in the order of their turns, from the current one."""
+        return (entry.key for entry in self._cycle)
+
+    @property
+    def current(self) -> K:
+        """The key whose turn it is. Raises IndexError if there are no keys."""
+        if not self._cycle:
+            raise IndexError('no keys to schedule')
+        return self._cycle.head.value.key
+
+    def add(self, key: K, weight: float = 1) -> None:
+        """Add a key at the end of the current round, before the current key.
+
+        Raises:
+            ValueError: If the key is already scheduled, or the weight isn't positive.
+        """
+        if key in self._handles:
+            raise ValueError(f'{key!r} is already scheduled')
+        if weight <= 0:
+            raise ValueError('weight must be positive')
+        self._handles[key] = self._cycle.append_handle(_Entry(key, weight))
+
+    def remove(self, key: K) -> None:
+        """Remove a key, which may be the current one. Raises KeyError if it's missing."""
+        handle = self._handles.pop(key)
+        if handle.value is self._cycle.head.value:
+            self._turn_started = False  # The next key's turn starts fresh
+        self._cycle.remove_node(handle)
+
+    def discard(self, key: K) -> None:
+        """Remove a key if it's scheduled."""
+        if key in self._handles:
+            self.remove(key)
+
+    def weight(self, key: K) -> float:
+        return self._handles[key].value.weight
+
+    def set_weight(self, key: K, weight: float) -> None:
+        """Change the weight of a key, from its next turn on."""
+        if weight <= 0:
+            raise ValueError('weight must be positive')
+        self._handles[key].value.weight = weight
+
+    def deficit(self, key: K) -> float:
+        """Get how much a key can still serve in its current turn, or carried over to its next one."""
+        return self._handles[key].value.deficit
+
+    def select(self, cost: Optional[Callable[[K], float]] = None) -> K:
+        """Get the key to serve next, and charge it for what it serves.
+
+        Args:
+            cost: Gets the cost of what a key would serve next, like the size of the first item in its queue. Defaults
+                to 1 for every key.
+
+        Raises:
+            IndexError: If there are no keys.
+        """
+        if not self._cycle:
+            raise IndexError('no keys to schedule')
+        while True:
+            entry = self._cycle.head.value
+            if not self._turn_started:
+                entry.deficit += self.quantum * entry.weight
+                self._turn_started = True
+            needed = 1 if cost is None else cost(entry.key)
+            if needed <= entry.deficit:
+                entry.deficit -= needed
+                return entry.key
+            self.end_turn()
+
+    def end_turn(self) -> None:
+        """End the current key's turn, keeping its deficit, and move on to the next key."""
+        self._cycle.rotate(-1)
+        self._turn_started = False
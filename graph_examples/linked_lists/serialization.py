@@ -0,0 +1,76 @@
+"""A compact binary format for streaming the values of a list to and from a file.
+
+A stream starts with MAGIC, followed by any number of records. Each record is a 4 byte little endian length, then that
+many bytes holding a pickled Python list of up to chunk_size values. Writing and reading only hold one chunk of values
+in memory at a time, so a list can be built straight from a file, and a file can be written from any iterable:
+
+    with open('values.bin', 'wb') as file:
+        write_values(DoublyLinkedList(range(10)), file)
+    with open('values.bin', 'rb') as file:
+        li = DoublyLinkedList(read_values(file))
+
+Values are pickled a chunk at a time, so a value that appears in two chunks is loaded as two separate objects, and
+reading a file from an untrusted source is as unsafe as unpickling it.
+"""
+
+from __future__ import annotations
+
+import pickle
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from struct import Struct
+from typing import BinaryIO
+
+from graph_examples.linked_lists.base_nodes import T
+
+MAGIC = b'LLV\x01'
+_LENGTH = Struct('<I')
+
+
+def write_values(values: Iterable[T], file: BinaryIO, chunk_size: int = 1024,
+                 protocol: int = pickle.DEFAULT_PROTOCOL) -> int:
+    """Write values to a binary file, in order.
+
+    Args:
+        values: Any iterable, like a list or a node.
+        file: A file opened for writing bytes.
+        chunk_size: The most values per record.
+        protocol: The pickle protocol for the records.
+
+    Returns:
+        The number of values written.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    file.write(MAGIC)
+    values_iter = iter(values)
+    count = 0
+    while True:
+        chunk = list(islice(values_iter, chunk_size))
+        if not chunk:
+            return count
+        record = pickle.dumps(chunk, protocol)
+        file.write(_LENGTH.pack(len(record)))
+        file.write(record)
+        count += len(chunk)
+
+
+def read_values(file: BinaryIO) -> Iterator[T]:
+    """Lazily read the values written by write_values from a binary file.
+
+    Raises:
+        ValueError: If the file doesn't start with MAGIC, or ends in the middle of a record.
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError('not a stream of linked list values')
+    while True:
+        header = file.read(_LENGTH.size)
+        if not header:
+            return
+        if len(header) < _LENGTH.size:
+            raise ValueError('truncated record length')
+        length, = _LENGTH.unpack(header)
+        record = file.read(length)
+        if len(record) < length:
+            raise ValueError('truncated record')
+        yield from pickle.loads(record)
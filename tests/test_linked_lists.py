@@ -1,16 +1,53 @@
+import asyncio
+import os
+import pickle
+import subprocess
+import sys
 from abc import ABC
-from itertools import islice
+from collections import OrderedDict, deque
+from copy import copy, deepcopy
+from io import BytesIO
+from itertools import count, islice
+from queue import Full
+from random import Random
+from threading import Thread
 from typing import TypeVar
+from weakref import ref
 
 from pytest import mark, fixture, raises
 
+from graph_examples.linked_lists import instrumentation, persistent
 from graph_examples.linked_lists import (
+    ArrayDoublyLinkedList,
+    AsyncDoublyLinkedQueue,
+    BaseCache,
     BaseCircularLinkedList,
     BaseDoublyLinkedList,
+    BaseDoublyNodeLinkedList,
     BaseLinkedList,
     BaseLinkedNode,
+    BaseNodeLinkedList,
+    BlockingDoublyLinkedList,
+    CircularDoublyLinkedList,
     CircularDoublyLinkedNode,
+    CircularLinkedNode,
+    DoublyLinkedList,
     DoublyLinkedNode,
+    FrozenLinkedNode,
+    LazyLinkedNode,
+    LFUCache,
+    LinkedList,
+    LinkedNode,
+    LRUCache,
+    NodePool,
+    PersistentDoublyLinkedList,
+    RoundRobinScheduler,
+    TooHeavyError,
+    TypedArrayDoublyLinkedList,
+    UnrolledLinkedList,
+    memoize,
+    read_values,
+    write_values,
 )
 
 # pytestmark = mark.timeout(.1)
@@ -44,6 +81,27 @@ def letters_and_empty(request) -> str:
     return request.param
 
 
+class TwoSlots:
+    __slots__ = ('a', 'b')
+
+
+class ThreeSlots:
+    __slots__ = ('a', 'b', 'c')
+
+
+# On 64-bit CPython this is 48 bytes for singly linked nodes and 56 for doubly linked ones.
+@mark.parametrize('cls, reference', [
+    (LinkedNode, TwoSlots),
+    (DoublyLinkedNode, ThreeSlots),
+    (CircularLinkedNode, TwoSlots),
+    (CircularDoublyLinkedNode, ThreeSlots),
+])
+def test_node_size(cls, reference):
+    node = cls('a')
+    assert not hasattr(node, '__dict__')
+    assert sys.getsizeof(node) == sys.getsizeof(reference())
+
+
 @mark.parametrize('cls', concrete_subclasses(BaseLinkedNode))
 class TestAbstractLinkedNode:
     def test_len(self, cls, letters):
@@ -92,8 +150,64 @@ class TestAbstractLinkedNode:
         node = node.reverse()
         assert list(node) == list(reversed(letters))
 
+    def test_long_chain(self, cls):
+        values = range(100_000)
+        node = cls.from_iterable(values)
+        assert len(node) == len(values)
+        assert list(node) == list(values)
+        assert values[-1] in node
+        node = node.reverse()
+        assert list(node) == list(reversed(values))
+
+    @mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, cls, letters, protocol):
+        node = cls.from_iterable(letters)
+        loaded = pickle.loads(pickle.dumps(node, protocol))
+        assert type(loaded) is cls
+        assert list(loaded) == list(node)
+
+    def test_copy(self, cls, letters):
+        node = cls.from_iterable([[letter] for letter in letters])
+        for copied, shares_values in [(copy(node), True), (deepcopy(node), False)]:
+            assert list(copied) == list(node)
+            assert copied is not node and copied.next is not node
+            assert (copied.value is node.value) == shares_values
+
+    def test_pickle_long_chain(self, cls):
+        values = range(1_000_000)
+        node = cls.from_iterable(values)
+        assert list(pickle.loads(pickle.dumps(node))) == list(values)
+
+    def test_subclass_init(self, cls, letters):
+        inits = []
+
+        class Tagged(cls):
+            __slots__ = ()
+
+            def __init__(self, value, *args):
+                inits.append(value)
+                super().__init__(value, *args)
+
+        node = Tagged.from_iterable(letters)
+        assert list(node) == list(letters) and sorted(inits) == sorted(letters)
+        assert isinstance(node, cls) and type(node) is Tagged
+
+
+@mark.parametrize('cls', concrete_subclasses(BaseLinkedNode, FrozenLinkedNode))
+def test_deepcopy_cycle_through_value(cls):
+    node = cls.from_iterable('ab')
+    node.value = node
+    copied = deepcopy(node)
+    assert copied.value is copied
+
 
 class TestCircularDoublyLinkedNode:
+    def test_init(self):
+        node = CircularDoublyLinkedNode('a')
+        assert node.next is node and node.last is node
+        other = CircularDoublyLinkedNode('b', node)
+        assert other.next is node and other.last is other
+
     def test_reversed(self, letters):
         node = CircularDoublyLinkedNode.from_iterable(letters)
         assert list(reversed(node)) == list(reversed(letters))
@@ -114,6 +228,10 @@ class TestCircularDoublyLinkedNode:
         assert list(node) == list(letters + 'x')
         assert list(reversed(node)) == list(reversed(letters + 'x'))
 
+    def test_reversed_long_chain(self):
+        node = CircularDoublyLinkedNode.from_iterable(range(100_000))
+        assert list(reversed(node)) == list(reversed(range(100_000)))
+
 
 class TestDoublyLinkedNode:
     def test_reversed(self, letters):
@@ -138,8 +256,122 @@ class TestDoublyLinkedNode:
         assert list(head) == list(letters + 'x')
         assert list(reversed(tail)) == list(reversed(letters + 'x'))
 
+    def test_tail_long_chain(self):
+        head = DoublyLinkedNode.from_iterable(range(100_000))
+        assert list(reversed(head.tail)) == list(reversed(range(100_000)))
+
+    def test_pickle_from_middle(self):
+        node = DoublyLinkedNode.from_iterable('abcde').next.next
+        loaded = pickle.loads(pickle.dumps(node))
+        assert loaded.value == 'c'
+        assert list(loaded) == list('cde')
+        assert list(reversed(loaded)) == list('cba')
+        assert list(reversed(loaded.tail)) == list('edcba')
+
+
+class TestFrozenLinkedNode:
+    def test_immutable(self):
+        node = FrozenLinkedNode.from_iterable('ab')
+        for name in ['value', 'next', '_length', 'other']:
+            with raises(AttributeError):
+                setattr(node, name, None)
+        with raises(AttributeError):
+            del node.value
+        with raises(TypeError):
+            FrozenLinkedNode('a', LinkedNode('b'))
+
+    def test_shares_tail(self):
+        tail = FrozenLinkedNode.from_iterable('bc')
+        head = tail.appendleft('a')
+        assert head.next is tail
+        assert list(head) == list('abc') and list(tail) == list('bc')
+        assert head.reverse() == FrozenLinkedNode.from_iterable('cba')
+        assert list(head) == list('abc')
+
+    def test_eq_and_hash(self):
+        node = FrozenLinkedNode.from_iterable('abc')
+        assert node == FrozenLinkedNode.from_iterable('abc')
+        assert hash(node) == hash(FrozenLinkedNode.from_iterable('abc'))
+        assert node != FrozenLinkedNode.from_iterable('abd')
+        assert node != FrozenLinkedNode.from_iterable('ab')
+        assert node != LinkedNode.from_iterable('abc')
+        assert len({node, FrozenLinkedNode.from_iterable('abc'), node.next}) == 2
+
+    def test_eq_stops_at_shared_node(self):
+        class NotComparable:
+            def __eq__(self, other):
+                raise AssertionError
+
+        tail = FrozenLinkedNode.from_iterable([NotComparable()])
+        assert tail.appendleft('a') == tail.appendleft('a')
+
+    def test_long_chain_hash(self):
+        node = FrozenLinkedNode.from_iterable(range(100_000))
+        assert hash(node) == hash(FrozenLinkedNode.from_iterable(range(100_000)))
+
+    def test_interning(self):
+        table = {}
+        node = FrozenLinkedNode.from_iterable('abc', table)
+        other = FrozenLinkedNode.from_iterable('xbc', table)
+        assert other.next is node.next
+        assert FrozenLinkedNode.from_iterable('abc', table) is node
+        assert node.next.appendleft('a', table) is node
+        assert len(table) == 4
 
-@mark.parametrize('cls', concrete_subclasses(BaseLinkedList))
+
+class TestLazyLinkedNode:
+    class Value:
+        pass
+
+    def test_pulls_on_demand(self):
+        pulled = []
+
+        def source():
+            for value in 'abc':
+                pulled.append(value)
+                yield value
+
+        head = LazyLinkedNode.from_iterable(source())
+        assert pulled == ['a']
+        assert repr(head) == "LazyLinkedNode(value='a', next=UNREAD)"
+        assert head.next.value == 'b'
+        assert head.next is head.next
+        assert pulled == ['a', 'b']
+        assert 'b' in head
+        assert pulled == ['a', 'b']
+        assert len(head) == 3
+        assert pulled == ['a', 'b', 'c']
+        assert list(head) == list('abc')
+
+    def test_empty(self):
+        assert LazyLinkedNode.from_iterable(iter([])) is None
+
+    def test_unbounded(self):
+        head = LazyLinkedNode.from_iterable(count())
+        assert 1000 in head
+        assert list(islice(head, 5)) == [0, 1, 2, 3, 4]
+
+    def test_set_next_drops_source(self):
+        head = LazyLinkedNode.from_iterable(count())
+        head.next = LazyLinkedNode('x')
+        assert list(head) == [0, 'x']
+
+    def test_iter_frees_yielded_nodes(self):
+        refs = []
+
+        def make_value():
+            value = self.Value()
+            refs.append(ref(value))
+            return value
+
+        values_iter = iter(LazyLinkedNode.from_iterable(make_value() for _ in range(3)))
+        next(values_iter)
+        assert refs[0]() is not None
+        next(values_iter)
+        assert refs[0]() is None
+
+
+@mark.parametrize('cls', concrete_subclasses(BaseLinkedList, PersistentDoublyLinkedList, TypedArrayDoublyLinkedList))
 class TestAbstractLinkedList:
     def test_len(self, cls, letters_and_empty):
         li = cls(letters_and_empty)
@@ -196,8 +428,71 @@ class TestAbstractLinkedList:
         li.reverse()
         assert list(li) == list(reversed(letters_and_empty))
 
+    def test_len_after_mutations(self, cls):
+        li = cls('abc')
+        expected = deque('abc')
+        operations = ['appendleft', 'popleft', 'reverse']
+        if isinstance(li, BaseDoublyLinkedList):
+            operations += ['append', 'pop']
+        random = Random(0)
+        for i in range(500):
+            operation = random.choice(operations)
+            args = (i,) if operation.startswith('append') else ()
+            if operation.startswith('pop') and not expected:
+                continue
+            assert getattr(li, operation)(*args) == getattr(expected, operation)(*args)
+            assert len(li) == len(expected)
+            assert bool(li) == bool(expected)
+        assert list(li) == list(expected)
 
-@mark.parametrize('cls', concrete_subclasses(BaseDoublyLinkedList))
+    @mark.parametrize('reverse', [False, True])
+    @mark.parametrize('key', [None, lambda x: x[0]])
+    def test_sort(self, cls, key, reverse):
+        random = Random(0)
+        for size in [0, 1, 2, 3, 7, 64, 100]:
+            values = [(random.randrange(5), i) for i in range(size)]
+            li = cls(values)
+            li.sort(key=key, reverse=reverse)
+            expected = sorted(values, key=key, reverse=reverse)
+            assert list(li) == expected
+            try:
+                assert list(reversed(li)) == expected[::-1]
+            except TypeError:
+                pass
+            li.appendleft((-1, -1))
+            assert li.popleft() == (-1, -1)
+            assert len(li) == size
+
+    @mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, cls, letters_and_empty, protocol):
+        li = cls(letters_and_empty)
+        loaded = pickle.loads(pickle.dumps(li, protocol))
+        assert type(loaded) is cls
+        assert list(loaded) == list(li)
+        loaded.appendleft('x')
+        assert list(loaded) == list('x' + letters_and_empty)
+
+    def test_copy(self, cls, letters_and_empty):
+        li = cls([[letter] for letter in letters_and_empty])
+        for copied, shares_values in [(copy(li), True), (deepcopy(li), False)]:
+            assert list(copied) == list(li)
+            assert copied is not li
+            assert all((x is y) == shares_values for x, y in zip(copied, li))
+
+    def test_deepcopy_cycle_through_value(self, cls):
+        li = cls('a')
+        li.appendleft(li)
+        copied = deepcopy(li)
+        assert next(iter(copied)) is copied
+
+    def test_pickle_long(self, cls):
+        values = range(1_000_000)
+        li = cls(values)
+        assert list(pickle.loads(pickle.dumps(li))) == list(values)
+
+
+@mark.parametrize('cls', concrete_subclasses(BaseDoublyLinkedList, PersistentDoublyLinkedList,
+                                             TypedArrayDoublyLinkedList))
 class TestAbstractDoublyLinkedList:
     def test_reversed(self, cls, letters_and_empty):
         li = cls(letters_and_empty)
@@ -225,9 +520,660 @@ class TestAbstractDoublyLinkedList:
         assert list(li) == list(letters_and_empty + 'x')
         assert list(reversed(li)) == list(reversed(letters_and_empty + 'x'))
 
+    def test_reversed_view(self, cls, letters_and_empty):
+        li = cls(letters_and_empty)
+        view = li.reversed_view()
+        assert list(view) == list(reversed(letters_and_empty))
+        assert list(reversed(view)) == list(letters_and_empty)
+        assert len(view) == len(letters_and_empty)
+        assert ('a' in view) == ('a' in letters_and_empty)
+        view.append('x')
+        view.appendleft('y')
+        assert list(li) == list('x' + letters_and_empty + 'y')
+        assert view.pop() == 'x' and view.popleft() == 'y'
+        li.append('z')
+        assert list(view) == list(reversed(letters_and_empty + 'z'))
+        assert repr(view) == f'ReversedView({list(view)!r})'
+        if hasattr(li, '__getitem__'):
+            assert [view[i] for i in range(-len(view), len(view))] == list(view) * 2
+            with raises(IndexError):
+                view[len(view)]
+
+
+@mark.parametrize('cls', [DoublyLinkedList, CircularDoublyLinkedList, BlockingDoublyLinkedList])
+def test_reverse_leaves_links(cls):
+    li = cls(range(10))
+    head, tail = li.head, li.tail
+    li.reverse()
+    assert li.head is head and li.tail is tail and head.next.value == 1
+    assert list(li) == list(range(9, -1, -1))
+    li.reverse()
+    assert list(li) == list(range(10))
+    li.reverse()
+    assert li[0] == 9 and list(li[1:3]) == [8, 7] and li.index(0) == 9
+    assert li.head is head and li.tail is tail  # Reading doesn't relink
+
+
+@mark.parametrize('indexed', [False, True])
+@mark.parametrize('skip_index', [False, True])
+@mark.parametrize('cls', [DoublyLinkedList, CircularDoublyLinkedList, BlockingDoublyLinkedList])
+def test_read_while_iterating_reversed(cls, skip_index, indexed):
+    li = cls(range(6), skip_index=skip_index, indexed=indexed)
+    li.reverse()
+    forward, backward = iter(li), reversed(li)
+    assert [next(forward), next(forward), next(backward)] == [5, 4, 0]
+    assert li[0] == 5 and li[-2] == 1 and li.index(3) == 2 and li.count(2) == 1
+    assert list(li[1:5:2]) == [4, 2] and list(li[::-2]) == [0, 2, 4]
+    assert list(forward) == [3, 2, 1, 0]
+    assert list(backward) == [1, 2, 3, 4, 5]
+
+
+@mark.parametrize('cls', [DoublyLinkedList, CircularDoublyLinkedList])
+def test_remove_reversed_indexed(cls):
+    li = cls([1, 2, 1, 3, 2], indexed=True)
+    expected = [2, 3, 1, 2, 1]
+    li.reverse()
+    for operation, value in [('remove', 1), ('insert', 1), ('remove', 2), ('insert', 3), ('remove', 1), ('remove', 3)]:
+        if operation == 'remove':
+            li.remove(value)
+            expected.remove(value)
+        else:
+            li.insert(2, value)
+            expected.insert(2, value)
+        assert list(li) == expected
+        assert all(li.index(value) == expected.index(value) for value in expected)
+    li.reverse()
+    assert list(li) == expected[::-1]
+
+
+@mark.parametrize('skip_index', [False, True])
+@mark.parametrize('cls', concrete_subclasses(BaseNodeLinkedList))
+class TestAbstractNodeLinkedList:
+    values = 'abcdefghij'
+    slices = [slice(None), slice(2, 7), slice(-3, None), slice(None, None, 2), slice(1, 8, 3), slice(None, None, -1),
+              slice(7, 1, -2), slice(5, 5), slice(8, 2)]
+
+    def test_getitem(self, cls, skip_index, letters_and_empty):
+        li = cls(letters_and_empty, skip_index=skip_index)
+        for i in range(-len(letters_and_empty), len(letters_and_empty)):
+            assert li[i] == letters_and_empty[i]
+        for i in [len(letters_and_empty), -len(letters_and_empty) - 1]:
+            with raises(IndexError):
+                li[i]
+
+    def test_getitem_slice(self, cls, skip_index):
+        li = cls(self.values, skip_index=skip_index)
+        for s in self.slices:
+            sliced = li[s]
+            assert type(sliced) is cls
+            assert sliced.skip_index == skip_index
+            assert list(sliced) == list(self.values[s])
+            assert len(sliced) == len(self.values[s])
+
+    def test_setitem(self, cls, skip_index):
+        li = cls(self.values, skip_index=skip_index)
+        expected = list(self.values)
+        for i in [0, -1, 4, -3]:
+            li[i] = expected[i] = i
+            assert list(li) == expected
+        with raises(IndexError):
+            li[len(expected)] = 'x'
+
+    def test_setitem_slice(self, cls, skip_index):
+        for s in self.slices:
+            li = cls(self.values, skip_index=skip_index)
+            expected = list(self.values)
+            replacement = range(len(expected[s]))
+            li[s] = expected[s] = replacement
+            assert list(li) == expected
+        with raises(ValueError):
+            li[:2] = 'xyz'
+
+    def test_delitem(self, cls, skip_index):
+        li = cls(self.values, skip_index=skip_index)
+        expected = list(self.values)
+        for i in [0, -1, 3, -2, 0]:
+            del li[i]
+            del expected[i]
+            assert list(li) == expected
+            if isinstance(li, BaseDoublyLinkedList):
+                assert list(reversed(li)) == expected[::-1]
+            assert len(li) == len(expected)
+        with raises(IndexError):
+            del li[len(expected)]
+
+    def test_delitem_slice(self, cls, skip_index):
+        for s in self.slices:
+            li = cls(self.values, skip_index=skip_index)
+            expected = list(self.values)
+            del li[s]
+            del expected[s]
+            assert list(li) == expected
+            assert len(li) == len(expected)
+
+    def test_insert(self, cls, skip_index, letters_and_empty):
+        for i in range(-len(letters_and_empty) - 2, len(letters_and_empty) + 2):
+            li = cls(letters_and_empty, skip_index=skip_index)
+            expected = list(letters_and_empty)
+            li.insert(i, 'x')
+            expected.insert(i, 'x')
+            assert list(li) == expected
+            assert len(li) == len(expected)
+            li.appendleft('y')
+            expected.insert(0, 'y')
+            assert list(li) == expected
+
+    def test_random_access_after_mutations(self, cls, skip_index):
+        li = cls(range(100), skip_index=skip_index)
+        expected = list(range(100))
+        random = Random(0)
+        for i in range(200):
+            position = random.randrange(len(expected))
+            assert li[position] == expected[position]
+            if i % 3 == 0:
+                li.insert(position, i)
+                expected.insert(position, i)
+            elif i % 3 == 1:
+                del li[position]
+                del expected[position]
+        assert list(li) == expected
+
+    def test_reverse_between_mutations(self, cls, skip_index):
+        li = cls(range(20), skip_index=skip_index)
+        expected = list(range(20))
+        doubly = isinstance(li, BaseDoublyLinkedList)
+        random = Random(0)
+        for i in range(500):
+            operation = random.randrange(8 if doubly else 6)
+            if operation < 2:
+                li.reverse()
+                expected.reverse()
+            elif operation == 2:
+                li.appendleft(i)
+                expected.insert(0, i)
+            elif operation == 3 and expected:
+                assert li.popleft() == expected.pop(0)
+            elif operation == 4 and expected:
+                position = random.randrange(len(expected))
+                assert li[position] == expected[position]
+                li.insert(position, i)
+                expected.insert(position, i)
+            elif operation == 5 and expected:
+                position = random.randrange(len(expected))
+                del li[position]
+                del expected[position]
+            elif operation == 6:
+                li.append(i)
+                expected.append(i)
+            elif operation == 7 and expected:
+                assert li.pop() == expected.pop()
+            assert list(li) == expected
+            if doubly:
+                assert list(reversed(li)) == expected[::-1]
+        li.sort()
+        assert list(li) == sorted(expected)
+
+    def test_checkpoints_kept_at_tail(self, cls, skip_index):
+        li = cls(range(100), skip_index=skip_index)
+        expected = list(range(100))
+        li[50]
+        checkpoints = li._checkpoints
+        for i in range(100):
+            li.insert(len(li), i)
+            expected.append(i)
+            if i % 3 == 0:
+                del li[-1]
+                del expected[-1]
+            assert li[i] == expected[i]
+            assert li[-1] == expected[-1]
+        assert li._checkpoints is checkpoints
+        assert list(li) == expected
+        li.appendleft('x')
+        assert li._checkpoints is None
+
+    def test_sort_relinks(self, cls, skip_index):
+        for indexed in [False, True]:
+            li = cls([3, 1, 2, 1, 3, 0], skip_index=skip_index, indexed=indexed)
+            nodes = set(map(id, li._nodes_at(range(len(li)))))
+            li[0]  # Builds the checkpoints
+            li.sort()
+            assert set(map(id, li._nodes_at(range(len(li))))) == nodes
+            assert [li[i] for i in range(len(li))] == [0, 1, 1, 2, 3, 3]
+            assert li.count(3) == 2 and li.index(2) == 3
+            li.remove(1)
+            li.insert(1, 5)
+            assert list(li) == [0, 5, 1, 2, 3, 3]
+
+    def test_sort_error(self, cls, skip_index):
+        for values in [[3, 1, 'a', 2, 0], list(range(40, 0, -1)) + list('cba')]:  # Fails in a run, or merging runs
+            li = cls(values, skip_index=skip_index)
+            with raises(TypeError):
+                li.sort()
+            assert sorted(li, key=str) == sorted(values, key=str)
+            assert len(li) == len(values) and [li[i] for i in range(len(li))] == list(li)
+
+        def key(value):
+            if value == 2:
+                raise KeyError(value)
+            return value
+
+        li = cls(range(5), skip_index=skip_index)
+        with raises(KeyError):
+            li.sort(key=key)
+        assert list(li) == list(range(5))
+        li.append(5) if isinstance(li, BaseDoublyLinkedList) else li.appendleft(5)
+        assert len(list(li)) == 6
+
+    def test_pickle_keeps_options(self, cls, skip_index):
+        for indexed in [False, True]:
+            loaded = pickle.loads(pickle.dumps(cls('abca', skip_index=skip_index, indexed=indexed)))
+            assert loaded.skip_index == skip_index
+            assert (loaded._index is not None) == indexed
+            assert loaded.count('a') == 2
+            assert loaded[2] == 'c'
+
+    def test_delitem_slice_long(self, cls, skip_index):
+        li = cls(range(1000), skip_index=skip_index)
+        expected = list(range(1000))
+        for s in [slice(1, -1, 7), slice(None, None, 2), slice(-1, 3, -3), slice(1, -1)]:
+            del li[s]
+            del expected[s]
+            assert list(li) == expected
+            assert len(li) == len(expected)
+
+
+@mark.parametrize('indexed', [False, True])
+@mark.parametrize('cls', concrete_subclasses(BaseNodeLinkedList))
+class TestValueLookup:
+    def test_mutations(self, cls, indexed):
+        li = cls('abcabc', indexed=indexed)
+        expected = list('abcabc')
+        random = Random(0)
+        for _ in range(1000):
+            value = random.choice('abcdef')
+            operation = random.randrange(8)
+            if operation == 0:
+                li.appendleft(value)
+                expected.insert(0, value)
+            elif operation == 1:
+                position = random.randint(0, len(expected))
+                li.insert(position, value)
+                expected.insert(position, value)
+            elif operation == 2 and expected:
+                assert li.popleft() == expected.pop(0)
+            elif operation == 3:
+                if value in expected:
+                    li.remove(value)
+                    expected.remove(value)
+                else:
+                    with raises(ValueError):
+                        li.remove(value)
+            elif operation == 4 and expected:
+                position = random.randrange(len(expected))
+                li[position] = expected[position] = value
+            elif operation == 5 and expected:
+                position = random.randrange(len(expected))
+                del li[position]
+                del expected[position]
+            elif operation == 6:
+                li.reverse()
+                expected.reverse()
+            elif operation == 7:
+                li.discard(value)
+                if value in expected:
+                    expected.remove(value)
+            assert list(li) == expected
+            if indexed:
+                nodes = list(li._nodes_at(range(len(li))))
+                if li._reversed:
+                    nodes.reverse()  # The index follows the links
+                assert li._index == {value: [node for node in nodes if node.value == value] for value in set(expected)}
+            for value in 'abcdef':
+                assert (value in li) == (value in expected)
+                assert li.count(value) == expected.count(value)
+                if value in expected:
+                    assert li.index(value) == expected.index(value)
+                else:
+                    with raises(ValueError):
+                        li.index(value)
+
+    def test_index_bounds(self, cls, indexed):
+        li = cls('abcabc', indexed=indexed)
+        assert li.index('b', 2) == 4
+        assert li.index('c', -1) == 5
+        with raises(ValueError):
+            li.index('a', 1, 3)
+
+    def test_unhashable(self, cls, indexed):
+        li = cls('abc', indexed=indexed)
+        if not indexed:
+            li.appendleft([])
+            assert [] in li
+            return
+        with raises(TypeError):
+            li.appendleft([])
+        with raises(TypeError):
+            li[1] = []
+        for i in range(4):
+            with raises(TypeError):
+                li.insert(i, [])
+        assert list(li) == list('abc')
+
+    def test_slice_keeps_index(self, cls, indexed):
+        li = cls('abcabc', indexed=indexed)
+        for sliced in [li[1:5], li[::-2]]:
+            assert (sliced._index is not None) == indexed
+            assert sliced.count('b') == list(sliced).count('b')
+
+
+@mark.parametrize('indexed', [False, True])
+@mark.parametrize('cls', concrete_subclasses(BaseNodeLinkedList))
+class TestSplicing:
+    def check(self, li, expected):
+        assert list(li) == list(expected)
+        assert len(li) == len(expected)
+        if isinstance(li, BaseDoublyLinkedList):
+            assert list(reversed(li)) == list(reversed(expected))
+        for value in set(expected):
+            assert li.count(value) == list(expected).count(value)
+
+    def test_splice(self, cls, indexed, letters_and_empty):
+        for at in range(-1, len(letters_and_empty) + 2):
+            for other_values in ['', 'x', 'xyz']:
+                li = cls(letters_and_empty, indexed=indexed)
+                other = cls(other_values, indexed=indexed)
+                li.splice(other, at)
+                expected = list(letters_and_empty)
+                expected[at:at] = other_values
+                self.check(li, expected)
+                self.check(other, '')
+                li.appendleft('<')
+                other.appendleft('>')
+                self.check(li, ['<'] + expected)
+                self.check(other, '>')
+
+    def test_splice_reversed(self, cls, indexed, letters_and_empty):
+        for at in range(len(letters_and_empty) + 1):
+            li = cls(letters_and_empty, indexed=indexed)
+            other = cls('xyz', indexed=indexed)
+            li.reverse()
+            other.reverse()
+            li.splice(other, at)
+            expected = list(reversed(letters_and_empty))
+            expected[at:at] = 'zyx'
+            self.check(li, expected)
+            rest = li.split_at(at)
+            li.reverse()
+            self.check(li, expected[at - 1::-1] if at else '')
+            self.check(rest, expected[at:])
+
+    def test_extend(self, cls, indexed, letters_and_empty):
+        li = cls(letters_and_empty, indexed=indexed)
+        other = cls('xyz', indexed=indexed)
+        li.extend(other)
+        self.check(li, letters_and_empty + 'xyz')
+        self.check(other, '')
+        li.extend('12')
+        li.extend(li)
+        self.check(li, (letters_and_empty + 'xyz12') * 2)
+
+    def test_extendleft(self, cls, indexed, letters_and_empty):
+        li = cls(letters_and_empty, indexed=indexed)
+        other = cls('xyz', indexed=indexed)
+        li.extendleft(other)
+        self.check(li, 'xyz' + letters_and_empty)
+        self.check(other, '')
+        li.extendleft(iter('12'))
+        li.extendleft(li)
+        self.check(li, ('12xyz' + letters_and_empty) * 2)
+
+    def test_splice_errors(self, cls, indexed):
+        li = cls('abc', indexed=indexed)
+        with raises(ValueError):
+            li.splice(li)
+        with raises(TypeError):
+            li.splice(list('abc'))
+
+    def test_split_at(self, cls, indexed, letters_and_empty):
+        for index in range(-len(letters_and_empty) - 1, len(letters_and_empty) + 2):
+            li = cls(letters_and_empty, indexed=indexed)
+            rest = li.split_at(index)
+            expected = list(letters_and_empty)
+            expected_rest = expected[index:]
+            del expected[index:]
+            assert type(rest) is cls
+            self.check(li, expected)
+            self.check(rest, expected_rest)
+            li.appendleft('<')
+            rest.appendleft('>')
+            li.extend(rest)
+            self.check(li, ['<'] + expected + ['>'] + expected_rest)
+
+    def test_clear(self, cls, indexed, letters_and_empty):
+        li = cls(letters_and_empty, indexed=indexed)
+        li.clear()
+        self.check(li, '')
+        assert 'a' not in li
+        li.appendleft('a')
+        self.check(li, 'a')
+
+
+@mark.parametrize('indexed', [False, True])
+@mark.parametrize('cls', concrete_subclasses(BaseDoublyNodeLinkedList))
+class TestNodeHandles:
+    def test_mutations(self, cls, indexed):
+        li = cls(indexed=indexed)
+        expected = []  # Pairs of (value, handle)
+        random = Random(0)
+        for i in range(1000):
+            value = random.choice('abc')
+            operation = random.randrange(8)
+            position = random.randrange(len(expected)) if expected else None
+            if operation == 0:
+                expected.append((value, li.append_handle(value)))
+            elif operation == 1:
+                expected.insert(0, (value, li.appendleft_handle(value)))
+            elif operation == 2 and expected:
+                expected.insert(position + 1, (value, li.insert_after(expected[position][1], value)))
+            elif operation == 3 and expected:
+                expected.insert(position, (value, li.insert_before(expected[position][1], value)))
+            elif operation == 4 and expected:
+                old_value, handle = expected.pop(position)
+                assert li.remove_node(handle) == old_value
+                with raises(ValueError):
+                    li.remove_node(handle)
+            elif operation == 5 and expected:
+                last = random.random() < .5
+                pair = expected.pop(position)
+                expected.insert(len(expected) if last else 0, pair)
+                li.move_to_end(pair[1], last)
+            elif operation == 6:
+                li.reverse()
+                expected.reverse()
+            elif operation == 7 and expected:
+                assert li.popleft() == expected.pop(0)[0]
+            assert list(li) == [value for value, _ in expected]
+            assert list(reversed(li)) == [value for value, _ in reversed(expected)]
+            assert all(handle.value == value for value, handle in expected)
+            if indexed:
+                for value in 'abc':
+                    assert li.count(value) == [value for value, _ in expected].count(value)
+        li.sort()
+        assert [li.remove_node(handle) for _, handle in expected] == [value for value, _ in expected]
+        assert not li
+
+    def test_invalid_handles(self, cls, indexed):
+        li = cls('ab', indexed=indexed)
+        other = cls(indexed=indexed)
+        foreign = other.append_handle('x')
+        with raises(ValueError):
+            li.insert_after(foreign, 'y')
+        popped = li.append_handle('c')
+        assert li.pop() == 'c'
+        left = li.appendleft_handle('z')
+        assert li.popleft() == 'z'
+        for handle in [popped, left]:
+            with raises(ValueError):
+                li.move_to_end(handle)
+        handle = li.append_handle('c')
+        li.split_at(1)
+        with raises(ValueError):
+            li.remove_node(handle)
+        handle = li.append_handle('d')
+        li.clear()
+        with raises(ValueError):
+            li.insert_before(handle, 'e')
+        handle = other.append_handle('y')
+        li.extend(other)
+        with raises(ValueError):
+            li.remove_node(handle)
+        assert list(li) == list('xy') and repr(li.append_handle('f')) == "NodeHandle(value='f')"
+
+
+@mark.parametrize('cls', concrete_subclasses(BaseDoublyNodeLinkedList))
+class TestNodePool:
+    def test_recycles(self, cls):
+        pool = NodePool(cls._node_class, maxsize=2)
+        li = cls('abcd', pool=pool)
+        assert [li.pop(), li.popleft(), li.pop()] == list('dac') and len(pool) == 2
+        li.append('x')
+        li.appendleft('y')
+        li.insert(1, 'z')
+        assert list(li) == list('yzbx') and len(pool) == 0
+        li.reverse()
+        assert [li.popleft(), li.pop()] == list('xy') and len(pool) == 2
+        assert list(li) == list('bz') and list(reversed(li)) == list('zb')
+        assert repr(pool) == f'NodePool({cls._node_class.__name__}, maxsize=2, free=2)'
+        pool.clear()
+        assert len(pool) == 0
+
+    def test_keeps_referenced_nodes(self, cls):
+        pool = NodePool(cls._node_class)
+        li = cls('abc', pool=pool, indexed=True)
+        node = li.head
+        values = iter(li)
+        assert next(values) == 'a'
+        assert [li.pop(), li.popleft(), li.pop()] == list('cab') and len(pool) == 2
+        assert node.value == 'a' and li.count('a') == 0
+
+    def test_keeps_nodes_while_handles_live(self, cls):
+        pool = NodePool(cls._node_class)
+        li = cls('ab', pool=pool)
+        handle = li.append_handle('c')
+        other = cls('x', pool=pool).append_handle('y')
+        assert [li.pop(), li.popleft()] == list('ca') and len(pool) == 0 and handle.value == 'c'
+        with raises(ValueError):
+            li.remove_node(handle)
+        li.append('d')
+        del handle
+        assert [li.pop(), li.pop()] == list('db') and len(pool) == 2 and other.value == 'y'
+
+    def test_without_getrefcount(self, cls):
+        code = ('import sys\n'
+                'del sys.getrefcount\n'
+                f'from graph_examples.linked_lists import NodePool, {cls.__name__} as cls\n'
+                'pool = NodePool(cls._node_class)\n'
+                'li = cls("ab", pool=pool)\n'
+                'li.pop()\n'
+                'li.append("c")\n'
+                'print(len(pool), *li)')
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        assert result.stdout.split() == ['0', 'a', 'c']
+
+    def test_releases_values(self, cls):
+        class Value:
+            pass
+
+        pool = NodePool(cls._node_class)
+        li = cls(pool=pool)
+        li.append(Value())
+        value = ref(li[0])
+        li.pop()
+        assert value() is None and len(pool) == 1
+
+    def test_shared(self, cls):
+        pool = NodePool(cls._node_class, maxsize=10)
+        first, second = cls(range(5), pool=pool), cls(pool=pool)
+        for value in range(100):
+            first.append(value)
+            second.append(first.popleft())
+            if value % 3 == 0:
+                second.popleft()
+        assert len(pool) <= 10 and list(first) == list(range(95, 100)) and len(second) == 66
+        rest = first.split_at(2)
+        assert rest.pool is pool and first[1:].pool is pool
+        assert deepcopy(first).pool is None and pickle.loads(pickle.dumps(first)).pool is None
+
+    def test_churn(self, cls):
+        pool = NodePool(cls._node_class, maxsize=8)
+        li, expected = cls(pool=pool), deque()
+        random = Random(0)
+        for i in range(2000):
+            operation = random.randrange(6)
+            if operation == 0:
+                li.append(i)
+                expected.append(i)
+            elif operation == 1:
+                li.appendleft(i)
+                expected.appendleft(i)
+            elif operation == 2 and expected:
+                assert li.pop() == expected.pop()
+            elif operation == 3 and expected:
+                assert li.popleft() == expected.popleft()
+            elif operation == 4:
+                li.reverse()
+                expected.reverse()
+            elif operation == 5:
+                index = random.randrange(len(expected) + 1)
+                li.insert(index, i)
+                expected.insert(index, i)
+            assert list(li) == list(expected) and len(pool) <= 8
+        assert list(reversed(li)) == list(reversed(expected))
+
+    def test_invalid(self, cls):
+        with raises(ValueError):
+            NodePool(cls._node_class, maxsize=-1)
+        other_class = DoublyLinkedNode if cls._node_class is CircularDoublyLinkedNode else CircularDoublyLinkedNode
+        with raises(ValueError):
+            cls(pool=NodePool(other_class))
+
 
 @mark.parametrize('cls', concrete_subclasses(BaseCircularLinkedList))
 class TestAbstractCircularLinkedList:
+    def test_rotate(self, cls, letters_and_empty):
+        for k in range(-2 * len(letters_and_empty) - 1, 2 * len(letters_and_empty) + 2):
+            li = cls(letters_and_empty)
+            expected = deque(letters_and_empty)
+            li.rotate(k)
+            expected.rotate(k)
+            assert list(li) == list(expected)
+            li.reverse()
+            expected.reverse()
+            li.rotate(k)
+            expected.rotate(k)
+            assert list(li) == list(expected)
+
+    @mark.parametrize('indexed', [False, True])
+    def test_rotate_keeps_index_and_checkpoints(self, cls, indexed):
+        li = cls('abcabcab', skip_index=True, indexed=indexed)
+        expected = deque('abcabcab')
+        random = Random(0)
+        for _ in range(100):
+            k = random.randint(-10, 10)
+            li.rotate(k)
+            expected.rotate(k)
+            position = random.randrange(len(expected))
+            assert li[position] == expected[position]
+            assert [li.index(value) for value in 'abc'] == [expected.index(value) for value in 'abc']
+        li.remove('a')
+        expected.remove('a')
+        assert list(li) == list(expected)
+
+    def test_infinite_iterator_reversed(self, cls, letters):
+        li = cls(letters)
+        li.reverse()
+        assert list(islice(li.infinite_iterator(), 2 * len(letters))) == list(reversed(letters)) * 2
+
     def test_infinite_iterator(self, cls, letters):
         li = cls(letters)
         assert list(islice(li.infinite_iterator(), len(letters) * 3)) == list(letters * 3)
@@ -235,3 +1181,870 @@ class TestAbstractCircularLinkedList:
     def test_infinite_iterator_empty(self, cls):
         li = cls()
         assert not list(li.infinite_iterator())
+
+
+class TestArrayDoublyLinkedList:
+    def test_reuses_popped_slots(self, letters):
+        li = ArrayDoublyLinkedList(letters)
+        for _ in range(100):
+            li.append(li.popleft())
+            li.appendleft(li.pop())
+            li.append('x')
+            li.popleft()
+            li.appendleft(li.pop())
+        assert len(li) == len(letters)
+        assert len(li._values) == len(letters) + 1
+
+    def test_sort_with_free_slots(self):
+        li = ArrayDoublyLinkedList(range(20))
+        expected = deque(range(20))
+        random = Random(0)
+        for i in range(200):
+            operation = random.choice(['append', 'appendleft', 'pop', 'popleft', 'reverse'])
+            args = (random.randrange(50),) if operation.startswith('append') else ()
+            if operation.startswith('pop') and not expected:
+                continue
+            getattr(li, operation)(*args)
+            getattr(expected, operation)(*args)
+            if i % 20 == 0:
+                for reverse in [False, True]:
+                    li.sort(key=lambda x: x % 7, reverse=reverse)
+                    assert list(li) == sorted(expected, key=lambda x: x % 7, reverse=reverse)
+                    assert list(reversed(li)) == list(li)[::-1]
+                    assert not li._free and len(li._values) == len(li)
+                expected = deque(li)
+
+    def test_sort_raising_keeps_values(self):
+        li = ArrayDoublyLinkedList([3, 'a', 1, 2])
+        li.popleft()
+        with raises(TypeError):
+            li.sort()
+        assert sorted(li, key=str) == [1, 2, 'a']
+        li.append(0)
+        assert len(li) == 4 and li.pop() == 0
+
+    def test_contains_with_free_slots(self, letters):
+        li = ArrayDoublyLinkedList(letters)
+        li.appendleft(None)
+        li.popleft()
+        li.pop()
+        assert None not in li
+        assert letters[-1] not in li
+        for letter in letters[:-1]:
+            assert letter in li
+
+
+class TestTypedArrayDoublyLinkedList:
+    def test_mutations(self):
+        li = TypedArrayDoublyLinkedList(range(5))
+        expected = deque(range(5))
+        random = Random(0)
+        for i in range(500):
+            operation = random.choice(['append', 'append', 'appendleft', 'pop', 'pop', 'popleft', 'reverse'])
+            args = (i,) if operation.startswith('append') else ()
+            if operation.startswith('pop') and not expected:
+                continue
+            assert getattr(li, operation)(*args) == getattr(expected, operation)(*args)
+            assert list(li) == list(expected)
+            assert list(reversed(li)) == list(reversed(expected))
+            if li.is_compact:
+                assert li.view().tolist() == list(expected)
+            elif random.random() < .1:
+                li.compact()
+                assert li.is_compact and li.view().tolist() == list(expected)
+
+    def test_view(self):
+        li = TypedArrayDoublyLinkedList([1.5, 2.5], 'd')
+        with li.view() as view:
+            assert view.format == 'd' and view.tolist() == [1.5, 2.5]
+        li.append(3.5)
+        li.appendleft(.5)
+        with raises(ValueError):
+            li.view()
+        li.compact()
+        assert li.view().tolist() == [.5, 1.5, 2.5, 3.5]
+
+    def test_alive_view_pins_values(self):
+        li = TypedArrayDoublyLinkedList(range(3))
+        with li.view():
+            with raises(BufferError):
+                li.append(3)
+            assert li.pop() == 2
+            assert not li.is_compact
+            li.append(4)
+            assert list(li) == [0, 1, 4]
+        li.compact()
+        li.pop()
+        assert li.is_compact and len(li._values) == 2
+
+    def test_rejects_values(self):
+        li = TypedArrayDoublyLinkedList(range(3), 'b')
+        li.popleft()
+        for value in ['a', 1.5, 1000]:
+            for method in [li.append, li.appendleft]:
+                with raises((TypeError, OverflowError)):
+                    method(value)
+        assert list(li) == [1, 2]
+        assert li._free == [0]
+        with raises(TypeError):
+            TypedArrayDoublyLinkedList('abc')
+
+    def test_sort(self):
+        li = TypedArrayDoublyLinkedList([3, 1, 2], 'i')
+        li.appendleft(4)
+        li.sort(reverse=True)
+        assert li.is_compact and li.typecode == 'i'
+        assert li.view().tolist() == [4, 3, 2, 1]
+
+    def test_pickle_keeps_typecode(self):
+        loaded = pickle.loads(pickle.dumps(TypedArrayDoublyLinkedList([1.5], 'f')))
+        assert loaded.typecode == 'f'
+        assert list(loaded) == [1.5]
+
+
+@mark.parametrize('block_size', [1, 2, 3])
+class TestUnrolledLinkedList:
+    def test_init(self, block_size, letters_and_empty):
+        li = UnrolledLinkedList(letters_and_empty * 2, block_size)
+        assert list(li) == list(letters_and_empty * 2)
+        assert list(reversed(li)) == list(reversed(letters_and_empty * 2))
+
+    def test_mutations(self, block_size):
+        li = UnrolledLinkedList('abcde', block_size)
+        expected = deque('abcde')
+        random = Random(0)
+        for i in range(500):
+            operation = random.choice(['append', 'appendleft', 'pop', 'popleft', 'reverse'])
+            args = (i,) if operation.startswith('append') else ()
+            if operation.startswith('pop') and not expected:
+                continue
+            assert getattr(li, operation)(*args) == getattr(expected, operation)(*args)
+            assert list(li) == list(expected)
+            assert list(reversed(li)) == list(reversed(expected))
+            assert (i in li) == (i in expected)
+
+    def test_sort(self, block_size):
+        random = Random(0)
+        for size in [0, 1, block_size, block_size + 1, 3 * block_size, 100]:
+            li = UnrolledLinkedList([random.randrange(10) for _ in range(size)], block_size)
+            for value in range(5):
+                li.appendleft(value)
+            expected = list(li)
+            li.sort(reverse=True)
+            assert list(li) == sorted(expected, reverse=True)
+            assert list(reversed(li)) == sorted(expected)
+            li.append(-1)
+            li.appendleft(10)
+            assert li.pop() == -1 and li.popleft() == 10 and len(li) == size + 5
+
+    def test_sort_raising_keeps_values(self, block_size):
+        li = UnrolledLinkedList([3, 'a', 1, 2, 5], block_size)
+        with raises(TypeError):
+            li.sort()
+        assert sorted(li, key=str) == [1, 2, 3, 5, 'a']
+        li.append(0)
+        assert len(li) == 6 and li.pop() == 0
+
+    def test_pickle_keeps_block_size(self, block_size):
+        loaded = pickle.loads(pickle.dumps(UnrolledLinkedList('abcde', block_size)))
+        assert loaded.block_size == block_size
+        assert list(loaded) == list('abcde')
+
+
+def test_unrolled_invalid_block_size():
+    with raises(ValueError):
+        UnrolledLinkedList(block_size=0)
+
+
+class TestPersistentDoublyLinkedList:
+    @fixture
+    def path(self, tmp_path):
+        return tmp_path / 'list'
+
+    def test_mutations(self, path):
+        li = PersistentDoublyLinkedList(path, [b'a', b'bc'])
+        expected = deque([b'a', b'bc'])
+        random = Random(0)
+        for i in range(2000):
+            operation = random.choice(['append', 'appendleft', 'pop', 'popleft', 'reverse'])
+            args = (str(i).encode() * random.randrange(3),) if operation.startswith('append') else ()
+            if operation.startswith('pop') and not expected:
+                continue
+            assert getattr(li, operation)(*args) == getattr(expected, operation)(*args)
+            assert len(li) == len(expected)
+        assert list(li) == list(expected)
+        assert list(reversed(li)) == list(reversed(expected))
+        assert all(value in li for value in expected)
+        assert b'missing' not in li
+
+    def test_reopen(self, path):
+        with PersistentDoublyLinkedList(path, [b'a', b'b', b'c']) as li:
+            li.popleft()
+            li.reverse()
+            li.appendleft(bytearray(b'd'))
+        with PersistentDoublyLinkedList(path, [b'e']) as li:
+            assert list(li) == [b'd', b'c', b'b', b'e']
+            assert list(reversed(li)) == [b'e', b'b', b'c', b'd']
+
+    def test_reuses_records(self, path):
+        li = PersistentDoublyLinkedList(path, [b'x'] * 10)
+        for _ in range(1000):
+            li.append(li.popleft())
+            li.appendleft(li.pop())
+        assert li._record_count == 10
+        li.clear()
+        assert not li and li._heap_end == 0
+
+    def test_grows(self, path):
+        values = [bytes([i % 256]) * (i % 100) for i in range(10_000)]
+        li = PersistentDoublyLinkedList(path, values)
+        views = list(li.views())
+        for value in values:
+            li.append(value)
+        assert [bytes(view) for view in views] == values
+        assert list(li) == values * 2
+        del views
+        li.close()
+
+    def test_torn_header_keeps_last_commit(self, path):
+        with PersistentDoublyLinkedList(path, [b'a', b'b']) as li:
+            li.pop()  # Written to the slot of the append before it
+            slot = li._sequence % 2
+        with open(path, 'r+b') as file:
+            file.seek(len(persistent.MAGIC) + slot * persistent._SLOT_SIZE + 10)
+            file.write(b'\xff')
+        with PersistentDoublyLinkedList(path) as li:
+            assert list(li) == [b'a', b'b']
+
+    def test_invalid(self, path):
+        li = PersistentDoublyLinkedList(path)
+        for value in ['a', 1]:
+            with raises(TypeError):
+                li.append(value)
+        assert not li
+        with raises(IndexError):
+            li.pop()
+        with raises(TypeError):
+            pickle.dumps(li)
+        li.close()
+        path.write_bytes(b'not a list')
+        with raises(ValueError):
+            PersistentDoublyLinkedList(path)
+
+
+class TestBlockingDoublyLinkedList:
+    def test_overrides_every_public_method(self):
+        public = {name for name in dir(DoublyLinkedList)
+                  if callable(getattr(DoublyLinkedList, name)) and (not name.startswith('_') or name in (
+                      '__getitem__', '__setitem__', '__delitem__', '__contains__', '__iter__', '__reversed__'))}
+        assert public - set(vars(BlockingDoublyLinkedList)) == set()
+
+    def test_handles_over_maxsize(self):
+        li = BlockingDoublyLinkedList('a', maxsize=2)
+        handle = li.append_handle('b')
+        for add in [li.append_handle, li.appendleft_handle]:
+            with raises(Full):
+                add('c')
+        for insert in [li.insert_after, li.insert_before]:
+            with raises(Full):
+                insert(handle, 'c')
+        assert li.remove_node(handle) == 'b'
+        assert list(li) == ['a']
+
+    def test_init_over_maxsize(self):
+        with raises(ValueError):
+            BlockingDoublyLinkedList('abc', maxsize=2)
+
+    def test_pickle_keeps_maxsize(self):
+        loaded = pickle.loads(pickle.dumps(BlockingDoublyLinkedList('ab', maxsize=2)))
+        assert loaded.maxsize == 2
+        with raises(Full):
+            loaded.append('c')
+        assert loaded.popleft(block=True) == 'a'
+
+    def test_full(self):
+        li = BlockingDoublyLinkedList('ab', maxsize=2)
+        for add in [lambda: li.append('c'), lambda: li.appendleft('c'), lambda: li.insert(1, 'c'),
+                    lambda: li.extend('c'), lambda: li.append_many('c'), lambda: li.append('c', True, 0.01)]:
+            with raises(Full):
+                add()
+        assert list(li) == ['a', 'b']
+
+    def test_empty(self):
+        li = BlockingDoublyLinkedList()
+        for pop in [li.pop, li.popleft, li.popleft_many, lambda: li.popleft(True, 0.01)]:
+            with raises(IndexError):
+                pop()
+
+    def test_blocking_pop_wakes_up(self):
+        li = BlockingDoublyLinkedList()
+        results = []
+        consumer = Thread(target=lambda: results.append(li.popleft(block=True, timeout=10)))
+        consumer.start()
+        li.append('a')
+        consumer.join()
+        assert results == ['a']
+
+    def test_blocking_append_wakes_up(self):
+        li = BlockingDoublyLinkedList('a', maxsize=1)
+        producer = Thread(target=lambda: li.append_many('bcd', block=True, timeout=10))
+        producer.start()
+        popped = [li.popleft(block=True, timeout=10) for _ in range(4)]
+        producer.join()
+        assert popped == ['a', 'b', 'c', 'd']
+        assert not li
+
+    def test_popleft_many(self, letters):
+        li = BlockingDoublyLinkedList(letters * 3)
+        assert li.popleft_many(2) == list(letters * 3)[:2]
+        assert li.popleft_many() == list(letters * 3)[2:]
+        assert not li
+
+    def test_extend_each_other(self):
+        a = BlockingDoublyLinkedList(range(10))
+        b = BlockingDoublyLinkedList(range(10, 20))
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [Thread(target=lambda x=x, y=y: [x.extend(y) for _ in range(1000)], daemon=True)
+                       for x, y in [(a, b), (b, a)]]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(10)
+        finally:
+            sys.setswitchinterval(interval)
+        assert not any(thread.is_alive() for thread in threads)
+        assert sorted([*a, *b]) == list(range(20))
+
+    def test_producers_and_consumers(self):
+        li = BlockingDoublyLinkedList(maxsize=5)
+        producers, consumers, per_producer = 4, 4, 500
+        consumed = [[] for _ in range(consumers)]
+        sizes = []
+
+        def produce(start):
+            for value in range(start, start + per_producer, 10):
+                if value % 20:
+                    li.append_many(range(value, value + 10), block=True, timeout=10)
+                else:
+                    for x in range(value, value + 10):
+                        li.append(x, block=True, timeout=10)
+                sizes.append(len(li))
+
+        def consume(out):
+            while True:
+                values = li.popleft_many(3, block=True, timeout=10) if len(out) % 2 else [li.popleft(True, 10)]
+                if None in values:  # Only stop values are left, so put back the ones for other consumers
+                    li.append_many([None] * (values.count(None) - 1))
+                    out.extend(values[:values.index(None)])
+                    return
+                out.extend(values)
+
+        threads = [Thread(target=consume, args=(out,)) for out in consumed]
+        threads += [Thread(target=produce, args=(i * per_producer,)) for i in range(producers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads[consumers:]:
+            thread.join()
+        for _ in range(consumers):
+            li.append(None, block=True, timeout=10)
+        for thread in threads[:consumers]:
+            thread.join()
+        assert sorted(x for out in consumed for x in out) == list(range(producers * per_producer))
+        assert max(sizes) <= 5
+
+
+class TestAsyncDoublyLinkedQueue:
+    def test_both_ends(self, letters):
+        q = AsyncDoublyLinkedQueue(letters)
+        q.put_nowait('x')
+        q.putleft_nowait('y')
+        assert q.get_nowait() == 'x'
+        assert q.getleft_nowait() == 'y'
+        assert q.getleft_many_nowait() == list(letters)
+        assert q.empty()
+
+    def test_nowait_errors(self):
+        q = AsyncDoublyLinkedQueue('ab', maxsize=2)
+        assert q.full()
+        for put in [q.put_nowait, q.putleft_nowait, lambda x: q.put_many_nowait([x])]:
+            with raises(asyncio.QueueFull):
+                put('c')
+        q.getleft_many_nowait()
+        for get in [q.get_nowait, q.getleft_nowait, q.getleft_many_nowait]:
+            with raises(asyncio.QueueEmpty):
+                get()
+        with raises(ValueError):
+            AsyncDoublyLinkedQueue('abc', maxsize=2)
+
+    def test_producers_and_consumers(self):
+        async def main():
+            q = AsyncDoublyLinkedQueue(maxsize=3)
+            consumed = []
+
+            async def produce(start):
+                await q.put_many(range(start, start + 50))
+                for value in range(start + 50, start + 100):
+                    await (q.put(value) if value % 2 else q.putleft(value))
+                    assert len(q) <= 3
+
+            async def consume(i):
+                while True:
+                    values = await q.getleft_many(2) if i % 2 else [await q.getleft()]
+                    consumed.extend(value for value in values if value is not None)
+                    if None in values:  # Only stop values are left, so put back the ones for other consumers
+                        q.put_many_nowait([None] * (values.count(None) - 1))
+                        return
+
+            consumers = [asyncio.create_task(consume(i)) for i in range(4)]
+            await asyncio.gather(*(produce(i * 100) for i in range(4)))
+            for _ in consumers:
+                await q.put(None)
+            await asyncio.gather(*consumers)
+            return consumed
+
+        assert sorted(asyncio.run(main())) == list(range(400))
+
+    def test_cancelled_getter_passes_on_wakeup(self):
+        async def main():
+            q = AsyncDoublyLinkedQueue()
+            first = asyncio.create_task(q.getleft())
+            second = asyncio.create_task(q.getleft())
+            await asyncio.sleep(0)
+            q.put_nowait('a')  # Wakes up first
+            first.cancel()
+            return await asyncio.wait_for(second, 1)
+
+        assert asyncio.run(main()) == 'a'
+
+    def test_getleft_many_one_wakeup(self):
+        async def main():
+            q = AsyncDoublyLinkedQueue()
+            first = asyncio.create_task(q.getleft_many())
+            second = asyncio.create_task(q.getleft_many())
+            await asyncio.sleep(0)
+            q.put_nowait('a')
+            q.put_many_nowait('bc')  # first will take these too, so second isn't woken up
+            assert len(q._getters) == 1
+            values = await first
+            assert not second.done()
+            second.cancel()
+            return values
+
+        assert asyncio.run(main()) == ['a', 'b', 'c']
+
+    def test_wakes_up_after_getleft_many(self):
+        async def main():
+            q = AsyncDoublyLinkedQueue()
+            first = asyncio.create_task(q.getleft_many())
+            await asyncio.sleep(0)
+            q.put_many_nowait('ab')
+            assert await first == ['a', 'b']
+            getter = asyncio.create_task(q.getleft())
+            await asyncio.sleep(0)
+            q.put_nowait('c')
+            return await asyncio.wait_for(getter, 1)
+
+        assert asyncio.run(main()) == 'c'
+
+
+@mark.parametrize('cls', concrete_subclasses(BaseCache))
+class TestAbstractCache:
+    def test_mapping(self, cls):
+        cache = cls(3)
+        cache['a'] = 1
+        cache['b'] = 2
+        assert cache['a'] == 1
+        assert 'b' in cache
+        assert 'c' not in cache
+        assert cache.get('c') is None
+        del cache['b']
+        assert dict(cache) == {'a': 1}
+        with raises(KeyError):
+            cache['b']
+        assert cache.info()[:3] == (2, 2, 0)
+        assert list(cache.items()) == [('a', 1)]
+        assert list(cache.values()) == [1]
+        assert cache.info()[:3] == (2, 2, 0)
+        cache.clear()
+        assert not cache
+        assert cache.info().hits == 2
+
+    def test_maxsize(self, cls):
+        cache = cls(3)
+        for i in range(10):
+            cache[i] = i
+            assert len(cache) == min(i + 1, 3)
+        assert cache.evictions == 7
+        cache = cls(0)
+        cache['a'] = 1
+        assert not cache
+
+    def test_maxweight(self, cls):
+        cache = cls(None, maxweight=10, weigh=len)
+        cache['a'] = 'aaaa'
+        cache['b'] = 'bbbb'
+        cache['c'] = 'cc'
+        assert set(cache) == {'a', 'b', 'c'}
+        cache['d'] = 'ddd'
+        assert cache.weight <= 10
+        assert 'd' in cache
+        cache['d'] = 'dddddddddd'
+        assert dict(cache) == {'d': 'dddddddddd'}
+        with raises(TooHeavyError):
+            cache['e'] = 'e' * 11
+        assert cache.weight == 10
+
+    def test_memoize(self, cls):
+        calls = []
+
+        @memoize(cls(2))
+        def square(x, power=2):
+            calls.append(x)
+            return x ** power
+
+        assert [square(x) for x in [1, 2, 1, 3, 1]] == [1, 4, 1, 9, 1]
+        assert square(2, power=3) == 8
+        assert square.cache_info().hits == 2
+        assert len(calls) == 4
+        square.cache_clear()
+        assert square.cache_info()[:3] == (0, 0, 0)
+        square(1)
+        assert len(calls) == 5
+        assert square.cache_info()[:3] == (0, 1, 0)
+
+    def test_memoize_weights(self, cls):
+        def weigh(value):
+            if value < 0:
+                raise ValueError('negative')
+            return value
+
+        @memoize(cls(None, maxweight=10, weigh=weigh))
+        def identity(x):
+            return x
+
+        assert identity(20) == 20  # Too heavy, so it isn't cached
+        assert 20 not in identity.cache.values()
+        with raises(ValueError, match='negative'):
+            identity(-1)
+
+
+def test_lru_cache_order():
+    cache = LRUCache(5)
+    expected = OrderedDict()
+    random = Random(0)
+    for _ in range(2000):
+        key = random.randrange(10)
+        if random.random() < 0.5:
+            cache[key] = expected[key] = random.random()
+            expected.move_to_end(key)
+            if len(expected) > 5:
+                expected.popitem(last=False)
+        elif key in expected:
+            assert cache[key] == expected[key]
+            expected.move_to_end(key)
+        assert list(cache.items()) == list(expected.items())
+
+
+def test_lfu_cache_order():
+    cache = LFUCache(5)
+    frequencies = {}
+    last_used = {}
+    random = Random(0)
+    for time in range(2000):
+        key = random.randrange(10)
+        if random.random() < 0.5:
+            if key not in frequencies and len(frequencies) == 5:
+                victim = min(frequencies, key=lambda x: (frequencies[x], last_used[x]))
+                del frequencies[victim]
+            cache[key] = time
+        elif key in frequencies:
+            cache[key]
+        else:
+            continue
+        frequencies[key] = frequencies.get(key, 0) + 1
+        last_used[key] = time
+        assert list(cache) == sorted(frequencies, key=lambda x: (frequencies[x], last_used[x]))
+        assert all(cache.frequency(key) == frequency for key, frequency in frequencies.items())
+
+
+class TestRoundRobinScheduler:
+    def test_weighted(self):
+        scheduler = RoundRobinScheduler()
+        scheduler.add('a', 2)
+        scheduler.add('b')
+        scheduler.add('c', 3)
+        assert [scheduler.select() for _ in range(12)] == list('aabccc') * 2
+        assert list(scheduler) == list('cab')  # c's turn ends when select finds its deficit used up
+        assert repr(scheduler) == "RoundRobinScheduler({'c': 3, 'a': 2, 'b': 1}, quantum=1)"
+
+    def test_deficit(self):
+        scheduler = RoundRobinScheduler(quantum=500)
+        sizes = {'small': 100, 'large': 1500}
+        scheduler.add('small')
+        scheduler.add('large')
+        served = dict.fromkeys(sizes, 0)
+        for _ in range(1000):
+            key = scheduler.select(sizes.__getitem__)
+            served[key] += sizes[key]
+        assert abs(served['small'] - served['large']) <= 2000
+
+    def test_add_keeps_cursor(self):
+        scheduler = RoundRobinScheduler()
+        for key in 'abc':
+            scheduler.add(key)
+        assert scheduler.select() == 'a'
+        assert scheduler.select() == 'b'
+        scheduler.add('x')
+        assert scheduler.current == 'b'
+        assert [scheduler.select() for _ in range(4)] == list('caxb')
+
+    def test_remove(self):
+        scheduler = RoundRobinScheduler()
+        for key in 'abc':
+            scheduler.add(key, 2)
+        assert scheduler.select() == 'a'
+        scheduler.remove('a')
+        assert 'a' not in scheduler and len(scheduler) == 2
+        assert [scheduler.select() for _ in range(4)] == list('bbcc')
+        scheduler.remove('c')
+        scheduler.discard('c')
+        assert [scheduler.select() for _ in range(3)] == list('bbb')
+        scheduler.remove('b')
+        with raises(IndexError):
+            scheduler.select()
+        with raises(KeyError):
+            scheduler.remove('b')
+        scheduler.add('d')
+        assert scheduler.select() == 'd'
+
+    def test_end_turn_and_weights(self):
+        scheduler = RoundRobinScheduler()
+        scheduler.add('a', 3)
+        scheduler.add('b')
+        assert scheduler.select() == 'a'
+        scheduler.end_turn()
+        assert scheduler.deficit('a') == 2
+        scheduler.set_weight('b', 2)
+        assert [scheduler.select() for _ in range(7)] == list('bbaaaaa')
+        assert scheduler.weight('b') == 2
+
+    def test_errors(self):
+        with raises(ValueError):
+            RoundRobinScheduler(0)
+        scheduler = RoundRobinScheduler()
+        scheduler.add('a')
+        with raises(ValueError):
+            scheduler.add('a')
+        with raises(ValueError):
+            scheduler.add('b', 0)
+        with raises(ValueError):
+            scheduler.set_weight('a', -1)
+
+
+class TestNumpy:
+    @fixture
+    def numpy(self):
+        from pytest import importorskip
+        return importorskip('numpy')
+
+    @mark.parametrize('cls', concrete_subclasses(BaseLinkedList, PersistentDoublyLinkedList))
+    def test_round_trip(self, numpy, cls):
+        li = cls.from_numpy(numpy.arange(100))
+        assert list(li) == list(range(100))
+        assert all(type(value) is int for value in li)
+        assert numpy.array_equal(li.to_numpy(), numpy.arange(100))
+        array = li.to_numpy('float64')
+        assert array.dtype == numpy.float64 and array.tolist() == list(range(100))
+        assert cls.from_numpy([]).to_numpy('int64').shape == (0,)
+
+    def test_from_numpy_kwargs(self, numpy):
+        li = DoublyLinkedList.from_numpy(numpy.array([3, 1, 2]), indexed=True)
+        assert li.index(2) == 2 and li.count(1) == 1
+
+    @mark.parametrize('cls', concrete_subclasses(BaseLinkedList, PersistentDoublyLinkedList,
+                                                 TypedArrayDoublyLinkedList))
+    def test_apply_vectorized(self, numpy, cls):
+        li = cls(range(10))
+        li.reverse()
+        li.apply_vectorized(numpy.square)
+        assert list(li) == [value ** 2 for value in reversed(range(10))]
+        li.apply_vectorized(numpy.sqrt, 'float64')
+        assert list(li) == list(map(float, reversed(range(10))))
+        empty = cls()
+        empty.apply_vectorized(numpy.sqrt)
+        assert not empty
+
+    def test_apply_vectorized_indexed(self, numpy):
+        li = CircularDoublyLinkedList(range(10), indexed=True)
+        handle = li.append_handle(10)
+        li.reverse()
+        li.apply_vectorized(lambda array: array + 100)
+        assert 5 not in li and 105 in li
+        assert li.index(110) == 0
+        li.remove_node(handle)
+        assert list(li) == list(range(109, 99, -1))
+
+    @mark.parametrize('cls', concrete_subclasses(BaseLinkedList, PersistentDoublyLinkedList))
+    def test_invalid(self, numpy, cls):
+        with raises(ValueError):
+            cls.from_numpy(numpy.zeros((2, 2)))
+        li = cls(range(4))
+        for func in [lambda array: array[:-1], lambda array: array.reshape(2, 2), numpy.sum]:
+            with raises(ValueError):
+                li.apply_vectorized(func)
+        assert list(li) == list(range(4))
+
+    def test_typed(self, numpy):
+        li = TypedArrayDoublyLinkedList.from_numpy(numpy.arange(5), typecode='d')
+        assert li.to_numpy().dtype == numpy.float64
+        li.apply_vectorized(numpy.sqrt)
+        li.appendleft(-1)
+        assert not li.is_compact
+        assert li.to_numpy('float64').tolist() == [-1, 0, 1, 2 ** .5, 3 ** .5, 2]
+        ints = TypedArrayDoublyLinkedList(range(3))
+        with raises(TypeError):
+            ints.apply_vectorized(lambda array: array / 2)
+        assert list(ints) == [0, 1, 2]
+
+    def test_persistent(self, numpy, tmp_path):
+        li = PersistentDoublyLinkedList.from_numpy(numpy.array([b'a', b'bc']), path=tmp_path / 'list')
+        assert list(li) == [b'a', b'bc']
+        assert li.to_numpy().tolist() == [b'a', b'bc']
+        with raises(TypeError):
+            li.apply_vectorized(lambda array: array)
+
+    def test_without_numpy(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+        li = DoublyLinkedList(range(3))
+        for call in [li.to_numpy, lambda: li.apply_vectorized(abs), lambda: DoublyLinkedList.from_numpy([1])]:
+            with raises(ImportError, match='pip install numpy'):
+                call()
+
+
+class TestValueStream:
+    @mark.parametrize('chunk_size', [1, 2, 1024])
+    def test_round_trip(self, letters_and_empty, chunk_size):
+        file = BytesIO()
+        count = write_values(LinkedNode.from_iterable(letters_and_empty) or [], file, chunk_size)
+        assert count == len(letters_and_empty)
+        file.seek(0)
+        assert list(DoublyLinkedList(read_values(file))) == list(letters_and_empty)
+
+    def test_round_trip_long(self):
+        file = BytesIO()
+        write_values(CircularDoublyLinkedList(range(1_000_000)), file)
+        file.seek(0)
+        assert list(LinkedList(read_values(file))) == list(range(1_000_000))
+
+    def test_reads_lazily(self):
+        file = BytesIO()
+        write_values(range(10), file, chunk_size=3)
+        file.seek(0)
+        values = read_values(file)
+        assert list(islice(values, 2)) == [0, 1]
+        assert file.tell() < len(file.getvalue())
+
+    def test_invalid(self):
+        file = BytesIO()
+        write_values('abc', file)
+        for data in [b'', b'nope' + file.getvalue()[4:], file.getvalue()[:-1], file.getvalue()[:6]]:
+            with raises(ValueError):
+                list(read_values(BytesIO(data)))
+        with raises(ValueError):
+            write_values('abc', BytesIO(), chunk_size=0)
+
+
+class TestInstrumentation:
+    @fixture(autouse=True)
+    def off(self):
+        instrumentation.disable()
+        instrumentation.reset()
+        yield
+        instrumentation.disable()
+        instrumentation.reset()
+
+    @staticmethod
+    def class_attributes():
+        return {cls: dict(vars(cls)) for cls in [BaseLinkedNode, BaseLinkedList, *concrete_subclasses(BaseLinkedNode),
+                                                 *concrete_subclasses(BaseLinkedList)]}
+
+    def test_off_changes_nothing(self):
+        before = self.class_attributes()
+        assert not instrumentation.is_enabled()
+        instrumentation.enable(timing=True)
+        assert instrumentation.is_enabled()
+        assert self.class_attributes() != before
+        instrumentation.enable()
+        instrumentation.disable()
+        assert not instrumentation.is_enabled()
+        assert self.class_attributes() == before
+        DoublyLinkedList(range(3))
+        assert instrumentation.snapshot() == ({}, {}, {}, {})
+
+    def test_counts(self):
+        li = DoublyLinkedList(range(10))
+        with instrumentation.instrumented():
+            assert 5 in li
+            li.append(10)
+            assert DoublyLinkedNode.from_iterable('ab').tail.value == 'b'
+        snapshot = instrumentation.snapshot()
+        assert snapshot.calls == {
+            'DoublyLinkedList.__contains__': 1,
+            'DoublyLinkedList.append': 1,
+            'DoublyLinkedNode.__init__': 3,  # Not once more for each base class __init__ it calls
+            'DoublyLinkedNode.from_iterable': 1,
+            'DoublyLinkedNode.tail': 1,
+        }
+        assert snapshot.hops['DoublyLinkedNode.next'] >= 6
+        assert snapshot.allocations == {'DoublyLinkedNode': 3}
+        assert snapshot.timings == {}
+        instrumentation.reset()
+        with instrumentation.instrumented():
+            copied = deepcopy(CircularDoublyLinkedNode.from_iterable('abc'))
+        assert instrumentation.snapshot().allocations == {'CircularDoublyLinkedNode': 6}
+        assert list(copied) == list('abc')
+        instrumentation.reset()
+        assert instrumentation.snapshot() == ({}, {}, {}, {})
+
+    def test_timing(self):
+        with instrumentation.instrumented(timing=True):
+            li = UnrolledLinkedList(range(100), block_size=8)
+            for i in range(5):
+                li.appendleft(i)
+        snapshot = instrumentation.snapshot()
+        assert snapshot.allocations['_Block'] >= 13
+        histogram = snapshot.timings['UnrolledLinkedList.appendleft']
+        assert sum(histogram.values()) == snapshot.calls['UnrolledLinkedList.appendleft'] == 5
+        assert all(bound & (bound - 1) == 0 for bound in histogram)
+
+    def test_instrumented_restores(self):
+        instrumentation.enable()
+        with instrumentation.instrumented(timing=True):
+            LinkedList('ab')
+        assert instrumentation.is_enabled()
+        LinkedList('ab')
+        instrumentation.disable()
+        snapshot = instrumentation.snapshot()
+        assert snapshot.calls['LinkedList.__init__'] == 2
+        assert sum(snapshot.timings['LinkedList.__init__'].values()) == 1
+
+    def test_metrics(self):
+        with instrumentation.instrumented(timing=True):
+            LinkedList('a')
+        metrics = instrumentation.snapshot().metrics('app')
+        assert metrics['app.calls.LinkedList.__init__'] == 1
+        assert metrics['app.allocations.LinkedNode'] == 1
+        timings = [count for name, count in metrics.items() if name.startswith('app.timings.LinkedList.__init__.lt_')]
+        assert sum(timings) == 1
+
+    @mark.parametrize('setting, enabled', [('1', True), ('timing', True), ('0', False), ('', False)])
+    def test_environment(self, setting, enabled):
+        code = ('from graph_examples.linked_lists import LinkedList, instrumentation\n'
+                'LinkedList("a")\n'
+                'print(instrumentation.is_enabled(), bool(instrumentation.snapshot().timings))')
+        environment = {**os.environ, instrumentation.ENVIRONMENT_VARIABLE: setting}
+        result = subprocess.run([sys.executable, '-c', code], env=environment, capture_output=True, text=True,
+                                check=True)
+        assert result.stdout.split() == [str(enabled), str(setting == 'timing')]